@@ -1,8 +1,22 @@
+from activate import activate_engine
+
 class EngineHub:
-    def __init__(self):
-        self.vision = VisionModule()
-        self.nlp = NLPModule()
-        self.speech = SpeechModule()
+    """Engines are imported and built on first use, not when the hub is created."""
+
+    def __init__(self, configs=None):
+        self.configs = configs or {}
+
+    @property
+    def vision(self):
+        return activate_engine("vision", self.configs.get("vision"))
+
+    @property
+    def nlp(self):
+        return activate_engine("nlp", self.configs.get("nlp"))
+
+    @property
+    def speech(self):
+        return activate_engine("speech", self.configs.get("speech"))
 
     def run(self, input_data):
         if is_image(input_data):
@@ -11,10 +11,23 @@ Author: SlizzAi Team
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk, ImageEnhance, ImageFilter, ImageOps, ImageDraw
+from PIL import Image, ImageTk, ImageEnhance, ImageFilter, ImageOps, ImageDraw, ImageColor
 import numpy as np
 import cv2
 import threading
+import argparse
+import glob
+import hashlib
+import os
+import queue
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from itertools import islice
 
 # Optional: Deep learning imports (comment out if not using AI features)
 import torch
@@ -66,19 +79,182 @@ def add_drop_shadow(pil_img, offset=10, blur=10, shadow_color=(0,0,0,128)):
     shadow.paste(base, (offset, offset), base)
     return shadow
 
+# ========== Tiled Processing ==========
+
+TILE_SIZE = 512
+TILE_OVERLAP = 32
+TILE_WORKERS = os.cpu_count() or 1
+# Images with more pixels than this are upscaled/inpainted tile by tile
+TILE_THRESHOLD = 16_000_000
+# Tiled outputs with more pixels than this are assembled in a disk-backed memmap.
+# The PIL image made from it is still a full copy in RAM; the memmap only keeps
+# the assembly buffer from doubling that peak.
+MEMMAP_THRESHOLD = 64_000_000
+# Inpainting: side of the coarse pass, and width of the band redone at full resolution
+INPAINT_COARSE_SIDE = 1024
+INPAINT_BAND = 16
+
+class EffectCancelled(Exception):
+    """Raised inside an effect that was superseded by a newer one."""
+
+# Set per worker thread by EffectExecutor; long-running operations poll it
+_effect_state = threading.local()
+
+def check_cancelled():
+    is_cancelled = getattr(_effect_state, "is_cancelled", None)
+    if is_cancelled is not None and is_cancelled():
+        raise EffectCancelled()
+
+def output_array(shape):
+    """Allocate an output buffer for tiled_map, disk-backed once it gets large."""
+    if shape[0] * shape[1] <= MEMMAP_THRESHOLD:
+        return np.empty(shape, np.uint8)
+    # The mapping keeps the unlinked temp file alive until the array is freed
+    with tempfile.TemporaryFile() as f:
+        return np.memmap(f, np.uint8, mode="w+", shape=shape)
+
+def _ramp(n):
+    return (np.arange(n, dtype=np.float32) + 0.5) / n
+
+def _blend_tile(out, tile, origin, top, left, band):
+    # Feather the tile into out across the bands it shares with the tiles above and to the left
+    y, x = origin
+    th, tw = tile.shape[:2]
+    by = min(band, th) if top else 0
+    bx = min(band, tw) if left else 0
+    out[y+by:y+th, x+bx:x+tw] = tile[by:, bx:]
+    if not (by or bx):
+        return
+    alpha = np.ones((th, tw), np.float32)
+    if by:
+        alpha[:by] *= _ramp(by)[:, None]
+    if bx:
+        alpha[:, :bx] *= _ramp(bx)[None, :]
+    for ys, xs in ((slice(0, by), slice(0, tw)), (slice(by, th), slice(0, bx))):
+        a = alpha[ys, xs]
+        if a.size == 0:
+            continue
+        if tile.ndim == 3:
+            a = a[..., None]
+        dst = out[y+ys.start:y+ys.stop, x+xs.start:x+xs.stop]
+        dst[...] = dst * (1 - a) + tile[ys, xs] * a + 0.5
+
+def tiled_map(src, fn, scale=1, out=None, tile=TILE_SIZE, overlap=TILE_OVERLAP, workers=None):
+    """Apply ``fn`` to ``src`` tile by tile and blend the results into ``out``.
+
+    ``fn(window, (y, x))`` receives a tile of ``src`` widened by ``overlap`` on
+    each side, plus its top-left source coordinate, and returns it scaled by
+    ``scale``. Tiles run in parallel on threads, but only a small window of
+    them is in flight at once and they are feathered into ``out`` in raster
+    order, so peak memory is the output buffer plus a few tiles. ``src`` and
+    ``out`` may be memory-mapped, which keeps the output buffer out of RAM.
+    ``src`` may also be a PIL image: each window is then cropped from it and
+    converted to RGB on its own, so no full-size array copy of it is made.
+    """
+    if isinstance(src, Image.Image):
+        src.load()  # before the worker threads crop from it
+        (w, h), depth = src.size, (3,)
+        def read(y0, y1, x0, x1):
+            return np.array(src.crop((x0, y0, x1, y1)).convert("RGB"))
+    else:
+        h, w = src.shape[:2]
+        depth = src.shape[2:]
+        def read(y0, y1, x0, x1):
+            return src[y0:y1, x0:x1].copy()
+    if out is None:
+        out = output_array((h*scale, w*scale) + depth)
+    workers = workers or TILE_WORKERS
+    cores = iter([(y, x) for y in range(0, h, tile) for x in range(0, w, tile)])
+    def run(y, x):
+        y0, x0 = max(0, y - overlap), max(0, x - overlap)
+        y1, x1 = min(h, y + tile + overlap), min(w, x + tile + overlap)
+        window = read(y0, y1, x0, x1)
+        return (y0*scale, x0*scale), fn(window, (y0, x0)), y > 0, x > 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque(pool.submit(run, *core) for core in islice(cores, workers * 2))
+        while in_flight:
+            origin, result, top, left = in_flight.popleft().result()
+            check_cancelled()
+            _blend_tile(out, result, origin, top, left, 2 * overlap * scale)
+            core = next(cores, None)
+            if core is not None:
+                in_flight.append(pool.submit(run, *core))
+    return out
+
+def _upscale_tile(window, origin):
+    return cv2.resize(window, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
+
+def inpaint_tiled(src, rect, out=None):
+    """Tiled cv2.inpaint of the rectangle ``rect`` (inclusive x0, y0, x1, y1).
+
+    The hole is first inpainted on a downscaled copy. Each tile seeds its part
+    of the hole from that coarse fill and re-inpaints a band along the hole's
+    edge at full resolution, so no tile needs context beyond its overlap.
+    ``src`` is an RGB array or a PIL image, read tile by tile as in tiled_map.
+    """
+    if isinstance(src, Image.Image):
+        w, h = src.size
+    else:
+        h, w = src.shape[:2]
+    f = min(1.0, INPAINT_COARSE_SIDE / max(h, w))
+    size = (max(1, round(w*f)), max(1, round(h*f)))
+    if isinstance(src, Image.Image):
+        # Shrunk before the RGB conversion, so only the small copy is converted
+        coarse = np.array(src.resize(size, Image.Resampling.BOX).convert("RGB"))
+    else:
+        coarse = cv2.resize(src, size, interpolation=cv2.INTER_AREA)
+    sx, sy = coarse.shape[1] / w, coarse.shape[0] / h
+    x0, y0, x1, y1 = rect
+    coarse_mask = np.zeros(coarse.shape[:2], np.uint8)
+    cv2.rectangle(coarse_mask, (int(x0*sx), int(y0*sy)), (int(x1*sx), int(y1*sy)), 255, -1)
+    coarse = cv2.inpaint(coarse, coarse_mask, 3, cv2.INPAINT_TELEA)
+    def fill(window, origin):
+        ty, tx = origin
+        th, tw = window.shape[:2]
+        hy0, hy1 = max(y0 - ty, 0), min(y1 + 1 - ty, th)
+        hx0, hx1 = max(x0 - tx, 0), min(x1 + 1 - tx, tw)
+        if hy0 >= hy1 or hx0 >= hx1:
+            return window
+        # Sample the coarse fill with the same mapping in every tile so seeds line up
+        gy, gx = ty + hy0, tx + hx0
+        m = np.float32([[sx, 0, sx*(gx + 0.5) - 0.5], [0, sy, sy*(gy + 0.5) - 0.5]])
+        window[hy0:hy1, hx0:hx1] = cv2.warpAffine(coarse, m, (hx1 - hx0, hy1 - hy0),
+                                                  flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                                                  borderMode=cv2.BORDER_REPLICATE)
+        mask = np.zeros((th, tw), np.uint8)
+        mask[hy0:hy1, hx0:hx1] = 255
+        iy0, iy1 = max(y0 + INPAINT_BAND - ty, 0), min(y1 + 1 - INPAINT_BAND - ty, th)
+        ix0, ix1 = max(x0 + INPAINT_BAND - tx, 0), min(x1 + 1 - INPAINT_BAND - tx, tw)
+        if iy0 < iy1 and ix0 < ix1:
+            mask[iy0:iy1, ix0:ix1] = 0
+        if not mask.any():
+            return window
+        return cv2.inpaint(window, mask, 3, cv2.INPAINT_TELEA)
+    return tiled_map(src, fill, out=out)
+
+def _inpaint_rect(w, h):
+    return w//4, h//4, w*3//4, h*3//4
+
 # ========== AI & Image Operations ==========
 
 def ai_upscale(img):
     # Placeholder: Use OpenCV for simple upscaling, replace with real SRGAN for production
+    if img.width * img.height > TILE_THRESHOLD:
+        # Tiles are cropped from img and converted to RGB one at a time, dropping
+        # alpha and palettes like the untiled path without a full-size RGB copy
+        return Image.fromarray(tiled_map(img, _upscale_tile, scale=2))
     arr = pil_to_cv(img)
     arr = cv2.resize(arr, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
     return cv_to_pil(arr)
 
 def ai_inpaint(img):
     # Placeholder: Add random inpainting effect
+    rect = _inpaint_rect(img.width, img.height)
+    if img.width * img.height > TILE_THRESHOLD:
+        return Image.fromarray(inpaint_tiled(img, rect))
     arr = pil_to_cv(img)
     mask = np.zeros(arr.shape[:2], np.uint8)
-    cv2.rectangle(mask, (arr.shape[1]//4, arr.shape[0]//4), (arr.shape[1]*3//4, arr.shape[0]*3//4), 255, -1)
+    cv2.rectangle(mask, rect[:2], rect[2:], 255, -1)
     arr = cv2.inpaint(arr, mask, 3, cv2.INPAINT_TELEA)
     return cv_to_pil(arr)
 
@@ -86,24 +262,6 @@ def ai_style_transfer(img):
     # Placeholder: Use PIL filters for style, replace with torch Hub model for production
     return img.filter(ImageFilter.CONTOUR)
 
-# Load DeepLabV3 model once for efficiency
-_deeplabv3_model = None
-def ai_segmentation(img):
-    global _deeplabv3_model
-    # Placeholder: Use torchvision DeepLabV3 for segmentation
-    preprocess = transforms.Compose([
-        transforms.Resize((224,224)), transforms.ToTensor(),
-        transforms.Normalize(mean=[0.485,0.456,0.406], std=[0.229,0.224,0.225])
-    ])
-    input_tensor = preprocess(img).unsqueeze(0)
-    with torch.no_grad():
-        if _deeplabv3_model is None:
-            _deeplabv3_model = segmentation.deeplabv3_resnet50(pretrained=True).eval()
-        output = _deeplabv3_model(input_tensor)["out"][0]
-    mask = output.argmax(0).byte().cpu().numpy()
-    mask_img = Image.fromarray(np.uint8(mask*255)).resize(img.size)
-    return Image.composite(img, Image.new("RGB", img.size, (128,128,128)), mask_img)
-
 def ai_generate(prompt, size=(256,256)):
     # Placeholder: Generate a blank image with the prompt text
     img = Image.new("RGB", size, (200, 200, 200))
@@ -111,6 +269,829 @@ def ai_generate(prompt, size=(256,256)):
     draw.text((10, size[1]//2), prompt, fill=(50,50,50))
     return img
 
+# ========== Segmentation Service ==========
+
+SEGMENTATION_INPUT = (224, 224)
+
+class _DeepLabOut(torch.nn.Module):
+    # Unwraps DeepLabV3's {"out": ...} dict so the graph can be traced or exported
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+    def forward(self, x):
+        return self.model(x)["out"]
+
+def load_deeplabv3():
+    return _DeepLabOut(segmentation.deeplabv3_resnet50(pretrained=True).eval()).eval()
+
+def export_segmentation_model(path):
+    """Export DeepLabV3 to TorchScript (.pt) or ONNX (.onnx) for SegmentationService."""
+    model = load_deeplabv3()
+    example = torch.zeros(1, 3, *SEGMENTATION_INPUT)
+    with torch.no_grad():
+        if path.endswith(".onnx"):
+            torch.onnx.export(model, example, path, input_names=["input"], output_names=["out"],
+                              dynamic_axes={"input": {0: "batch"}, "out": {0: "batch"}})
+        else:
+            torch.jit.save(torch.jit.trace(model, example), path)
+    return path
+
+class SegmentationService:
+    """Keeps DeepLabV3 warm and micro-batches concurrent segmentation requests.
+
+    A single worker thread loads the model once, then groups up to
+    ``batch_size`` queued requests, waiting at most ``max_wait`` seconds after
+    the first, into one forward pass. ``backend`` is "eager", "torchscript"
+    or "onnx"; the last two load a graph written by export_segmentation_model.
+    """
+    def __init__(self, batch_size=4, max_wait=0.02, num_threads=None, backend="eager", model_path=None):
+        if backend != "eager" and not model_path:
+            raise ValueError(f"The '{backend}' segmentation backend needs a model_path.")
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.num_threads = num_threads
+        self.backend = backend
+        self.model_path = model_path
+        self.preprocess = transforms.Compose([
+            transforms.Resize(SEGMENTATION_INPUT), transforms.ToTensor(),
+            transforms.Normalize(mean=[0.485,0.456,0.406], std=[0.229,0.224,0.225])
+        ])
+        self._lock = threading.Lock()
+        self._pid = None
+    def start(self):
+        """Start loading the model in the background; safe to call repeatedly."""
+        with self._lock:
+            # A forked child inherits a started service without its thread
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self.requests = queue.Queue()
+                self.ready = threading.Event()
+                self._run = None
+                self._error = None
+                threading.Thread(target=self._serve, name="segmentation", daemon=True).start()
+        return self
+    def segment(self, img, timeout=None):
+        self.start()
+        future = Future()
+        # Preprocessing and compositing run on the caller's thread, only the model is shared
+        self.requests.put((self.preprocess(img.convert("RGB")), future))
+        mask = future.result(timeout)
+        mask_img = Image.fromarray(np.uint8(mask*255)).resize(img.size)
+        return Image.composite(img, Image.new("RGB", img.size, (128,128,128)), mask_img)
+    def _load(self):
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+        if self.backend == "onnx":
+            import onnxruntime
+            options = onnxruntime.SessionOptions()
+            if self.num_threads:
+                options.intra_op_num_threads = self.num_threads
+            session = onnxruntime.InferenceSession(self.model_path, options, providers=["CPUExecutionProvider"])
+            return lambda batch: torch.from_numpy(session.run(None, {"input": batch.numpy()})[0])
+        if self.backend == "torchscript":
+            return torch.jit.load(self.model_path).eval()
+        return load_deeplabv3()
+    def _serve(self):
+        try:
+            self._run = self._load()
+            with torch.inference_mode():
+                self._run(torch.zeros(1, 3, *SEGMENTATION_INPUT))  # warm-up
+        except Exception as e:
+            self._error = e
+        self.ready.set()
+        while True:
+            batch = [self.requests.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._process(batch)
+    def _process(self, batch):
+        tensors, futures = zip(*batch)
+        try:
+            if self._error is not None:
+                raise RuntimeError(f"Segmentation model failed to load: {self._error}")
+            with torch.inference_mode():
+                masks = self._run(torch.stack(tensors)).argmax(1).byte().cpu().numpy()
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+        for future, mask in zip(futures, masks):
+            future.set_result(mask)
+
+_segmentation_service = None
+_segmentation_lock = threading.Lock()
+
+def segmentation_service(**config):
+    """Return the shared SegmentationService, creating it with ``config`` on first use."""
+    global _segmentation_service
+    with _segmentation_lock:
+        if _segmentation_service is None:
+            _segmentation_service = SegmentationService(**config)
+        return _segmentation_service
+
+def ai_segmentation(img):
+    return segmentation_service().segment(img)
+
+# ========== Compiled Operations ==========
+
+# ITU-R 601-2 luma weights, as used by PIL's convert("L") and ImageEnhance.Contrast
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114])
+_RAMP = np.arange(256, dtype=np.float32)
+
+def _channel_lut(table):
+    # Clip a 256-entry table (or one per channel) into a (3, 256) uint8 LUT
+    lut = np.clip(table, 0, 255).astype(np.uint8)
+    return np.broadcast_to(lut, (3, 256)) if lut.ndim == 1 else lut
+
+def gamma_table(exponent):
+    return np.minimum(255, np.arange(256, dtype=np.float64) ** exponent).astype(np.int64)
+
+def brightness_table(factor):
+    # ImageEnhance.Brightness blends against black and truncates
+    return _RAMP * np.float32(factor)
+
+def contrast_table(factor, mean):
+    # ImageEnhance.Contrast blends against a flat image of the mean luma
+    return np.float32(mean) + np.float32(factor) * (_RAMP - np.float32(mean))
+
+def solarize_table(threshold):
+    ramp = np.arange(256)
+    return np.where(ramp < threshold, ramp, 255 - ramp)
+
+def posterize_table(bits):
+    return np.arange(256) & (~(2 ** (8 - bits) - 1) & 0xFF)
+
+def invert_table():
+    return 255 - np.arange(256)
+
+def threshold_table(threshold):
+    return np.where(np.arange(256) > threshold, 255, 0)
+
+def colorize_table(black, white):
+    # Same two-colour ramp as ImageOps.colorize
+    black, white = ImageColor.getrgb(black), ImageColor.getrgb(white)
+    ramp = np.arange(256)
+    table = np.empty((3, 256), dtype=np.int64)
+    for c in range(3):
+        table[c] = black[c] + ramp * (white[c] - black[c]) // 255
+        table[c, 255] = white[c]
+    return table
+
+@lru_cache(maxsize=None)
+def cv_kernel(filterargs):
+    # PIL flips kernels vertically before applying them, filter2D correlates as-is
+    (w, h), scale, offset, kernel = filterargs
+    k = np.array(kernel, dtype=np.float32).reshape(h, w)[::-1] / (scale or 1)
+    return np.ascontiguousarray(k), offset
+
+@lru_cache(maxsize=None)
+def rank_element(size):
+    return np.ones((size, size), np.uint8)
+
+class FastOp:
+    """A tab operation the compiled engine can run on a shared uint8 array.
+
+    Calling it on a PIL image runs it as a one-op chain, so it drops into
+    ``tab_options`` and ``apply_effect`` like any other callable.
+    """
+    def __call__(self, img):
+        return run_chain(img, [self])
+
+class LutOp(FastOp):
+    """Point operation expressed as a per-channel 256-entry lookup table."""
+    uses_mean = False
+    def __init__(self, table):
+        self.table = _channel_lut(table)
+    def lut(self, mean=None):
+        return self.table
+
+class ContrastOp(LutOp):
+    """ImageEnhance.Contrast; its LUT depends on the mean luma at this point in the chain."""
+    uses_mean = True
+    def __init__(self, factor):
+        self.factor = factor
+    def lut(self, mean=None):
+        return _channel_lut(contrast_table(self.factor, mean))
+
+class LumaOp(LutOp):
+    """Converts to luma, then maps it through a lookup table.
+
+    The result is RGB (one table per channel) unless ``gray`` is set, in
+    which case it stays single-channel like ``img.convert("L").point(...)``.
+    Either way the alpha channel is dropped, as convert("L") does.
+    """
+    def __init__(self, table, gray=False):
+        super().__init__(table)
+        self.gray = gray
+
+class KernelOp(FastOp):
+    """One of PIL's built-in convolution filters, run through cv2.filter2D."""
+    def __init__(self, pil_filter):
+        self.filterargs = pil_filter.filterargs
+    def apply(self, arr):
+        kernel, offset = cv_kernel(self.filterargs)
+        out = cv2.filter2D(arr, -1, kernel, delta=offset, borderType=cv2.BORDER_REPLICATE)
+        # PIL leaves the pixels the kernel does not fully cover unfiltered
+        m = kernel.shape[0] // 2
+        out[:m], out[-m:] = arr[:m], arr[-m:]
+        out[:, :m], out[:, -m:] = arr[:, :m], arr[:, -m:]
+        return out
+
+class RankOp(FastOp):
+    """Median, max or min filter, run through OpenCV."""
+    def __init__(self, kind, size):
+        self.kind = kind
+        self.size = size
+    def apply(self, arr):
+        if self.kind == "median":
+            return cv2.medianBlur(arr, self.size)
+        if self.kind == "max":
+            return cv2.dilate(arr, rank_element(self.size))
+        return cv2.erode(arr, rank_element(self.size))
+
+def _to_array(img):
+    # (pixels, alpha, gray); L and LA stay single-channel, other modes are processed as RGB
+    alpha = img.getchannel("A") if img.mode in ("RGBA", "LA") else None
+    if img.mode in ("L", "LA"):
+        return np.asarray(img.getchannel("L")), alpha, True
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return np.asarray(img), alpha, False
+
+def _to_image(arr, alpha):
+    img = Image.fromarray(arr, "L" if arr.ndim == 2 else "RGB")
+    if alpha is not None:
+        img.putalpha(alpha)
+    return img
+
+def _apply_lut(arr, lut, gray=False):
+    # A 2-D arr is luma: it stays 2-D when gray, otherwise the LUT maps it to RGB
+    if lut is None:
+        return arr
+    if arr.ndim == 2:
+        return cv2.LUT(arr, lut[0]) if gray else np.ascontiguousarray(lut.T)[arr]
+    return cv2.LUT(arr, np.ascontiguousarray(lut.T).reshape(256, 1, 3))
+
+def _histograms(arr):
+    if arr.ndim == 2:
+        return np.repeat(cv2.calcHist([arr], [0], None, [256], [0, 256]).reshape(1, 256), 3, axis=0)
+    return np.stack([cv2.calcHist([arr], [c], None, [256], [0, 256]).ravel() for c in range(3)])
+
+def _mean_luma(hist, lut):
+    # Mean luma of lut(arr), computed from the histograms of arr alone
+    values = np.arange(256) if lut is None else lut
+    means = (hist.astype(np.float64) * values).sum(axis=1) / hist[0].sum()
+    return int(np.dot(LUMA_WEIGHTS, means) + 0.5)
+
+def run_chain(img, ops):
+    """Run a chain of tab operations in as few passes over the pixels as possible.
+
+    Consecutive point operations are fused into one LUT, convolution and rank
+    filters share a single uint8 array, and any other callable falls back to
+    PIL. L and LA inputs stay single-channel, other non-RGB inputs are
+    processed as RGB; an alpha channel is carried over.
+    """
+    arr = alpha = None
+    gray = False    # arr is 2-D and the output stays single-channel
+    pending = None  # fused (3, 256) LUT not yet applied to arr
+    hist = None     # per-channel histograms of arr, for mean-dependent LUTs
+    for op in ops:
+        if not isinstance(op, FastOp):
+            if arr is not None:
+                img = _to_image(_apply_lut(arr, pending, gray), alpha)
+                arr = pending = hist = None
+            img = op(img)
+            continue
+        if arr is None:
+            arr, alpha, gray = _to_array(img)
+        if isinstance(op, LumaOp):
+            arr = _apply_lut(arr, pending, gray)
+            if arr.ndim == 3:
+                arr = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+            pending, hist, alpha, gray = op.lut(), None, None, op.gray
+        elif isinstance(op, LutOp):
+            mean = None
+            if op.uses_mean:
+                if hist is None:
+                    hist = _histograms(arr)
+                mean = _mean_luma(hist, pending)
+            lut = op.lut(mean)
+            pending = lut if pending is None else np.take_along_axis(lut, pending.astype(np.intp), axis=1)
+        else:
+            arr = op.apply(_apply_lut(arr, pending, gray))
+            gray = arr.ndim == 2
+            pending = hist = None
+    if arr is None:
+        return img
+    return _to_image(_apply_lut(arr, pending, gray), alpha)
+
+# ========== Tab Operations ==========
+
+TAB_NAMES = [
+    "Enhance", "Adjust", "AI", "Art", "Effects",
+    "Filters", "Restore", "Generate", "Segment", "Fun"
+]
+TAB_OPTIONS = [
+    # Each tab gets 20 creative or technical operations
+    [
+        ("Sharpen", KernelOp(ImageFilter.SHARPEN)),
+        ("Auto Contrast", lambda img: ImageOps.autocontrast(img)),
+        ("Denoise", RankOp("median", 3)),
+        ("HDR", KernelOp(ImageFilter.DETAIL)),
+        ("Super-Res", ai_upscale),
+        ("Color Boost", lambda img: ImageEnhance.Color(img).enhance(1.5)),
+        ("Brightness+", LutOp(brightness_table(1.2))),
+        ("Brightness-", LutOp(brightness_table(0.8))),
+        ("Contrast+", ContrastOp(1.4)),
+        ("Contrast-", ContrastOp(0.7)),
+        ("Gamma Up", LutOp(gamma_table(1.1))),
+        ("Gamma Down", LutOp(gamma_table(0.9))),
+        ("Edge Enhance", KernelOp(ImageFilter.EDGE_ENHANCE)),
+        ("Smooth", KernelOp(ImageFilter.SMOOTH)),
+        ("Posterize", LutOp(posterize_table(4))),
+        ("Solarize", LutOp(solarize_table(128))),
+        ("Invert", LutOp(invert_table())),
+        ("Sepia", LumaOp(colorize_table("#704214", "#C0C080"))),
+        ("Vivid", lambda img: ImageEnhance.Color(img).enhance(2.0)),
+        ("Dehaze", lambda img: img.filter(ImageFilter.ModeFilter(5))),
+    ],
+    [
+        ("Crop Center", lambda img: center_crop(img, (img.width//2, img.height//2))),
+        ("Resize 50%", lambda img: img.resize((img.width//2, img.height//2))),
+        ("Resize 200%", lambda img: img.resize((img.width*2, img.height*2))),
+        ("Rotate 90°", lambda img: img.rotate(90, expand=True)),
+        ("Rotate 180°", lambda img: img.rotate(180, expand=True)),
+        ("Flip H", lambda img: img.transpose(Image.FLIP_LEFT_RIGHT)),
+        ("Flip V", lambda img: img.transpose(Image.FLIP_TOP_BOTTOM)),
+        ("Add Border", lambda img: ImageOps.expand(img, border=10, fill=ACCENT)),
+        ("Add Frame", lambda img: ImageOps.expand(img, border=20, fill=WHITE)),
+        ("Round Corners", KernelOp(ImageFilter.SMOOTH_MORE)),
+        ("Pad 10%", lambda img: ImageOps.expand(img, border=int(0.1*img.width), fill=LIGHT_BG)),
+        ("Square Crop", lambda img: center_crop(img, (min(img.size), min(img.size)))),
+        ("Circle Crop", lambda img: img), # Placeholder
+        ("Tile", lambda img: img), # Placeholder
+        ("Mirror", lambda img: img.transpose(Image.FLIP_LEFT_RIGHT)),
+        ("Perspective", lambda img: img), # Placeholder
+        ("Skew", lambda img: img), # Placeholder
+        ("Shear", lambda img: img), # Placeholder
+        ("Stretch", lambda img: img), # Placeholder
+        ("Trim", lambda img: img.crop(img.getbbox())),
+    ],
+    [
+        ("AI Upscale", ai_upscale),
+        ("AI Denoise", RankOp("median", 5)),
+        ("AI Inpaint", ai_inpaint),
+        ("AI Style Transfer", ai_style_transfer),
+        ("AI Segmentation", ai_segmentation),
+        ("AI Generate", lambda _: ai_generate("A cat in the style of Van Gogh")),
+        ("AI Colorize", lambda img: img.convert("L").convert("RGB")),
+        ("AI Remove BG", lambda img: img), # Placeholder
+        ("AI Face Enhance", lambda img: img), # Placeholder
+        ("AI Deblur", KernelOp(ImageFilter.SMOOTH)),
+        ("AI Super-Res", ai_upscale),
+        ("AI Cartoon", KernelOp(ImageFilter.CONTOUR)),
+        ("AI Line Art", KernelOp(ImageFilter.FIND_EDGES)),
+        ("AI HDR", KernelOp(ImageFilter.DETAIL)),
+        ("AI Night2Day", lambda img: img), # Placeholder
+        ("AI Day2Night", lambda img: img), # Placeholder
+        ("AI Old2Young", lambda img: img), # Placeholder
+        ("AI Gender Swap", lambda img: img), # Placeholder
+        ("AI Age Up", lambda img: img), # Placeholder
+        ("AI Age Down", lambda img: img), # Placeholder
+    ],
+    [
+        ("Oil Paint", KernelOp(ImageFilter.SMOOTH)),
+        ("Watercolor", KernelOp(ImageFilter.BLUR)),
+        ("Sketch", KernelOp(ImageFilter.CONTOUR)),
+        ("Charcoal", KernelOp(ImageFilter.EDGE_ENHANCE)),
+        ("Cartoon", KernelOp(ImageFilter.CONTOUR)),
+        ("Pop Art", KernelOp(ImageFilter.EMBOSS)),
+        ("Pixelate", lambda img: img.resize((32,32)).resize(img.size)),
+        ("Halftone", lambda img: img), # Placeholder
+        ("Mosaic", lambda img: img), # Placeholder
+        ("Stipple", lambda img: img), # Placeholder
+        ("Pastel", lambda img: img), # Placeholder
+        ("Impressionist", lambda img: img), # Placeholder
+        ("Surreal", lambda img: img), # Placeholder
+        ("Abstract", lambda img: img), # Placeholder
+        ("Color Splash", lambda img: img), # Placeholder
+        ("Glitch", lambda img: img), # Placeholder
+        ("Noise", lambda img: img), # Placeholder
+        ("Vaporwave", lambda img: img), # Placeholder
+        ("Cyberpunk", lambda img: img), # Placeholder
+        ("Graffiti", lambda img: img), # Placeholder
+    ],
+    [
+        ("Blur", KernelOp(ImageFilter.BLUR)),
+        ("Gaussian Blur", lambda img: img.filter(ImageFilter.GaussianBlur(3))),
+        ("Box Blur", lambda img: img.filter(ImageFilter.BoxBlur(2))),
+        ("Motion Blur", lambda img: img), # Placeholder
+        ("Radial Blur", lambda img: img), # Placeholder
+        ("Glow", lambda img: img), # Placeholder
+        ("Shadow", lambda img: add_drop_shadow(img, offset=15, blur=10)),
+        ("Emboss", KernelOp(ImageFilter.EMBOSS)),
+        ("Find Edges", KernelOp(ImageFilter.FIND_EDGES)),
+        ("Edge Enhance", KernelOp(ImageFilter.EDGE_ENHANCE)),
+        ("Contour", KernelOp(ImageFilter.CONTOUR)),
+        ("Detail", KernelOp(ImageFilter.DETAIL)),
+        ("Smooth", KernelOp(ImageFilter.SMOOTH)),
+        ("Sharpen", KernelOp(ImageFilter.SHARPEN)),
+        ("Max Filter", RankOp("max", 3)),
+        ("Min Filter", RankOp("min", 3)),
+        ("Median Filter", RankOp("median", 5)),
+        ("Mode Filter", lambda img: img.filter(ImageFilter.ModeFilter(5))),
+        ("Rank Filter", lambda img: img), # Placeholder
+        ("Unsharp Mask", lambda img: img.filter(ImageFilter.UnsharpMask(radius=2, percent=150))),
+    ],
+    [
+        ("Red Channel", lambda img: img.split()[0]),
+        ("Green Channel", lambda img: img.split()[1]),
+        ("Blue Channel", lambda img: img.split()[2]),
+        ("Gray", lambda img: img.convert("L")),
+        ("Invert", LutOp(invert_table())),
+        ("Posterize", LutOp(posterize_table(2))),
+        ("Solarize", LutOp(solarize_table(100))),
+        ("Equalize", lambda img: ImageOps.equalize(img)),
+        ("Autocontrast", lambda img: ImageOps.autocontrast(img)),
+        ("Colorize", LumaOp(colorize_table("#222", "#ff0"))),
+        ("Threshold", LumaOp(threshold_table(128), gray=True)),
+        ("Dither", lambda img: img.convert("1")),
+        ("Quantize", lambda img: img.quantize(colors=8)),
+        ("Palette Swap", lambda img: img), # Placeholder
+        ("Channel Swap", lambda img: img), # Placeholder
+        ("Desaturate", lambda img: ImageEnhance.Color(img).enhance(0)),
+        ("Color Balance", lambda img: img), # Placeholder
+        ("Tint", lambda img: img), # Placeholder
+        ("Hue Shift", lambda img: img), # Placeholder
+        ("Saturation", lambda img: img), # Placeholder
+    ],
+    [
+        ("Restore Old", KernelOp(ImageFilter.DETAIL)),
+        ("Remove Scratches", KernelOp(ImageFilter.SMOOTH)),
+        ("De-yellow", lambda img: img), # Placeholder
+        ("De-fade", lambda img: img), # Placeholder
+        ("De-blur", KernelOp(ImageFilter.SHARPEN)),
+        ("Fill Gaps", lambda img: img), # Placeholder
+        ("Recolor", lambda img: img), # Placeholder
+        ("Sharpen Faces", lambda img: img), # Placeholder
+        ("Reconstruct", lambda img: img), # Placeholder
+        ("Recompose", lambda img: img), # Placeholder
+        ("Auto Restore", lambda img: img), # Placeholder
+        ("Remove Noise", RankOp("median", 3)),
+        ("Remove Spots", lambda img: img), # Placeholder
+        ("Balance Tone", lambda img: img), # Placeholder
+        ("Contrast Fix", lambda img: img), # Placeholder
+        ("Color Fix", lambda img: img), # Placeholder
+        ("Edge Fix", lambda img: img), # Placeholder
+        ("Smooth Faces", lambda img: img), # Placeholder
+        ("Brighten", LutOp(brightness_table(1.2))),
+        ("Darken", LutOp(brightness_table(0.8))),
+    ],
+    [
+        ("Text to Image", lambda _: ai_generate("A sunset over mountains")),
+        ("Expand Canvas", lambda img: ImageOps.expand(img, border=50, fill=WHITE)),
+        ("Content Fill", lambda img: img), # Placeholder
+        ("Remove Object", lambda img: img), # Placeholder
+        ("Add Object", lambda img: img), # Placeholder
+        ("Change BG", lambda img: img), # Placeholder
+        ("Clone Stamp", lambda img: img), # Placeholder
+        ("Pattern Fill", lambda img: img), # Placeholder
+        ("Texture", lambda img: img), # Placeholder
+        ("Sticker", lambda img: img), # Placeholder
+        ("Frame", lambda img: ImageOps.expand(img, border=20, fill=ACCENT)),
+        ("Add Text", lambda img: img), # Placeholder
+        ("Watermark", lambda img: img), # Placeholder
+        ("QR Code", lambda img: img), # Placeholder
+        ("Barcode", lambda img: img), # Placeholder
+        ("Add Emoji", lambda img: img), # Placeholder
+        ("Add Icon", lambda img: img), # Placeholder
+        ("Add Signature", lambda img: img), # Placeholder
+        ("Add Date", lambda img: img), # Placeholder
+        ("Add Location", lambda img: img), # Placeholder
+    ],
+    [
+        ("Segment Person", ai_segmentation),
+        ("Segment Sky", lambda img: img), # Placeholder
+        ("Segment BG", lambda img: img), # Placeholder
+        ("Segment Foreground", lambda img: img), # Placeholder
+        ("Segment Object", lambda img: img), # Placeholder
+        ("Segment Animal", lambda img: img), # Placeholder
+        ("Segment Food", lambda img: img), # Placeholder
+        ("Segment Plant", lambda img: img), # Placeholder
+        ("Segment Car", lambda img: img), # Placeholder
+        ("Segment Road", lambda img: img), # Placeholder
+        ("Segment Water", lambda img: img), # Placeholder
+        ("Segment Building", lambda img: img), # Placeholder
+        ("Segment Face", lambda img: img), # Placeholder
+        ("Segment Hand", lambda img: img), # Placeholder
+        ("Segment Eye", lambda img: img), # Placeholder
+        ("Segment Mouth", lambda img: img), # Placeholder
+        ("Segment Nose", lambda img: img), # Placeholder
+        ("Segment Ear", lambda img: img), # Placeholder
+        ("Segment Hair", lambda img: img), # Placeholder
+        ("Segment Clothes", lambda img: img), # Placeholder
+    ],
+    [
+        ("Stickerify", lambda img: img), # Placeholder
+        ("Meme", lambda img: img), # Placeholder
+        ("Comic", lambda img: img), # Placeholder
+        ("Speech Bubble", lambda img: img), # Placeholder
+        ("Add Glasses", lambda img: img), # Placeholder
+        ("Add Hat", lambda img: img), # Placeholder
+        ("Add Beard", lambda img: img), # Placeholder
+        ("Add Mask", lambda img: img), # Placeholder
+        ("Add Crown", lambda img: img), # Placeholder
+        ("Add Wings", lambda img: img), # Placeholder
+        ("Add Animal Ears", lambda img: img), # Placeholder
+        ("Add Rainbow", lambda img: img), # Placeholder
+        ("Add Sparkles", lambda img: img), # Placeholder
+        ("Add Fire", lambda img: img), # Placeholder
+        ("Add Lightning", lambda img: img), # Placeholder
+        ("Add Hearts", lambda img: img), # Placeholder
+        ("Add Stars", lambda img: img), # Placeholder
+        ("Add Sunglasses", lambda img: img), # Placeholder
+        ("Add Tie", lambda img: img), # Placeholder
+        ("Add Bow", lambda img: img), # Placeholder
+    ],
+]
+
+# "Tab/Option" -> operation, e.g. "Enhance/Sharpen"
+OPERATIONS = {f"{tab}/{label}": func for tab, options in zip(TAB_NAMES, TAB_OPTIONS) for label, func in options}
+
+def _build_command_index():
+    # Lower-case option label -> (label, operation); the first tab listing a label wins
+    index = {}
+    for options in TAB_OPTIONS:
+        for label, func in options:
+            index.setdefault(label.lower(), (label, func))
+    return index
+
+COMMAND_INDEX = _build_command_index()
+# Longest labels first, so "smooth faces" is matched before "smooth"
+COMMAND_PATTERN = re.compile("|".join(re.escape(k) for k in sorted(COMMAND_INDEX, key=len, reverse=True)))
+
+def match_command(text):
+    """Return (label, operation) for the longest option label mentioned in ``text``, or None."""
+    matches = [m.group() for m in COMMAND_PATTERN.finditer(text.lower())]
+    if not matches:
+        return None
+    return COMMAND_INDEX[max(matches, key=len)]
+
+# ========== Adjustment Pipeline ==========
+
+# The preview proxy is rendered at twice the canvas size so that even at the
+# lowest zoom (0.5x) it still covers the canvas before the final fit.
+PREVIEW_OVERSAMPLE = 2
+
+def fit_within(img, box):
+    # Like Image.thumbnail, but returns a new image and never touches the input
+    w, h = img.size
+    scale = min(box[0] / w, box[1] / h)
+    if scale >= 1.0:
+        return img
+    return img.resize((max(1, int(w*scale)), max(1, int(h*scale))), Image.LANCZOS, reducing_gap=2.0)
+
+def _stage_brightness(img, value, scale):
+    return ImageEnhance.Brightness(img).enhance(value)
+
+def _stage_blur(img, radius, scale):
+    return img.filter(ImageFilter.GaussianBlur(radius*scale))
+
+def _stage_rotate(img, angle, scale):
+    return img.rotate(angle, expand=True)
+
+def _stage_zoom(img, zoom, scale):
+    w, h = img.size
+    return img.resize((max(1, int(w*zoom)), max(1, int(h*zoom))), Image.LANCZOS)
+
+def _stage_shadow(img, shadow, scale):
+    offset = max(1, int(round(shadow*scale)))
+    return add_drop_shadow(img, offset=offset, blur=offset)
+
+# (parameter, identity value, stage function) in the order they are applied.
+# Pixel-sized parameters are multiplied by the proxy scale so previews match
+# the full-resolution render.
+ADJUSTMENT_STAGES = [
+    ("brightness", 1.0, _stage_brightness),
+    ("blur", 0, _stage_blur),
+    ("angle", 0, _stage_rotate),
+    ("zoom", 1.0, _stage_zoom),
+    ("shadow", 0, _stage_shadow),
+]
+
+class AdjustmentPipeline:
+    """Caches the output of every adjustment stage keyed by its parameters.
+
+    A stage's key includes the parameters of every stage upstream of it, so
+    changing one slider only re-runs that stage and the ones after it. Renders
+    either at full resolution or on a downscaled proxy for interactive drags.
+    """
+    def __init__(self):
+        self.source = None
+        self._proxy = None  # (box, image, scale)
+        self._chains = {}   # box (None = full resolution) -> [(key, image), ...]
+
+    def set_source(self, img):
+        self.source = img
+        self._proxy = None
+        self._chains.clear()
+
+    def proxy(self, box):
+        if self._proxy is None or self._proxy[0] != box:
+            img = fit_within(self.source, box)
+            self._proxy = (box, img, img.width / self.source.width)
+            # Only one proxy resolution is kept alive at a time
+            self._chains = {k: v for k, v in self._chains.items() if k is None}
+        return self._proxy[1], self._proxy[2]
+
+    def render(self, params, box=None):
+        """Return the adjusted image; with ``box`` render on a proxy fitting it.
+
+        The returned image may be shared with the cache and must not be
+        modified in place.
+        """
+        if self.source is None:
+            return None
+        if box is None:
+            img, scale = self.source, 1.0
+        else:
+            img, scale = self.proxy(box)
+        chain = self._chains.setdefault(box, [None] * len(ADJUSTMENT_STAGES))
+        key = ()
+        for i, (name, identity, stage) in enumerate(ADJUSTMENT_STAGES):
+            value = params[name]
+            key += (value,)
+            cached = chain[i]
+            if cached is not None and cached[0] == key:
+                img = cached[1]
+                continue
+            if value != identity:
+                img = stage(img, value, scale)
+            chain[i] = (key, img)
+        return img
+
+# ========== Edit History ==========
+
+HISTORY_TILE = 256
+HISTORY_BUDGET_MB = 512
+
+class _Snapshot:
+    __slots__ = ("mode", "size", "palette", "tiles")
+    def __init__(self, mode, size, palette, tiles):
+        self.mode = mode
+        self.size = size
+        self.palette = palette
+        self.tiles = tiles  # [(key, data)] from encode(); data is dropped once pushed
+
+class EditHistory:
+    """Undo/redo history whose snapshots share unchanged tiles.
+
+    Snapshots are stored as grids of raw tiles in a content-addressed,
+    reference-counted store, so an effect that leaves parts of the image
+    alone (or does nothing at all) only costs the tiles it changed. Once the
+    store grows past ``budget_bytes`` the least recently visited snapshots,
+    other than the current one, are evicted.
+    """
+    def __init__(self, budget_bytes=HISTORY_BUDGET_MB * 1024 * 1024, tile=HISTORY_TILE):
+        self.budget = budget_bytes
+        self.tile = tile
+        self.states = []
+        self.index = -1
+        self.nbytes = 0
+        self._store = {}         # key -> [data, refcount]
+        self._lru = OrderedDict()  # id(snapshot) -> snapshot, least recently visited first
+    def encode(self, img):
+        """Split ``img`` into hashed tiles; safe to call off the Tk thread."""
+        w, h = img.size
+        tiles = []
+        for top in range(0, h, self.tile):
+            for left in range(0, w, self.tile):
+                box = (left, top, min(left + self.tile, w), min(top + self.tile, h))
+                data = img.crop(box).tobytes()
+                key = (img.mode, box[2] - left, box[3] - top, hashlib.blake2b(data, digest_size=16).digest())
+                tiles.append((key, data))
+        palette = img.getpalette() if img.mode == "P" else None
+        return _Snapshot(img.mode, img.size, palette, tiles)
+    def push(self, snapshot):
+        """Make ``snapshot`` (from encode) the current state, dropping any redo states."""
+        keys = []
+        for key, data in snapshot.tiles:
+            entry = self._store.get(key)
+            if entry is None:
+                self._store[key] = [data, 1]
+                self.nbytes += len(data)
+            else:
+                entry[1] += 1
+            keys.append(key)
+        snapshot.tiles = keys
+        for state in self.states[self.index+1:]:
+            self._release(state)
+        del self.states[self.index+1:]
+        self.states.append(snapshot)
+        self.index += 1
+        self._lru[id(snapshot)] = snapshot
+        self._evict()
+    def can_undo(self):
+        return self.index > 0
+    def can_redo(self):
+        return self.index < len(self.states) - 1
+    def undo(self):
+        if not self.can_undo():
+            return None
+        self.index -= 1
+        return self._restore(self.states[self.index])
+    def redo(self):
+        if not self.can_redo():
+            return None
+        self.index += 1
+        return self._restore(self.states[self.index])
+    def _restore(self, snapshot):
+        self._lru.move_to_end(id(snapshot))
+        img = Image.new(snapshot.mode, snapshot.size)
+        w, h = snapshot.size
+        keys = iter(snapshot.tiles)
+        for top in range(0, h, self.tile):
+            for left in range(0, w, self.tile):
+                key = next(keys)
+                img.paste(Image.frombytes(snapshot.mode, key[1:3], self._store[key][0]), (left, top))
+        if snapshot.palette is not None:
+            img.putpalette(snapshot.palette)
+        return img
+    def _release(self, snapshot):
+        del self._lru[id(snapshot)]
+        for key in snapshot.tiles:
+            entry = self._store[key]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._store[key]
+                self.nbytes -= len(entry[0])
+    def _evict(self):
+        current = self.states[self.index]
+        while self.nbytes > self.budget:
+            victim = next((s for s in self._lru.values() if s is not current), None)
+            if victim is None:
+                return
+            position = self.states.index(victim)
+            del self.states[position]
+            if position < self.index:
+                self.index -= 1
+            self._release(victim)
+
+# ========== Effect Executor ==========
+
+class EffectExecutor:
+    """Runs effects on one background thread and hands results back to Tk.
+
+    A new effect supersedes older ones: queued effects are cancelled, a
+    running one is stopped at its next check_cancelled() (or its result is
+    discarded), and the new effect then runs on the latest image. Results
+    are delivered on the Tk thread by polling a queue with ``after()``.
+    """
+    POLL_MS = 30
+    def __init__(self, root):
+        self.root = root
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slizzai-effect")
+        self.results = queue.Queue()
+        self.generation = 0
+        self._queued = None
+        root.after(self.POLL_MS, self._poll)
+    def submit(self, func, get_image, on_done):
+        # get_image is called on the worker so the effect sees the image left by the one before it
+        self.generation += 1
+        if self._queued is not None:
+            self._queued.cancel()
+        self._queued = self.pool.submit(self._run, self.generation, func, get_image, on_done)
+    def shutdown(self):
+        self.generation += 1
+        self.pool.shutdown(wait=False, cancel_futures=True)
+    def _run(self, generation, func, get_image, on_done):
+        if generation != self.generation:
+            return
+        _effect_state.is_cancelled = lambda: generation != self.generation
+        try:
+            result, error = func(get_image()), None
+        except Exception as e:
+            result, error = None, e
+        finally:
+            _effect_state.is_cancelled = None
+        self.results.put((generation, on_done, result, error))
+    def _poll(self):
+        while True:
+            try:
+                generation, on_done, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self.generation:
+                on_done(result, error)
+        self.root.after(self.POLL_MS, self._poll)
+
 # ========== UI Classes ==========
 
 class ImageCanvas(tk.Canvas):
@@ -123,27 +1104,31 @@ class ImageCanvas(tk.Canvas):
         self.blur = 0
         self.shadow = 0
         self.brightness = 1.0
+        self.pipeline = AdjustmentPipeline()
         self.bind("<Configure>", self._redraw)
     def set_image(self, pil_img):
-        self.orig_img = pil_img.copy()
+        # Images are never modified in place, so the canvas can share the app's copy
+        self.orig_img = pil_img
+        self.pipeline.set_source(self.orig_img)
         self.update_image()
-    def update_image(self):
+    def adjustments(self):
+        return {"brightness": self.brightness, "blur": self.blur, "angle": self.angle,
+                "zoom": self.zoom, "shadow": self.shadow}
+    def render_full(self):
+        # Full-resolution result with all adjustments, as used for saving
+        return self.pipeline.render(self.adjustments())
+    def update_image(self, full=False):
+        # Interactive updates render on a display-sized proxy; the full-resolution
+        # render only happens when a slider is released (full=True) or on save.
         if self.orig_img is None: return
-        img = self.orig_img.copy()
-        # Apply adjustments
-        if self.brightness != 1.0:
-            img = ImageEnhance.Brightness(img).enhance(self.brightness)
-        if self.blur > 0:
-            img = img.filter(ImageFilter.GaussianBlur(self.blur))
-        if self.angle != 0:
-            img = img.rotate(self.angle, expand=True)
-        if self.zoom != 1.0:
-            w, h = img.size
-            img = img.resize((int(w*self.zoom), int(h*self.zoom)), Image.LANCZOS)
-        if self.shadow > 0:
-            img = add_drop_shadow(img, offset=self.shadow, blur=self.shadow)
+        box = (max(self.winfo_width(), 1), max(self.winfo_height(), 1))
+        if full:
+            img = self.pipeline.render(self.adjustments())
+        else:
+            proxy_box = (box[0]*PREVIEW_OVERSAMPLE, box[1]*PREVIEW_OVERSAMPLE)
+            img = self.pipeline.render(self.adjustments(), proxy_box)
         # Resize to fit canvas
-        img.thumbnail((self.winfo_width(), self.winfo_height()))
+        img = fit_within(img, box)
         self.display_img = ImageTk.PhotoImage(img)
         self.delete("all")
         self.create_image(self.winfo_width()//2, self.winfo_height()//2, image=self.display_img)
@@ -177,9 +1162,9 @@ class ChatPanel(tk.Frame):
         if not text: return
         self.insert_user(text)
         self.chat_entry.delete(0, tk.END)
-        threading.Thread(target=self.handle_command, args=(text,)).start()
+        self.handle_command(text)
     def handle_command(self, text):
-        # Parse command and apply effect
+        # Parsing is cheap and stays on the Tk thread; effects run on the app's executor
         response = self.app.handle_chat_command(text)
         self.insert_bot(response)
 
@@ -193,236 +1178,9 @@ class SidePanel(tk.Frame):
         self.tab_control.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
         self.populate_tabs()
     def populate_tabs(self):
-        tab_names = [
-            "Enhance", "Adjust", "AI", "Art", "Effects",
-            "Filters", "Restore", "Generate", "Segment", "Fun"
-        ]
-        tab_options = [
-            # Each tab gets 20 creative or technical operations
-            [
-                ("Sharpen", lambda img: img.filter(ImageFilter.SHARPEN)),
-                ("Auto Contrast", lambda img: ImageOps.autocontrast(img)),
-                ("Denoise", lambda img: img.filter(ImageFilter.MedianFilter(3))),
-                ("HDR", lambda img: img.filter(ImageFilter.DETAIL)),
-                ("Super-Res", ai_upscale),
-                ("Color Boost", lambda img: ImageEnhance.Color(img).enhance(1.5)),
-                ("Brightness+", lambda img: ImageEnhance.Brightness(img).enhance(1.2)),
-                ("Brightness-", lambda img: ImageEnhance.Brightness(img).enhance(0.8)),
-                ("Contrast+", lambda img: ImageEnhance.Contrast(img).enhance(1.4)),
-                ("Contrast-", lambda img: ImageEnhance.Contrast(img).enhance(0.7)),
-                ("Gamma Up", lambda img: img.point(lambda p: min(255, int(p**1.1)))),
-                ("Gamma Down", lambda img: img.point(lambda p: max(0, int(p**0.9)))),
-                ("Edge Enhance", lambda img: img.filter(ImageFilter.EDGE_ENHANCE)),
-                ("Smooth", lambda img: img.filter(ImageFilter.SMOOTH)),
-                ("Posterize", lambda img: ImageOps.posterize(img, 4)),
-                ("Solarize", lambda img: ImageOps.solarize(img, threshold=128)),
-                ("Invert", lambda img: ImageOps.invert(img)),
-                ("Sepia", lambda img: ImageOps.colorize(ImageOps.grayscale(img), "#704214", "#C0C080")),
-                ("Vivid", lambda img: ImageEnhance.Color(img).enhance(2.0)),
-                ("Dehaze", lambda img: img.filter(ImageFilter.ModeFilter(5))),
-            ],
-            [
-                ("Crop Center", lambda img: center_crop(img, (img.width//2, img.height//2))),
-                ("Resize 50%", lambda img: img.resize((img.width//2, img.height//2))),
-                ("Resize 200%", lambda img: img.resize((img.width*2, img.height*2))),
-                ("Rotate 90°", lambda img: img.rotate(90, expand=True)),
-                ("Rotate 180°", lambda img: img.rotate(180, expand=True)),
-                ("Flip H", lambda img: img.transpose(Image.FLIP_LEFT_RIGHT)),
-                ("Flip V", lambda img: img.transpose(Image.FLIP_TOP_BOTTOM)),
-                ("Add Border", lambda img: ImageOps.expand(img, border=10, fill=ACCENT)),
-                ("Add Frame", lambda img: ImageOps.expand(img, border=20, fill=WHITE)),
-                ("Round Corners", lambda img: img.filter(ImageFilter.SMOOTH_MORE)),
-                ("Pad 10%", lambda img: ImageOps.expand(img, border=int(0.1*img.width), fill=LIGHT_BG)),
-                ("Square Crop", lambda img: center_crop(img, (min(img.size), min(img.size)))),
-                ("Circle Crop", lambda img: img), # Placeholder
-                ("Tile", lambda img: img), # Placeholder
-                ("Mirror", lambda img: img.transpose(Image.FLIP_LEFT_RIGHT)),
-                ("Perspective", lambda img: img), # Placeholder
-                ("Skew", lambda img: img), # Placeholder
-                ("Shear", lambda img: img), # Placeholder
-                ("Stretch", lambda img: img), # Placeholder
-                ("Trim", lambda img: img.crop(img.getbbox())),
-            ],
-            [
-                ("AI Upscale", ai_upscale),
-                ("AI Denoise", lambda img: img.filter(ImageFilter.MedianFilter(5))),
-                ("AI Inpaint", ai_inpaint),
-                ("AI Style Transfer", ai_style_transfer),
-                ("AI Segmentation", ai_segmentation),
-                ("AI Generate", lambda _: ai_generate("A cat in the style of Van Gogh")),
-                ("AI Colorize", lambda img: img.convert("L").convert("RGB")),
-                ("AI Remove BG", lambda img: img), # Placeholder
-                ("AI Face Enhance", lambda img: img), # Placeholder
-                ("AI Deblur", lambda img: img.filter(ImageFilter.SMOOTH)),
-                ("AI Super-Res", ai_upscale),
-                ("AI Cartoon", lambda img: img.filter(ImageFilter.CONTOUR)),
-                ("AI Line Art", lambda img: img.filter(ImageFilter.FIND_EDGES)),
-                ("AI HDR", lambda img: img.filter(ImageFilter.DETAIL)),
-                ("AI Night2Day", lambda img: img), # Placeholder
-                ("AI Day2Night", lambda img: img), # Placeholder
-                ("AI Old2Young", lambda img: img), # Placeholder
-                ("AI Gender Swap", lambda img: img), # Placeholder
-                ("AI Age Up", lambda img: img), # Placeholder
-                ("AI Age Down", lambda img: img), # Placeholder
-            ],
-            [
-                ("Oil Paint", lambda img: img.filter(ImageFilter.SMOOTH)),
-                ("Watercolor", lambda img: img.filter(ImageFilter.BLUR)),
-                ("Sketch", lambda img: img.filter(ImageFilter.CONTOUR)),
-                ("Charcoal", lambda img: img.filter(ImageFilter.EDGE_ENHANCE)),
-                ("Cartoon", lambda img: img.filter(ImageFilter.CONTOUR)),
-                ("Pop Art", lambda img: img.filter(ImageFilter.EMBOSS)),
-                ("Pixelate", lambda img: img.resize((32,32)).resize(img.size)),
-                ("Halftone", lambda img: img), # Placeholder
-                ("Mosaic", lambda img: img), # Placeholder
-                ("Stipple", lambda img: img), # Placeholder
-                ("Pastel", lambda img: img), # Placeholder
-                ("Impressionist", lambda img: img), # Placeholder
-                ("Surreal", lambda img: img), # Placeholder
-                ("Abstract", lambda img: img), # Placeholder
-                ("Color Splash", lambda img: img), # Placeholder
-                ("Glitch", lambda img: img), # Placeholder
-                ("Noise", lambda img: img), # Placeholder
-                ("Vaporwave", lambda img: img), # Placeholder
-                ("Cyberpunk", lambda img: img), # Placeholder
-                ("Graffiti", lambda img: img), # Placeholder
-            ],
-            [
-                ("Blur", lambda img: img.filter(ImageFilter.BLUR)),
-                ("Gaussian Blur", lambda img: img.filter(ImageFilter.GaussianBlur(3))),
-                ("Box Blur", lambda img: img.filter(ImageFilter.BoxBlur(2))),
-                ("Motion Blur", lambda img: img), # Placeholder
-                ("Radial Blur", lambda img: img), # Placeholder
-                ("Glow", lambda img: img), # Placeholder
-                ("Shadow", lambda img: add_drop_shadow(img, offset=15, blur=10)),
-                ("Emboss", lambda img: img.filter(ImageFilter.EMBOSS)),
-                ("Find Edges", lambda img: img.filter(ImageFilter.FIND_EDGES)),
-                ("Edge Enhance", lambda img: img.filter(ImageFilter.EDGE_ENHANCE)),
-                ("Contour", lambda img: img.filter(ImageFilter.CONTOUR)),
-                ("Detail", lambda img: img.filter(ImageFilter.DETAIL)),
-                ("Smooth", lambda img: img.filter(ImageFilter.SMOOTH)),
-                ("Sharpen", lambda img: img.filter(ImageFilter.SHARPEN)),
-                ("Max Filter", lambda img: img.filter(ImageFilter.MaxFilter(3))),
-                ("Min Filter", lambda img: img.filter(ImageFilter.MinFilter(3))),
-                ("Median Filter", lambda img: img.filter(ImageFilter.MedianFilter(5))),
-                ("Mode Filter", lambda img: img.filter(ImageFilter.ModeFilter(5))),
-                ("Rank Filter", lambda img: img), # Placeholder
-                ("Unsharp Mask", lambda img: img.filter(ImageFilter.UnsharpMask(radius=2, percent=150))),
-            ],
-            [
-                ("Red Channel", lambda img: img.split()[0]),
-                ("Green Channel", lambda img: img.split()[1]),
-                ("Blue Channel", lambda img: img.split()[2]),
-                ("Gray", lambda img: img.convert("L")),
-                ("Invert", lambda img: ImageOps.invert(img)),
-                ("Posterize", lambda img: ImageOps.posterize(img, 2)),
-                ("Solarize", lambda img: ImageOps.solarize(img, threshold=100)),
-                ("Equalize", lambda img: ImageOps.equalize(img)),
-                ("Autocontrast", lambda img: ImageOps.autocontrast(img)),
-                ("Colorize", lambda img: ImageOps.colorize(img.convert("L"), "#222", "#ff0")),
-                ("Threshold", lambda img: img.convert("L").point(lambda p: 255 if p > 128 else 0)),
-                ("Dither", lambda img: img.convert("1")),
-                ("Quantize", lambda img: img.quantize(colors=8)),
-                ("Palette Swap", lambda img: img), # Placeholder
-                ("Channel Swap", lambda img: img), # Placeholder
-                ("Desaturate", lambda img: ImageEnhance.Color(img).enhance(0)),
-                ("Color Balance", lambda img: img), # Placeholder
-                ("Tint", lambda img: img), # Placeholder
-                ("Hue Shift", lambda img: img), # Placeholder
-                ("Saturation", lambda img: img), # Placeholder
-            ],
-            [
-                ("Restore Old", lambda img: img.filter(ImageFilter.DETAIL)),
-                ("Remove Scratches", lambda img: img.filter(ImageFilter.SMOOTH)),
-                ("De-yellow", lambda img: img), # Placeholder
-                ("De-fade", lambda img: img), # Placeholder
-                ("De-blur", lambda img: img.filter(ImageFilter.SHARPEN)),
-                ("Fill Gaps", lambda img: img), # Placeholder
-                ("Recolor", lambda img: img), # Placeholder
-                ("Sharpen Faces", lambda img: img), # Placeholder
-                ("Reconstruct", lambda img: img), # Placeholder
-                ("Recompose", lambda img: img), # Placeholder
-                ("Auto Restore", lambda img: img), # Placeholder
-                ("Remove Noise", lambda img: img.filter(ImageFilter.MedianFilter(3))),
-                ("Remove Spots", lambda img: img), # Placeholder
-                ("Balance Tone", lambda img: img), # Placeholder
-                ("Contrast Fix", lambda img: img), # Placeholder
-                ("Color Fix", lambda img: img), # Placeholder
-                ("Edge Fix", lambda img: img), # Placeholder
-                ("Smooth Faces", lambda img: img), # Placeholder
-                ("Brighten", lambda img: ImageEnhance.Brightness(img).enhance(1.2)),
-                ("Darken", lambda img: ImageEnhance.Brightness(img).enhance(0.8)),
-            ],
-            [
-                ("Text to Image", lambda _: ai_generate("A sunset over mountains")),
-                ("Expand Canvas", lambda img: ImageOps.expand(img, border=50, fill=WHITE)),
-                ("Content Fill", lambda img: img), # Placeholder
-                ("Remove Object", lambda img: img), # Placeholder
-                ("Add Object", lambda img: img), # Placeholder
-                ("Change BG", lambda img: img), # Placeholder
-                ("Clone Stamp", lambda img: img), # Placeholder
-                ("Pattern Fill", lambda img: img), # Placeholder
-                ("Texture", lambda img: img), # Placeholder
-                ("Sticker", lambda img: img), # Placeholder
-                ("Frame", lambda img: ImageOps.expand(img, border=20, fill=ACCENT)),
-                ("Add Text", lambda img: img), # Placeholder
-                ("Watermark", lambda img: img), # Placeholder
-                ("QR Code", lambda img: img), # Placeholder
-                ("Barcode", lambda img: img), # Placeholder
-                ("Add Emoji", lambda img: img), # Placeholder
-                ("Add Icon", lambda img: img), # Placeholder
-                ("Add Signature", lambda img: img), # Placeholder
-                ("Add Date", lambda img: img), # Placeholder
-                ("Add Location", lambda img: img), # Placeholder
-            ],
-            [
-                ("Segment Person", ai_segmentation),
-                ("Segment Sky", lambda img: img), # Placeholder
-                ("Segment BG", lambda img: img), # Placeholder
-                ("Segment Foreground", lambda img: img), # Placeholder
-                ("Segment Object", lambda img: img), # Placeholder
-                ("Segment Animal", lambda img: img), # Placeholder
-                ("Segment Food", lambda img: img), # Placeholder
-                ("Segment Plant", lambda img: img), # Placeholder
-                ("Segment Car", lambda img: img), # Placeholder
-                ("Segment Road", lambda img: img), # Placeholder
-                ("Segment Water", lambda img: img), # Placeholder
-                ("Segment Building", lambda img: img), # Placeholder
-                ("Segment Face", lambda img: img), # Placeholder
-                ("Segment Hand", lambda img: img), # Placeholder
-                ("Segment Eye", lambda img: img), # Placeholder
-                ("Segment Mouth", lambda img: img), # Placeholder
-                ("Segment Nose", lambda img: img), # Placeholder
-                ("Segment Ear", lambda img: img), # Placeholder
-                ("Segment Hair", lambda img: img), # Placeholder
-                ("Segment Clothes", lambda img: img), # Placeholder
-            ],
-            [
-                ("Stickerify", lambda img: img), # Placeholder
-                ("Meme", lambda img: img), # Placeholder
-                ("Comic", lambda img: img), # Placeholder
-                ("Speech Bubble", lambda img: img), # Placeholder
-                ("Add Glasses", lambda img: img), # Placeholder
-                ("Add Hat", lambda img: img), # Placeholder
-                ("Add Beard", lambda img: img), # Placeholder
-                ("Add Mask", lambda img: img), # Placeholder
-                ("Add Crown", lambda img: img), # Placeholder
-                ("Add Wings", lambda img: img), # Placeholder
-                ("Add Animal Ears", lambda img: img), # Placeholder
-                ("Add Rainbow", lambda img: img), # Placeholder
-                ("Add Sparkles", lambda img: img), # Placeholder
-                ("Add Fire", lambda img: img), # Placeholder
-                ("Add Lightning", lambda img: img), # Placeholder
-                ("Add Hearts", lambda img: img), # Placeholder
-                ("Add Stars", lambda img: img), # Placeholder
-                ("Add Sunglasses", lambda img: img), # Placeholder
-                ("Add Tie", lambda img: img), # Placeholder
-                ("Add Bow", lambda img: img), # Placeholder
-            ],
-        ]
-        for i, tab_name in enumerate(tab_names):
+        for i, tab_name in enumerate(TAB_NAMES):
             frame = tk.Frame(self.tab_control, bg=LIGHT_BG)
-            for j, (label, func) in enumerate(tab_options[i]):
+            for j, (label, func) in enumerate(TAB_OPTIONS[i]):
                 btn = tk.Button(frame, text=label, font=BTN_FONT, bg=WHITE, fg=DARK_BG, bd=0, relief=tk.FLAT,
                                 activebackground=ACCENT, activeforeground=WHITE,
                                 command=lambda f=func: self.app.apply_effect(f))
@@ -437,8 +1195,12 @@ class ControlPanel(tk.Frame):
         self.canvas = canvas
         self.upload_btn = tk.Button(self, text="Upload", font=BTN_FONT, bg=ACCENT, fg=WHITE, bd=0, relief=tk.FLAT, command=self.upload_image)
         self.save_btn = tk.Button(self, text="Save", font=BTN_FONT, bg=ACCENT, fg=WHITE, bd=0, relief=tk.FLAT, command=self.save_image)
+        self.undo_btn = tk.Button(self, text="Undo", font=BTN_FONT, bg=ACCENT, fg=WHITE, bd=0, relief=tk.FLAT, command=self.app.undo)
+        self.redo_btn = tk.Button(self, text="Redo", font=BTN_FONT, bg=ACCENT, fg=WHITE, bd=0, relief=tk.FLAT, command=self.app.redo)
         self.upload_btn.pack(side=tk.LEFT, padx=8, pady=6)
         self.save_btn.pack(side=tk.LEFT, padx=8, pady=6)
+        self.undo_btn.pack(side=tk.LEFT, padx=8, pady=6)
+        self.redo_btn.pack(side=tk.LEFT, padx=8, pady=6)
         # Sliders for canvas
         self.zoom_slider = tk.Scale(self, from_=0.5, to=2.0, resolution=0.01, orient=tk.HORIZONTAL, label="Zoom", bg=LIGHT_BG, fg=DARK_BG, length=120, command=self.on_zoom)
         self.zoom_slider.set(1.0)
@@ -455,6 +1217,8 @@ class ControlPanel(tk.Frame):
         self.brightness_slider = tk.Scale(self, from_=0.2, to=2.0, resolution=0.01, orient=tk.HORIZONTAL, label="Brightness", bg=LIGHT_BG, fg=DARK_BG, length=120, command=self.on_brightness)
         self.brightness_slider.set(1.0)
         self.brightness_slider.pack(side=tk.LEFT, padx=4)
+        for slider in (self.zoom_slider, self.angle_slider, self.blur_slider, self.shadow_slider, self.brightness_slider):
+            slider.bind("<ButtonRelease-1>", self.on_release)
     def upload_image(self):
         file_path = filedialog.askopenfilename(title="Select Image", filetypes=[("Image Files", "*.png;*.jpg;*.jpeg;*.bmp;*.gif")])
         if file_path:
@@ -467,21 +1231,11 @@ class ControlPanel(tk.Frame):
         file_path = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg;*.jpeg")])
         if file_path:
             # Save the current displayed image with all adjustments
-            img = self.app.canvas.orig_img.copy()
-            # Apply adjustments before saving
-            if self.app.canvas.brightness != 1.0:
-                img = ImageEnhance.Brightness(img).enhance(self.app.canvas.brightness)
-            if self.app.canvas.blur > 0:
-                img = img.filter(ImageFilter.GaussianBlur(self.app.canvas.blur))
-            if self.app.canvas.angle != 0:
-                img = img.rotate(self.app.canvas.angle, expand=True)
-            if self.app.canvas.zoom != 1.0:
-                w, h = img.size
-                img = img.resize((int(w*self.app.canvas.zoom), int(h*self.app.canvas.zoom)), Image.LANCZOS)
-            if self.app.canvas.shadow > 0:
-                img = add_drop_shadow(img, offset=self.app.canvas.shadow, blur=self.app.canvas.shadow)
+            img = self.app.canvas.render_full()
             img.save(file_path)
             messagebox.showinfo("Saved", f"Image saved to {file_path}")
+    def on_release(self, _=None):
+        self.canvas.update_image(full=True)
     def on_zoom(self, val):
         self.canvas.zoom = float(val)
         self.canvas.update_image()
@@ -501,13 +1255,18 @@ class ControlPanel(tk.Frame):
 # ========== Main Application ==========
 
 class SlizzAiApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, history_mb=HISTORY_BUDGET_MB):
         super().__init__()
         self.title("SlizzAi v2.9")
         self.geometry(f"{WINDOW_W}x{WINDOW_H}")
         self.resizable(False, False)
         self.configure(bg=DARK_BG)
         self.orig_img = None
+        self.history = EditHistory(budget_bytes=history_mb * 1024 * 1024)
+        self.executor = EffectExecutor(self)
+        self.bind_all("<Control-z>", self.undo)
+        self.bind_all("<Control-y>", self.redo)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         # Layout: Left chat, right controls
         self.left_frame = tk.Frame(self, bg=DARK_BG, width=WINDOW_W//2, height=WINDOW_H)
         self.left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=False)
@@ -524,21 +1283,52 @@ class SlizzAiApp(tk.Tk):
         # Tabs
         self.side_panel = SidePanel(self.right_frame, self)
         self.side_panel.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
-    def set_image(self, pil_img):
-        self.orig_img = pil_img.copy()
+        # Load the segmentation model now so the first Segment click doesn't stall
+        segmentation_service().start()
+    def on_close(self):
+        self.executor.shutdown()
+        self.destroy()
+    def set_image(self, pil_img, snapshot=None):
+        # Every image that reaches the canvas is recorded for undo, unless it came from the history
+        if snapshot is not False:
+            self.history.push(snapshot or self.history.encode(pil_img))
+        self.orig_img = pil_img
         self.canvas.set_image(pil_img)
     def apply_effect(self, func):
         if self.orig_img is None:
             messagebox.showwarning("No Image", "Please upload an image first.")
             return
-        try:
-            result = func(self.orig_img)
-            self.set_image(result)
-            self.chat_panel.insert_bot("Effect applied.")
-        except Exception as e:
-            self.chat_panel.insert_bot(f"Error: {e}")
+        def run(img):
+            # Tiling and hashing the result for the history also happens off the Tk thread
+            result = func(img)
+            return result, self.history.encode(result)
+        self.executor.submit(run, lambda: self.orig_img, self._effect_done)
+    def _effect_done(self, result, error):
+        if isinstance(error, EffectCancelled):
+            return
+        if error is not None:
+            self.chat_panel.insert_bot(f"Error: {error}")
+            return
+        self.set_image(*result)
+        self.chat_panel.insert_bot("Effect applied.")
+    def undo(self, _=None):
+        img = self.history.undo()
+        if img is None:
+            return "Nothing to undo."
+        self.set_image(img, snapshot=False)
+        return "Undone."
+    def redo(self, _=None):
+        img = self.history.redo()
+        if img is None:
+            return "Nothing to redo."
+        self.set_image(img, snapshot=False)
+        return "Redone."
     def handle_chat_command(self, text):
         # Very basic NLP: check for keywords
+        if "undo" in text:
+            return self.undo()
+        if "redo" in text:
+            return self.redo()
         if "upload" in text:
             self.ctrl_panel.upload_image()
             return "Image uploaded."
@@ -561,12 +1351,151 @@ class SlizzAiApp(tk.Tk):
             self.ctrl_panel.brightness_slider.set(1.5)
             return "Brightness increased."
         # Try to match tab/option
-        for tab in self.side_panel.tab_frames:
-            for child in tab.winfo_children():
-                if isinstance(child, tk.Button) and child["text"].lower() in text.lower():
-                    child.invoke()
-                    return f"{child['text']} applied."
+        match = match_command(text)
+        if match is not None:
+            label, func = match
+            if self.orig_img is None:
+                return "Please upload an image first."
+            self.apply_effect(func)
+            return f"Applying {label}..."
         return "Sorry, I didn't understand. Try asking for an image effect or adjustment."
+
+# ========== Batch Mode ==========
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+
+def parse_chain(spec):
+    """Resolve a chain such as "Enhance/Sharpen > AI/AI Upscale" into tab operations."""
+    ops = []
+    for step in spec.split(">"):
+        name = step.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}'. Use 'Tab/Option', e.g. 'Enhance/Sharpen'.")
+        ops.append(OPERATIONS[name])
+    return ops
+
+def collect_inputs(source):
+    """List the image files in a directory, or matching a glob pattern."""
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in sorted(os.listdir(source))]
+    else:
+        paths = sorted(glob.glob(source, recursive=True))
+    return [p for p in paths if os.path.isfile(p) and p.lower().endswith(IMAGE_EXTENSIONS)]
+
+def batch_outputs(paths, out_dir, fmt=None):
+    """Map each input to its output path, mirroring the inputs' layout under ``out_dir``.
+
+    Paths are kept relative to the deepest directory the inputs share, so
+    ``a/x.png`` and ``b/x.png`` don't overwrite each other. Returns
+    ``(outputs, collisions)``: pairs of (input, output) to process, and the
+    inputs whose output an earlier input already claims (e.g. ``x.png`` and
+    ``x.jpg`` with ``fmt="png"``).
+    """
+    outputs, collisions, taken = [], [], set()
+    if not paths:
+        return outputs, collisions
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+    for path in paths:
+        stem, ext = os.path.splitext(os.path.relpath(os.path.abspath(path), root))
+        out_path = os.path.join(out_dir, f"{stem}.{(fmt or ext.lstrip('.')).lower()}")
+        key = os.path.normcase(out_path)
+        if key in taken:
+            collisions.append((path, out_path))
+        else:
+            taken.add(key)
+            outputs.append((path, out_path))
+    return outputs, collisions
+
+def _batch_init(seg_config):
+    # One image per process already saturates the cores; keep the libraries single-threaded
+    global TILE_WORKERS
+    cv2.setNumThreads(1)
+    torch.set_num_threads(1)
+    TILE_WORKERS = 1
+    # Spawned workers start with a fresh module, forked ones already have the service
+    segmentation_service(**seg_config)
+
+def _batch_worker(path, chain, out_path):
+    # Operations are looked up by name in the worker, the lambdas can't be pickled
+    img = Image.open(path).convert("RGB")
+    result = run_chain(img, parse_chain(chain))
+    if out_path.lower().endswith((".jpg", ".jpeg")) and result.mode not in ("RGB", "L"):
+        result = result.convert("RGB")
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    result.save(out_path)
+    return out_path
+
+def run_batch(source, chain, out_dir, workers=None, max_in_flight=None, fmt=None, seg_config=None):
+    """Apply a chain of tab operations to every image in ``source``, headless.
+
+    Images are fanned out over a process pool. At most ``max_in_flight`` images
+    are queued or being processed at once, and each worker writes its result
+    to ``out_dir`` itself, so memory stays bounded however many inputs there
+    are. Inputs whose output path another input already claims are not
+    processed and count as failed. ``seg_config`` is passed to
+    segmentation_service in every worker. Returns ``(processed, failed)``.
+    """
+    parse_chain(chain)  # fail fast on a bad chain
+    outputs, collisions = batch_outputs(collect_inputs(source), out_dir, fmt)
+    for path, out_path in collisions:
+        print(f"Error: {path}: {out_path} is already the output of another input")
+    jobs = iter(outputs)
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    processed, failed = 0, len(collisions)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_batch_init, initargs=(seg_config or {},)) as pool:
+        pending = {}
+        def fill():
+            while len(pending) < max_in_flight:
+                path, out_path = next(jobs, (None, None))
+                if path is None:
+                    return
+                pending[pool.submit(_batch_worker, path, chain, out_path)] = path
+        fill()
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                path = pending.pop(future)
+                try:
+                    print(f"{path} -> {future.result()}")
+                    processed += 1
+                except Exception as e:
+                    print(f"Error: {path}: {e}")
+                    failed += 1
+            fill()
+    return processed, failed
+
 if __name__ == "__main__":
-    SlizzAiApp().mainloop()
+    parser = argparse.ArgumentParser(description="SlizzAi v2.9. Starts the GUI unless --batch is given.")
+    parser.add_argument("--batch", metavar="DIR_OR_GLOB", help="process these images headless instead of starting the GUI")
+    parser.add_argument("--chain", help='operations to apply in order, e.g. "Enhance/Sharpen > AI/AI Upscale"')
+    parser.add_argument("--out", default="slizzai_output", help="output directory (default: slizzai_output)")
+    parser.add_argument("--format", help="output format extension, defaults to the input's")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-in-flight", type=int, help="images queued or in progress at once (default: 2 x workers)")
+    parser.add_argument("--list-ops", action="store_true", help="list the available operation names and exit")
+    parser.add_argument("--seg-backend", choices=("eager", "torchscript", "onnx"), default="eager", help="segmentation runtime (default: eager)")
+    parser.add_argument("--seg-model", help="TorchScript or ONNX graph for --seg-backend")
+    parser.add_argument("--seg-batch", type=int, default=4, help="max segmentation requests per forward pass (default: 4)")
+    parser.add_argument("--seg-threads", type=int, help="torch threads for segmentation")
+    parser.add_argument("--history-mb", type=int, default=HISTORY_BUDGET_MB, help=f"memory budget for undo history (default: {HISTORY_BUDGET_MB})")
+    parser.add_argument("--export-segmentation", metavar="PATH", help="export DeepLabV3 to PATH (.pt or .onnx) and exit")
+    args = parser.parse_args()
+    seg_config = dict(batch_size=args.seg_batch, num_threads=args.seg_threads,
+                      backend=args.seg_backend, model_path=args.seg_model)
+    segmentation_service(**seg_config)
+    if args.export_segmentation:
+        print(f"Exported segmentation model to {export_segmentation_model(args.export_segmentation)}")
+    elif args.list_ops:
+        print("\n".join(OPERATIONS))
+    elif args.batch:
+        if not args.chain:
+            parser.error("--batch requires --chain")
+        processed, failed = run_batch(args.batch, args.chain, args.out, args.workers, args.max_in_flight,
+                                      args.format, seg_config)
+        print(f"Processed {processed} image(s), {failed} failed.")
+        sys.exit(1 if failed else 0)
+    else:
+        SlizzAiApp(history_mb=args.history_mb).mainloop()
 # SlizzAi v2.9 - AI-powered image enhancement and chatbot tool
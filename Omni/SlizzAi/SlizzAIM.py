@@ -1,28 +1,67 @@
 # File: SlizzAIM_Commander.py
+from contextlib import nullcontext
+from functools import partial
+
 import SlizzAI
 import SlizzAIMega
+from SlizzAIM_Async import AsyncCommandHub
+from SlizzAIM_Pool import LazyOperatorPool
+from SlizzAIM_Cache import ResultCache
+from SlizzAIM_Supervisor import OperatorSupervisor
+
+# Task types whose executor stage changes something; their results are never reused
+UNCACHED_TASKS = ("deploy", "execute", "restart", "shutdown")
 
 class SlizzAIMCommander:
-    def __init__(self):
-        self.operators = {}
-        self.initialize_operators()
+    def __init__(self, pool_config=None, cache_ttls=None, telemetry=None):
+        # {operator name: {"size": N, "idle_timeout": seconds}}
+        self.pool_config = pool_config or {}
+        # A TelemetryCollector (e.g. MegaOrchestrator.telemetry) that records each command's latency
+        self.telemetry = telemetry
+        self.operators = self.initialize_operators()
         self.status = "ACTIVE"
+        # {task type: seconds}, on top of never caching UNCACHED_TASKS
+        self.cache = ResultCache(ttls={**dict.fromkeys(UNCACHED_TASKS, 0), **(cache_ttls or {})})
+        # Same operators, driven from an event loop (see SlizzAIM_ASGI.py)
+        self.async_hub = AsyncCommandHub(self.operators)
         
     def initialize_operators(self):
-        """Initialize all 5 mega-operators"""
-        self.operators["analyzer"] = SlizzAIMega.AnalyzerOperator()
-        self.operators["processor"] = SlizzAIMega.ProcessorOperator()
-        self.operators["predictor"] = SlizzAIMega.PredictorOperator()
-        self.operators["optimizer"] = SlizzAIMega.OptimizerOperator()
-        self.operators["executor"] = SlizzAIMega.ExecutorOperator()
+        """Initialize all 5 mega-operators as lazy pools, each with a supervised standby"""
+        classes = {
+            "analyzer": SlizzAIMega.AnalyzerOperator,
+            "processor": SlizzAIMega.ProcessorOperator,
+            "predictor": SlizzAIMega.PredictorOperator,
+            "optimizer": SlizzAIMega.OptimizerOperator,
+            "executor": SlizzAIMega.ExecutorOperator,
+        }
+        self.supervisor = OperatorSupervisor({
+            name: partial(LazyOperatorPool.from_config, cls, self.pool_config.get(name))
+            for name, cls in classes.items()
+        })
+        return self.supervisor.operators
         
     def hybrid_standby(self):
-        """Manage hybrid standby states"""
+        """Unload idle operator instances until they are next needed"""
         for op in self.operators.values():
             op.maintain_standby()
             
     def command_handler(self, task):
-        """Route tasks to appropriate operators"""
+        """Route tasks to appropriate operators, reusing recent identical results
+
+        A cached result is the same object every caller gets; don't mutate it.
+        """
+        with self.timed():
+            return self.cache.get_or_compute(task, self.run_operators)
+
+    async def async_command_handler(self, task):
+        """command_handler for asyncio callers, sharing the same result cache"""
+        with self.timed():
+            return await self.cache.aget_or_compute(task, self.async_hub.handle)
+
+    def timed(self):
+        return self.telemetry.time_request() if self.telemetry is not None else nullcontext()
+
+    def run_operators(self, task):
         analysis = self.operators["analyzer"].process(task)
         processed = self.operators["processor"].transform(analysis)
         prediction = self.operators["predictor"].forecast(processed)
@@ -35,26 +74,48 @@ if __name__ == "__main__":
 # File: SlizzAIMega_Analyzer.py
 import SlizzAI
 import SlizzAIMega
+from SlizzAIM_Supervisor import ObservableStatus, OperatorFailure
 
-class AnalyzerOperator:
+class AnalyzerOperator(ObservableStatus):
+    """Status changes are published to the OperatorSupervisor; FAILED triggers a failover"""
     def __init__(self):
-        self.ai_model = SlizzAI.load_model("analysis_core")
+        self.ai_model = None  # loaded on first use
         self.status = "STANDBY"
         
     def maintain_standby(self):
         """Hybrid standby maintenance"""
-        if self.status == "ACTIVE":
+        if self.status == "ACTIVE" and self.ai_model is not None:
             SlizzAI.conserve_resources(self.ai_model)
+
+    def load(self):
+        """Load the model now; LazyOperatorPool.warm() calls this for a warm standby"""
+        if self.ai_model is None:
+            try:
+                self.ai_model = SlizzAI.load_model("analysis_core")
+            except Exception as e:
+                self.status = "FAILED"
+                raise OperatorFailure(f"analysis_core failed to load: {e}") from e
+
+    def unload(self):
+        """Release the model; the next process() loads it again. The pool calls this once idle"""
+        if self.ai_model is not None:
+            SlizzAI.conserve_resources(self.ai_model)
+            self.ai_model = None
             
     def process(self, input_data):
         self.status = "ACTIVE"
-        result = SlizzAI.analyze(input_data, self.ai_model)
-        self.status = "STANDBY"
-        return result
+        self.load()
+        try:
+            return SlizzAI.analyze(input_data, self.ai_model)
+        finally:
+            self.status = "STANDBY"
 # Example integration
 from SlizzAIM_Commander import SlizzAIMCommander
+from SlizzMegaAI import MegaOrchestrator
 
-ai_hub = SlizzAIMCommander()
+orchestrator = MegaOrchestrator()
+# Every command lands in the orchestrator's p50/p95 latency window
+ai_hub = SlizzAIMCommander(telemetry=orchestrator.telemetry)
 result = ai_hub.command_handler({
     "task": "complex_analysis",
     "data": [...] 
@@ -75,38 +136,28 @@ elif command.lower() == "optimize":
     result = self.operators["optimizer"].enhance(user_input)
 elif command.lower() == "predict":
     result = self.operators["predictor"].forecast(user_input)
-import asyncio
+# File: SlizzAIM_ASGI.py (serve with: uvicorn SlizzAIM_ASGI:app)
+from SlizzAIM_Commander import SlizzAIMCommander
+from SlizzAIM_Async import create_asgi_app
 
-async def async_command_handler(self, task):
-    analysis = await asyncio.to_thread(self.operators["analyzer"].process, task)
-    processed = await asyncio.to_thread(self.operators["processor"].transform, analysis)
-    prediction = await asyncio.to_thread(self.operators["predictor"].forecast, processed)
-    optimization = await asyncio.to_thread(self.operators["optimizer"].enhance, prediction)
-    return await asyncio.to_thread(self.operators["executor"].execute, optimization)
-import json
+commander = SlizzAIMCommander()
+app = create_asgi_app(commander.async_hub, commander.async_command_handler)
+from SlizzAIM_Store import CommandStore
 
 class CommandHistoryTracker:
     def __init__(self, filename="command_history.json"):
         self.filename = filename
+        self.store = CommandStore(filename)
         self.history = self.load_history()
 
     def load_history(self):
-        try:
-            with open(self.filename, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {}
+        return self.store.counts
 
     def save_history(self):
-        with open(self.filename, "w") as file:
-            json.dump(self.history, file, indent=4)
+        self.store.flush()
 
     def log_command(self, command):
-        if command in self.history:
-            self.history[command] += 1
-        else:
-            self.history[command] = 1
-        self.save_history()
+        self.store.increment(command)
 
     def suggest_optimizations(self):
         return sorted(self.history.items(), key=lambda x: x[1], reverse=True)[:5]  # Top 5 frequent commands
@@ -176,46 +227,39 @@ app = QApplication(sys.argv)
 gui = SlizzAIMGUI()
 gui.show()
 sys.exit(app.exec_())
-import json
+from SlizzAIM_Store import CommandStore
 from collections import defaultdict
-from sklearn.ensemble import RandomForestClassifier
-import numpy as np
+from SlizzAIM_Predictor import NextCommandPredictor
 
 class CommandHistoryTracker:
-    def __init__(self, filename="command_history.json"):
+    def __init__(self, filename="command_history.json", refit_interval=None):
         self.filename = filename
+        self.store = CommandStore(filename)
         self.history = self.load_history()
-        self.model = RandomForestClassifier()
-        self.train_model()
+        self.model = NextCommandPredictor()
+        self.model.seed(self.history)
+        if refit_interval:
+            self.model.start_refit(refit_interval)
 
     def load_history(self):
-        try:
-            with open(self.filename, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {}
+        return self.store.counts
 
     def save_history(self):
-        with open(self.filename, "w") as file:
-            json.dump(self.history, file, indent=4)
+        self.store.flush()
 
     def log_command(self, command):
-        if command in self.history:
-            self.history[command] += 1
-        else:
-            self.history[command] = 1
-        self.save_history()
+        self.store.increment(command)
+        self.model.observe(command)
 
     def train_model(self):
-        if len(self.history) < 5: return  # Require minimum data
-        X = np.array([[self.history[c]] for c in self.history])
-        y = np.array(list(self.history.keys()))
-        self.model.fit(X, y)
+        self.model.refit()
 
     def predict_command(self):
         if len(self.history) < 5: return "Not enough data"
-        X_test = np.array([[max(self.history.values())]])
-        return self.model.predict(X_test)[0]
+        return self.model.predict()
+
+    def suggest_commands(self, k=5):
+        return self.model.suggest(k)
 
 # Usage inside command_loop
 tracker = CommandHistoryTracker()
@@ -227,7 +271,6 @@ while True:
         break
 
     tracker.log_command(command)
-    tracker.train_model()
     predicted = tracker.predict_command()
     
     print(f"Predicted Next Command: {predicted}")  # ML-based command recommendation
@@ -250,7 +293,7 @@ def execute_command():
 @app.route("/monitor", methods=["GET"])
 def system_status():
     operators_status = {name: op.status for name, op in ai_hub.operators.items()}
-    return jsonify({"AI_Operators_Status": operators_status})
+    return jsonify({"AI_Operators_Status": operators_status, "Result_Cache": ai_hub.cache.stats()})
 
 if __name__ == "__main__":
     app.run(port=5000, debug=True)
@@ -288,45 +331,40 @@ app = QApplication(sys.argv)
 gui = SlizzAIMGUI()
 gui.show()
 sys.exit(app.exec_())
-import json
+from SlizzAIM_Store import CommandStore
 from collections import Counter
-from sklearn.ensemble import RandomForestClassifier
-import numpy as np
+from SlizzAIM_Predictor import NextCommandPredictor
 
 class BehaviorTracker:
-    def __init__(self, filename="behavior_data.json"):
+    def __init__(self, filename="behavior_data.json", refit_interval=None):
         self.filename = filename
+        self.store = CommandStore(filename)
         self.history = self.load_history()
-        self.model = RandomForestClassifier()
-        self.train_model()
+        self.model = NextCommandPredictor()
+        self.model.seed(self.history)
+        if refit_interval:
+            self.model.start_refit(refit_interval)
 
     def load_history(self):
-        try:
-            with open(self.filename, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {}
+        return self.store.counts
 
     def save_history(self):
-        with open(self.filename, "w") as file:
-            json.dump(self.history, file, indent=4)
+        self.store.flush()
 
     def log_command(self, command):
-        self.history[command] = self.history.get(command, 0) + 1
-        self.save_history()
+        self.store.increment(command)
+        self.model.observe(command)
 
     def train_model(self):
-        if len(self.history) < 5:
-            return
-        X = np.array([[self.history[c]] for c in self.history])
-        y = np.array(list(self.history.keys()))
-        self.model.fit(X, y)
+        self.model.refit()
 
     def predict_command(self):
         if len(self.history) < 5:
             return "Not enough data"
-        X_test = np.array([[max(self.history.values())]])
-        return self.model.predict(X_test)[0]
+        return self.model.predict()
+
+    def suggest_commands(self, k=5):
+        return self.model.suggest(k)
 
 # Usage in SlizzAIM
 tracker = BehaviorTracker()
@@ -338,25 +376,34 @@ while True:
         break
 
     tracker.log_command(command)
-    tracker.train_model()
     predicted = tracker.predict_command()
     print(f"Predicted Optimization: {predicted}")
-import concurrent.futures
+from SlizzAIM_Pipeline import StagedPipeline
 
 class ScalableExecution:
-    def __init__(self, ai_hub):
+    def __init__(self, ai_hub, workers_per_stage=1, queue_size=64, tracker=None):
         self.ai_hub = ai_hub
+        self.tracker = tracker
+        # One long-lived worker pool per operator stage, so tasks overlap across stages
+        self.pipeline = StagedPipeline(ai_hub.operators, workers=workers_per_stage, queue_size=queue_size)
 
     def execute_parallel(self, commands):
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            results = executor.map(self.ai_hub.command_handler, commands)
-        return list(results)
+        # Same result cache and history as command_handler; only cache misses enter the pipeline
+        if self.tracker is not None:
+            for command in commands:
+                self.tracker.log_command(command.get("task"))
+        futures = [self.ai_hub.cache.get_or_submit(command, self.pipeline.submit) for command in commands]
+        return [future.result() for future in futures]
+
+    def stage_stats(self):
+        return self.pipeline.stats()
 
 # Example use:
-ai_scaler = ScalableExecution(ai_hub)
+ai_scaler = ScalableExecution(ai_hub, tracker=tracker)
 tasks = [{"task": "analyze"}, {"task": "optimize"}, {"task": "predict"}]
 results = ai_scaler.execute_parallel(tasks)
 print("Scalable Execution Results:", results)
+print("Stage Stats:", ai_scaler.stage_stats())
 from flask import Flask, request, jsonify
 
 app = Flask(__name__)
@@ -364,7 +411,7 @@ app = Flask(__name__)
 @app.route("/monitor", methods=["GET"])
 def system_status():
     operators_status = {name: op.status for name, op in ai_hub.operators.items()}
-    return jsonify({"AI_Operators_Status": operators_status})
+    return jsonify({"AI_Operators_Status": operators_status, "Result_Cache": ai_hub.cache.stats()})
 
 if __name__ == "__main__":
     app.run(port=5000, debug=True)
@@ -402,26 +449,26 @@ app = QApplication(sys.argv)
 gui = SlizzAIMGUI()
 gui.show()
 sys.exit(app.exec_())
-import time
+import logging
+
+import slizzai_logging
 
 class AIRecoveryManager:
+    """Reports failures and restarts published by the commander's OperatorSupervisor."""
+
     def __init__(self, ai_hub):
         self.ai_hub = ai_hub
+        ai_hub.supervisor.subscribe(self.on_transition)
 
-    def check_operator_health(self):
-        for name, operator in self.ai_hub.operators.items():
-            if operator.status == "FAILED":
-                print(f"Restarting {name} operator...")
-                operator.status = "ACTIVE"
-
-    def auto_recover(self):
-        while True:
-            time.sleep(5)  # Check every 5 seconds
-            self.check_operator_health()
+    def on_transition(self, name, old, new, error):
+        if new == "FAILED":
+            slizzai_logging.log_event("operator.restarting", logging.WARNING, operator=name, error=repr(error))
+        elif new == "OPEN":
+            # Keeps failing; calls are rejected until the cooldown ends
+            slizzai_logging.log_event("operator.circuit_open", logging.ERROR, operator=name)
 
 # Example Use:
 recovery_manager = AIRecoveryManager(ai_hub)
-recovery_manager.auto_recover()
 class UserPreferenceModel:
     def __init__(self):
         self.preferences = {}
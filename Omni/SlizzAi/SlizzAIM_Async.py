@@ -0,0 +1,149 @@
+# File: SlizzAIM_Async.py
+"""Asyncio-native operator protocol and ASGI endpoint for the SlizzAIM hub.
+
+Operators may implement the stage methods as coroutines (``async def
+process/transform/forecast/enhance/execute``); those run directly on the
+event loop, so many tasks interleave without a thread per stage. Legacy
+synchronous operators are wrapped in SyncOperatorAdapter, and consecutive
+legacy stages share a single hop onto a bounded thread pool.
+"""
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from SlizzAIM_Pipeline import STAGES
+
+
+def is_async_operator(operator):
+    """True if every stage method the operator has is a coroutine function."""
+    methods = [getattr(operator, method, None) for _, method in STAGES]
+    methods = [m for m in methods if m is not None]
+    return bool(methods) and all(inspect.iscoroutinefunction(m) for m in methods)
+
+
+class SyncOperatorAdapter:
+    """Expose a blocking operator through the async stage methods.
+
+    Calls are run on ``executor`` (the loop's default pool if None); any other
+    attribute, such as ``status`` or ``maintain_standby``, is passed through.
+    """
+
+    def __init__(self, operator, executor=None):
+        self.operator = operator
+        self.executor = executor
+
+    def __getattr__(self, name):
+        return getattr(self.operator, name)
+
+    async def _offload(self, method, value):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, getattr(self.operator, method), value)
+
+    async def process(self, value):
+        return await self._offload("process", value)
+
+    async def transform(self, value):
+        return await self._offload("transform", value)
+
+    async def forecast(self, value):
+        return await self._offload("forecast", value)
+
+    async def enhance(self, value):
+        return await self._offload("enhance", value)
+
+    async def execute(self, value):
+        return await self._offload("execute", value)
+
+
+def as_async(operator, executor=None):
+    if isinstance(operator, SyncOperatorAdapter) or is_async_operator(operator):
+        return operator
+    return SyncOperatorAdapter(operator, executor)
+
+
+class AsyncCommandHub:
+    """Run tasks through the five operator stages on one event loop.
+
+    ``offload_workers`` bounds the threads used for legacy operators and
+    ``max_concurrency`` (if set) bounds how many tasks are in flight at once.
+    """
+
+    def __init__(self, operators, offload_workers=8, max_concurrency=None):
+        self.executor = ThreadPoolExecutor(max_workers=offload_workers, thread_name_prefix="slizzaim-offload")
+        self.operators = {name: as_async(op, self.executor) for name, op in operators.items()}
+        self._limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._segments = self._plan()
+
+    def _plan(self):
+        # Group adjacent legacy stages so a task makes one thread hop per run of them
+        segments = []
+        for name, method in STAGES:
+            operator = self.operators[name]
+            blocking = isinstance(operator, SyncOperatorAdapter)
+            if blocking and segments and segments[-1][0]:
+                segments[-1][1].append((operator.operator, method))
+            elif blocking:
+                segments.append((True, [(operator.operator, method)]))
+            else:
+                segments.append((False, [(operator, method)]))
+        return segments
+
+    @staticmethod
+    def _run_blocking(steps, value):
+        for operator, method in steps:
+            value = getattr(operator, method)(value)
+        return value
+
+    async def _run(self, task):
+        loop = asyncio.get_running_loop()
+        value = task
+        for blocking, steps in self._segments:
+            if blocking:
+                value = await loop.run_in_executor(self.executor, self._run_blocking, steps, value)
+            else:
+                operator, method = steps[0]
+                value = await getattr(operator, method)(value)
+        return value
+
+    async def handle(self, task):
+        if self._limit is None:
+            return await self._run(task)
+        async with self._limit:
+            return await self._run(task)
+
+    async def handle_many(self, tasks):
+        return await asyncio.gather(*(self.handle(task) for task in tasks))
+
+    def operator_status(self):
+        return {name: getattr(op, "status", "UNKNOWN") for name, op in self.operators.items()}
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def create_asgi_app(hub, handle=None):
+    """FastAPI app serving ``/execute`` and ``/monitor`` from an AsyncCommandHub.
+
+    ``handle`` replaces ``hub.handle`` for commanders that do extra work per
+    task, such as logging it to a tracker first.
+    """
+    handle = handle or hub.handle
+    from fastapi import Body, FastAPI
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        hub.close()
+
+    app = FastAPI(title="SlizzAIM", lifespan=lifespan)
+
+    @app.post("/execute")
+    async def execute_command(task: dict = Body(...)):
+        return {"result": await handle(task)}
+
+    @app.get("/monitor")
+    async def system_status():
+        return {"AI_Operators_Status": hub.operator_status()}
+
+    return app
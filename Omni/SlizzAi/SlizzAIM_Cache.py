@@ -0,0 +1,181 @@
+# File: SlizzAIM_Cache.py
+"""Result cache in front of the SlizzAIM command handlers.
+
+Results are keyed on a hash of the canonical JSON of the task payload, expire
+after a TTL chosen per task type, and are evicted least-recently-used beyond
+``max_entries``. Concurrent identical requests are coalesced so only the first
+one computes; the rest wait for its result.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+def task_key(task):
+    """Stable content hash of a task payload, independent of key order."""
+    canonical = json.dumps(task, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """TTL + LRU cache with single-flight computation.
+
+    ``ttls`` maps a task type (``task["task"]``) to seconds; other types use
+    ``default_ttl``. A TTL of 0 or None disables caching for that type, which
+    suits commands with side effects. Results are returned as-is, not copied,
+    so every caller of a cached task shares one object and must not mutate it.
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=30.0, ttls=None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self._entries = OrderedDict()  # key -> (expires_at, result)
+        self._inflight = {}  # key -> Future of the computing request
+        self._fills = set()  # running aget_or_compute fills
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.coalesced = self.evictions = self.expirations = 0
+
+    def ttl_for(self, task):
+        kind = task.get("task") if isinstance(task, dict) else None
+        return self.ttls.get(kind, self.default_ttl)
+
+    def _lookup(self, key):
+        """Return (hit, result, future, leader) under the lock."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[1], None, False
+                del self._entries[key]
+                self.expirations += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return False, None, future, False
+            self.misses += 1
+            future = self._inflight[key] = Future()
+            return False, None, future, True
+
+    def _finish(self, key, future, ttl, result=None, error=None):
+        with self._lock:
+            del self._inflight[key]
+            if error is None:
+                self._entries[key] = (time.monotonic() + ttl, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def get_or_compute(self, task, compute):
+        """Return the cached result for ``task`` or compute it once."""
+        ttl = self.ttl_for(task)
+        if not ttl:
+            return compute(task)
+        key = task_key(task)
+        hit, result, future, leader = self._lookup(key)
+        if hit:
+            return result
+        if not leader:
+            return future.result()
+        try:
+            result = compute(task)
+        except Exception as e:
+            self._finish(key, future, ttl, error=e)
+            raise
+        self._finish(key, future, ttl, result)
+        return result
+
+    def get_or_submit(self, task, submit):
+        """Future-returning variant; ``submit(task)`` starts the work and returns a Future.
+
+        Lets a caller queue many tasks at once, e.g. on a StagedPipeline,
+        while still sharing cached and in-flight results.
+        """
+        ttl = self.ttl_for(task)
+        if not ttl:
+            return submit(task)
+        key = task_key(task)
+        hit, result, future, leader = self._lookup(key)
+        if hit:
+            future = Future()
+            future.set_result(result)
+            return future
+        if not leader:
+            return future
+
+        def finish(inner):
+            error = inner.exception()
+            self._finish(key, future, ttl, None if error else inner.result(), error)
+
+        try:
+            submit(task).add_done_callback(finish)
+        except Exception as e:
+            self._finish(key, future, ttl, error=e)
+            raise
+        return future
+
+    async def aget_or_compute(self, task, compute):
+        """Async variant; ``compute`` is a coroutine function.
+
+        The fill runs as its own task and every caller waits on it through
+        ``asyncio.shield``, so cancelling one caller, leader or not, leaves
+        the others waiting.
+        """
+        ttl = self.ttl_for(task)
+        if not ttl:
+            return await compute(task)
+        key = task_key(task)
+        hit, result, future, leader = self._lookup(key)
+        if hit:
+            return result
+        if leader:
+            fill = asyncio.ensure_future(self._fill(key, future, ttl, task, compute))
+            self._fills.add(fill)  # the loop only keeps weak references to tasks
+            fill.add_done_callback(self._fills.discard)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    async def _fill(self, key, future, ttl, task, compute):
+        # Reports only through ``future``, so a failure nobody is left waiting for is not logged
+        try:
+            result = await compute(task)
+        except Exception as e:
+            self._finish(key, future, ttl, error=e)
+        except BaseException as e:
+            self._finish(key, future, ttl, error=e)
+            raise
+        else:
+            self._finish(key, future, ttl, result)
+
+    def invalidate(self, task=None):
+        """Drop one task's result, or everything if ``task`` is None."""
+        with self._lock:
+            if task is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(task_key(task), None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
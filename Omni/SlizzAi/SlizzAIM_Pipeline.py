@@ -0,0 +1,132 @@
+# File: SlizzAIM_Pipeline.py
+"""Staged, concurrent execution of the five SlizzAIM operators.
+
+Each operator stage has its own worker threads and a bounded input queue, so
+while one task is being forecast the next can already be analyzed. A full
+queue blocks the stage feeding it, which is reported as backpressure.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+# (operator name, method) in the order command_handler calls them
+STAGES = [
+    ("analyzer", "process"),
+    ("processor", "transform"),
+    ("predictor", "forecast"),
+    ("optimizer", "enhance"),
+    ("executor", "execute"),
+]
+
+_STOP = object()
+
+
+class StageStats:
+    """Counters for one pipeline stage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, busy, blocked=0.0, failed=False):
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.processed += 1
+            self.busy_seconds += busy
+            self.blocked_seconds += blocked
+
+
+class StagedPipeline:
+    """Run tasks through the operator stages with one worker pool per stage.
+
+    ``workers`` is the number of threads per stage, either an int for every
+    stage or a dict keyed by operator name. ``queue_size`` bounds each
+    stage's input queue; submit() blocks once the first stage is full.
+    """
+
+    def __init__(self, operators, stages=STAGES, workers=1, queue_size=64):
+        self.operators = operators
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self.stats_by_stage = [StageStats(name) for name, _ in stages]
+        self.started = time.monotonic()
+        self._threads = []
+        for index, (name, _) in enumerate(stages):
+            count = workers.get(name, 1) if isinstance(workers, dict) else workers
+            threads = [
+                threading.Thread(target=self._work, args=(index,), name=f"slizzaim-{name}-{n}", daemon=True)
+                for n in range(count)
+            ]
+            for thread in threads:
+                thread.start()
+            self._threads.append(threads)
+
+    def submit(self, task):
+        """Queue a task and return a Future for the executor's result."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self.queues[0].put((future, task))
+        return future
+
+    def map(self, tasks):
+        """Run tasks concurrently through the stages; results come back in order."""
+        return [future.result() for future in [self.submit(task) for task in tasks]]
+
+    def stats(self):
+        """Per-stage throughput, utilisation, queue depth and backpressure."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        report = {}
+        for index, ((name, _), stats) in enumerate(zip(self.stages, self.stats_by_stage)):
+            workers = len(self._threads[index])
+            report[name] = {
+                "processed": stats.processed,
+                "failed": stats.failed,
+                "throughput_per_s": stats.processed / elapsed,
+                "avg_service_ms": 1000 * stats.busy_seconds / max(stats.processed + stats.failed, 1),
+                "utilization": stats.busy_seconds / (elapsed * workers),
+                "queue_depth": self.queues[index].qsize(),
+                "queue_capacity": self.queues[index].maxsize,
+                "backpressure_s": stats.blocked_seconds,
+            }
+        return report
+
+    def shutdown(self):
+        """Drain queued tasks, then stop the stages one after another."""
+        for index, threads in enumerate(self._threads):
+            for _ in threads:
+                self.queues[index].put(_STOP)
+            for thread in threads:
+                thread.join()
+
+    def _work(self, index):
+        name, method = self.stages[index]
+        handler = getattr(self.operators[name], method)
+        stats = self.stats_by_stage[index]
+        last = index == len(self.stages) - 1
+        while True:
+            item = self.queues[index].get()
+            if item is _STOP:
+                return
+            future, value = item
+            start = time.perf_counter()
+            try:
+                result = handler(value)
+            except Exception as e:
+                stats.record(time.perf_counter() - start, failed=True)
+                future.set_exception(e)
+                continue
+            busy = time.perf_counter() - start
+            if last:
+                stats.record(busy)
+                future.set_result(result)
+                continue
+            put_at = time.perf_counter()
+            self.queues[index + 1].put((future, result))
+            stats.record(busy, time.perf_counter() - put_at)
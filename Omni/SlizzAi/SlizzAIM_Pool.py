@@ -0,0 +1,187 @@
+# File: SlizzAIM_Pool.py
+"""Lazily built, bounded pools of SlizzAIM operator instances.
+
+A pool builds nothing until its first call and grows up to ``size``
+instances under load. Instances idle for ``idle_timeout`` seconds are put
+into standby: operators with an ``unload()`` method are asked to release (or
+offload) their model and are kept, others are dropped and rebuilt on demand.
+The idle check is a timer armed only while loaded instances sit idle.
+
+An instance that raises OperatorFailure (or reports a FAILED status) is
+evicted on its own and the call is retried once on another instance; the
+rest of the pool stays loaded. Other exceptions leave the instance in the pool.
+"""
+import threading
+import time
+
+from SlizzAIM_Pipeline import STAGES
+from SlizzAIM_Supervisor import OperatorFailure
+
+DEFAULT_POOL_CONFIG = {"size": 1, "idle_timeout": 300.0}
+
+
+class LazyOperatorPool:
+    """Behaves like a single operator; each stage call borrows one instance."""
+
+    def __init__(self, factory, size=1, idle_timeout=300.0):
+        self.factory = factory
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._cond = threading.Condition()
+        self._idle = []  # [(instance, last_used, loaded)], most recently used last
+        self._created = 0
+        self._busy = 0
+        self._timer = None
+        self.builds = 0
+        self.unloads = 0
+        self.evictions = 0
+        self.unload_errors = 0
+
+    @classmethod
+    def from_config(cls, factory, config=None):
+        return cls(factory, **{**DEFAULT_POOL_CONFIG, **(config or {})})
+
+    def __getattr__(self, method):
+        if method not in {m for _, m in STAGES}:
+            raise AttributeError(method)
+        return lambda value: self._call(method, value)
+
+    @property
+    def status(self):
+        with self._cond:
+            if self._busy:
+                return "ACTIVE"
+            return "WARM" if any(loaded for _, _, loaded in self._idle) else "STANDBY"
+
+    def maintain_standby(self):
+        """Unload every idle instance now, regardless of the idle timeout."""
+        self._reap(force=True)
+
+    def warm(self):
+        """Build one instance and load its model now, so the first call doesn't pay for it.
+
+        The instance is not put on the idle timer until it has served a call,
+        which keeps a warm standby pool warm.
+        """
+        instance = self._acquire()
+        try:
+            load = getattr(instance, "load", None)
+            if load is not None:
+                load()
+        except Exception:
+            self._discard()
+            raise
+        self._release(instance, arm=False)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "busy": self._busy,
+                "idle": len(self._idle),
+                "loaded": self._busy + sum(1 for _, _, loaded in self._idle if loaded),
+                "builds": self.builds,
+                "unloads": self.unloads,
+                "evictions": self.evictions,
+                "unload_errors": self.unload_errors,
+            }
+
+    def _call(self, method, value):
+        for attempt in range(2):
+            instance = self._acquire()
+            try:
+                result = getattr(instance, method)(value)
+            except Exception as e:
+                if not isinstance(e, OperatorFailure) and getattr(instance, "status", None) != "FAILED":
+                    self._release(instance)
+                    raise
+                self._discard()
+                if attempt:
+                    if isinstance(e, OperatorFailure):
+                        raise
+                    raise OperatorFailure(str(e)) from e
+                continue
+            self._release(instance)
+            return result
+
+    def _acquire(self):
+        with self._cond:
+            while not self._idle and self._created >= self.size:
+                self._cond.wait()
+            self._busy += 1
+            if self._idle:
+                return self._idle.pop()[0]
+            self._created += 1
+        try:
+            instance = self.factory()
+        except Exception as e:
+            with self._cond:
+                self._created -= 1
+                self._busy -= 1
+                self._cond.notify()
+            raise OperatorFailure(f"could not build an instance: {e}") from e
+        with self._cond:
+            self.builds += 1
+        return instance
+
+    def _release(self, instance, arm=True):
+        with self._cond:
+            self._busy -= 1
+            # A warmed instance that has never served a call has no last use, so the timer skips it
+            self._idle.append((instance, time.monotonic() if arm else None, True))
+            self._cond.notify()
+            if arm and self._timer is None and self.idle_timeout:
+                self._arm(self.idle_timeout)
+
+    def _discard(self):
+        # Evict the failed instance only; the next call builds a fresh one
+        with self._cond:
+            self._busy -= 1
+            self._created -= 1
+            self.evictions += 1
+            self._cond.notify()
+
+    def _arm(self, delay):
+        self._timer = threading.Timer(delay, self._reap)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _reap(self, force=False):
+        now = time.monotonic()
+        to_unload = []
+        with self._cond:
+            if not force:
+                self._timer = None
+            kept, next_expiry = [], None
+            for instance, last_used, loaded in self._idle:
+                expires = last_used + self.idle_timeout if last_used is not None and self.idle_timeout else None
+                if loaded and (force or (expires is not None and expires <= now)):
+                    # Held out of the idle list while unloading so no call can borrow it
+                    to_unload.append((instance, last_used))
+                else:
+                    kept.append((instance, last_used, loaded))
+                    if loaded and expires is not None:
+                        next_expiry = expires if next_expiry is None else min(next_expiry, expires)
+            self._idle = kept
+            self.unloads += len(to_unload)
+            if next_expiry is not None and self._timer is None:
+                self._arm(max(next_expiry - now, 0.0))
+        for instance, last_used in to_unload:
+            unload = getattr(instance, "unload", None)
+            unloaded = False
+            try:
+                if unload is not None:
+                    unload()
+                    unloaded = True
+            except Exception:
+                # An instance that can't unload cleanly is dropped, not reused
+                with self._cond:
+                    self.unload_errors += 1
+            finally:
+                with self._cond:
+                    if unloaded:
+                        self._idle.insert(0, (instance, last_used, False))
+                    else:
+                        self._created -= 1
+                    self._cond.notify()
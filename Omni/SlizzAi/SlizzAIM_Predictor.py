@@ -0,0 +1,113 @@
+# File: SlizzAIM_Predictor.py
+"""Online next-command prediction for the SlizzAIM trackers.
+
+Keeps decayed Markov counts of which command followed each of the last
+1..``order`` commands, plus plain command frequencies as the fallback. Each
+observed command touches ``order + 1`` counters, so the cost per command does
+not depend on how much history has been seen.
+"""
+import heapq
+import threading
+from collections import deque
+
+# Rescale the stored weights once the per-event increment grows past this
+_RESCALE_AT = 1e12
+
+
+class NextCommandPredictor:
+    """Decayed n-gram counts with backoff to shorter contexts.
+
+    ``decay`` is applied per observed command, so with 0.999 a command seen
+    1000 commands ago counts about a third as much as the latest one.
+    Instead of decaying every counter, new events are added with a growing
+    weight; the counters are rescaled on the rare occasion it gets too large.
+    """
+
+    def __init__(self, order=2, decay=0.999, min_weight=1e-3):
+        self.order = order
+        self.decay = decay
+        self.min_weight = min_weight
+        self.recent = deque(maxlen=order)
+        # context tuple -> {next command: weight}; () holds plain frequencies
+        self.table = {}
+        self._increment = 1.0
+        self._lock = threading.Lock()
+        self._refit_thread = None
+        self._refit_stop = threading.Event()
+
+    def seed(self, counts):
+        """Start the frequency fallback from previously persisted counts."""
+        with self._lock:
+            successors = self.table.setdefault((), {})
+            for command, count in counts.items():
+                successors[command] = successors.get(command, 0.0) + count * self._increment
+
+    def observe(self, command):
+        with self._lock:
+            self._increment /= self.decay
+            history = tuple(self.recent)
+            for n in range(len(history) + 1):
+                successors = self.table.setdefault(history[len(history) - n:], {})
+                successors[command] = successors.get(command, 0.0) + self._increment
+            self.recent.append(command)
+            if self._increment > _RESCALE_AT:
+                self._rescale()
+
+    def suggest(self, k=5):
+        """Top-k likely next commands, longest matching context first."""
+        with self._lock:
+            history = tuple(self.recent)
+            picked = []
+            for n in range(len(history), -1, -1):
+                successors = self.table.get(history[len(history) - n:])
+                if not successors:
+                    continue
+                for command in heapq.nlargest(k, successors, key=successors.get):
+                    if command not in picked:
+                        picked.append(command)
+                if len(picked) >= k:
+                    break
+            return picked[:k]
+
+    def predict(self):
+        suggestions = self.suggest(1)
+        return suggestions[0] if suggestions else None
+
+    def refit(self):
+        """Rescale weights and drop entries that have decayed to nothing."""
+        with self._lock:
+            self._rescale()
+            floor = self.min_weight
+            for context in list(self.table):
+                successors = self.table[context]
+                for command in [c for c, w in successors.items() if w < floor]:
+                    del successors[command]
+                if not successors:
+                    del self.table[context]
+
+    def start_refit(self, interval=300.0):
+        """Run refit() every ``interval`` seconds on a daemon thread."""
+        if self._refit_thread is not None:
+            return
+        self._refit_stop.clear()
+
+        def loop():
+            while not self._refit_stop.wait(interval):
+                self.refit()
+
+        self._refit_thread = threading.Thread(target=loop, name="slizzaim-refit", daemon=True)
+        self._refit_thread.start()
+
+    def stop_refit(self):
+        if self._refit_thread is None:
+            return
+        self._refit_stop.set()
+        self._refit_thread.join()
+        self._refit_thread = None
+
+    def _rescale(self):
+        scale = 1.0 / self._increment
+        for successors in self.table.values():
+            for command in successors:
+                successors[command] *= scale
+        self._increment = 1.0
@@ -0,0 +1,155 @@
+# File: SlizzAIM_Store.py
+"""Append-only command counts for the SlizzAIM trackers.
+
+log_command() only bumps an in-memory counter and queues an event; a
+background thread appends queued events to ``<filename>.log`` in groups with
+one fsync per group. Once the log grows past ``compact_every`` events it is
+folded into an atomically replaced snapshot at ``<filename>``. On startup the
+snapshot is loaded and the log replayed; a torn final line is cut off before
+anything new is appended.
+"""
+import atexit
+import json
+import os
+import queue
+import threading
+
+SNAPSHOT_VERSION = 1
+
+_STOP = object()
+
+
+class CommandStore:
+    """Command -> count mapping persisted as snapshot plus event log.
+
+    ``counts`` is the live dict the trackers read from. Writes are group
+    committed every ``flush_interval`` seconds, or sooner once ``max_batch``
+    events are waiting.
+    """
+
+    def __init__(self, filename, flush_interval=0.05, max_batch=1000, compact_every=10000):
+        self.filename = filename
+        self.log_filename = filename + ".log"
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._seq, snapshot_seq, counts, valid_bytes = self._load()
+        # The writer's own view of what is on disk, used to write snapshots
+        self._persisted = dict(counts)
+        self._persisted_seq = self._seq
+        self._log_events = self._seq - snapshot_seq
+        self.counts = counts
+        self._log = open(self.log_filename, "a", encoding="utf-8")
+        if self._log.tell() > valid_bytes:
+            self._log.truncate(valid_bytes)
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="slizzaim-store", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def increment(self, command):
+        with self._lock:
+            self._seq += 1
+            self.counts[command] = self.counts.get(command, 0) + 1
+            self._queue.put((self._seq, command))
+
+    def flush(self):
+        """Block until every event queued so far is on disk; a no-op once closed."""
+        done = threading.Event()
+        with self._lock:
+            if self._closed:
+                return  # close() already wrote everything
+            self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        """Write outstanding events, compact the log and stop the writer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._writer.join()
+        atexit.unregister(self.close)
+
+    def _load(self):
+        counts, snapshot_seq = {}, 0
+        try:
+            with open(self.filename, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if isinstance(data.get("version"), int) and isinstance(data.get("counts"), dict):
+                counts, snapshot_seq = data["counts"], data["seq"]
+            else:
+                counts = data  # legacy flat {command: count} file
+        except FileNotFoundError:
+            pass
+        seq, valid_bytes = snapshot_seq, 0
+        try:
+            with open(self.log_filename, "rb") as file:
+                for line in file:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated line")
+                        event_seq, command = json.loads(line)
+                    except ValueError:
+                        break  # torn write from a crash; nothing after it was committed
+                    valid_bytes += len(line)
+                    if event_seq > snapshot_seq:
+                        counts[command] = counts.get(command, 0) + 1
+                        seq = max(seq, event_seq)
+        except FileNotFoundError:
+            pass
+        return seq, snapshot_seq, counts, valid_bytes
+
+    def _write_loop(self):
+        while True:
+            batch, waiters, stop = [], [], False
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get(timeout=self.flush_interval if batch and not waiters else 0)
+                except queue.Empty:
+                    break
+            if batch:
+                self._append(batch)
+            if stop or self._log_events >= self.compact_every:
+                self._compact()
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                self._log.close()
+                return
+
+    def _append(self, batch):
+        self._log.write("".join(json.dumps([seq, command]) + "\n" for seq, command in batch))
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        for seq, command in batch:
+            self._persisted[command] = self._persisted.get(command, 0) + 1
+        self._persisted_seq = batch[-1][0]
+        self._log_events += len(batch)
+
+    def _compact(self):
+        if not self._log_events:
+            return
+        snapshot = {"version": SNAPSHOT_VERSION, "seq": self._persisted_seq, "counts": self._persisted}
+        tmp = self.filename + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, self.filename)
+        # Events up to seq are now in the snapshot, so replaying a stale log is harmless
+        self._log.truncate(0)
+        self._log.seek(0)
+        self._log_events = 0
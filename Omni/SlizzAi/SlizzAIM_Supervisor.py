@@ -0,0 +1,270 @@
+# File: SlizzAIM_Supervisor.py
+"""Event-driven supervision of the SlizzAIM operators.
+
+Each operator slot keeps an active instance and a warm standby (instances
+with a ``warm()`` method, such as LazyOperatorPool, are warmed when built as a
+standby or as a replacement). A failure,
+either a stage call raising OperatorFailure or an operator publishing a
+FAILED status, promotes the standby at once and retries the in-flight task on
+it, while a replacement standby is built in the background with exponential
+backoff. Too many failures inside ``window`` seconds open a circuit breaker
+that rejects calls until ``cooldown`` has passed. Any other exception, such as
+a ValueError from bad input, says nothing about the instance's health: it is
+re-raised without a retry and not counted. Nothing polls.
+"""
+import threading
+import time
+
+from SlizzAIM_Pipeline import STAGES
+
+CLOSED, OPEN, HALF_OPEN = "CLOSED", "OPEN", "HALF_OPEN"
+
+
+class OperatorUnavailable(RuntimeError):
+    """No healthy instance of an operator can take the call."""
+
+
+class OperatorFailure(RuntimeError):
+    """Raised by an operator instance that can no longer serve calls, e.g. its model failed to load."""
+
+
+class ObservableStatus:
+    """Mixin for operators: assigning ``self.status`` notifies subscribers."""
+
+    @property
+    def status(self):
+        return self.__dict__.get("_status", "STANDBY")
+
+    @status.setter
+    def status(self, value):
+        old = self.__dict__.get("_status")
+        self.__dict__["_status"] = value
+        if old != value:
+            for listener in self.__dict__.get("_status_listeners", ()):
+                listener(self, old, value)
+
+    def add_status_listener(self, listener):
+        self.__dict__.setdefault("_status_listeners", []).append(listener)
+
+
+class _Slot:
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+        self.active = None
+        self.standby = None
+        self.failures = []  # monotonic timestamps inside the window
+        self.circuit = CLOSED
+        self.opened_at = 0.0
+        self.restarting = False
+        self.restarts = 0
+
+
+class SupervisedOperator:
+    """Stand-in for one operator in ``commander.operators``."""
+
+    def __init__(self, supervisor, name):
+        self._supervisor = supervisor
+        self._name = name
+
+    @property
+    def status(self):
+        return self._supervisor.status(self._name)
+
+    def maintain_standby(self):
+        # Only the active instance; the standby stays warm for failover
+        self._supervisor.for_each_instance(self._name, "maintain_standby", standby=False)
+
+    def __getattr__(self, method):
+        if method not in {m for _, m in STAGES}:
+            raise AttributeError(method)
+        return lambda value: self._supervisor.call(self._name, method, value)
+
+
+class OperatorSupervisor:
+    """Own operator instances built from ``factories`` (name -> callable).
+
+    ``operators`` is a dict of SupervisedOperator proxies that can replace a
+    commander's operators dict. subscribe() receives every published
+    transition as ``(name, old_status, new_status, error)``.
+    """
+
+    def __init__(self, factories, max_failures=5, window=60.0, base_backoff=0.5,
+                 max_backoff=30.0, cooldown=30.0, standby=True):
+        self.max_failures = max_failures
+        self.window = window
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.cooldown = cooldown
+        self.keep_standby = standby
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._timers = set()
+        self._slots = {name: _Slot(name, factory) for name, factory in factories.items()}
+        for slot in self._slots.values():
+            slot.active = self._build(slot)
+            if standby:
+                slot.standby = self._build(slot, warm=True)
+        self.operators = {name: SupervisedOperator(self, name) for name in self._slots}
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def publish(self, name, old, new, error=None):
+        for listener in self._listeners:
+            listener(name, old, new, error)
+
+    def status(self, name):
+        slot = self._slots[name]
+        with self._lock:
+            if slot.circuit == OPEN:
+                return "CIRCUIT_OPEN"
+            if slot.active is None:
+                return "RESTARTING"
+            return getattr(slot.active, "status", "ACTIVE")
+
+    def health(self):
+        with self._lock:
+            return {
+                name: {
+                    "status": self.status(name),
+                    "circuit": slot.circuit,
+                    "standby_ready": slot.standby is not None,
+                    "recent_failures": len(slot.failures),
+                    "restarts": slot.restarts,
+                    "pool": slot.active.stats() if hasattr(slot.active, "stats") else None,
+                }
+                for name, slot in self._slots.items()
+            }
+
+    def for_each_instance(self, name, method, standby=True):
+        slot = self._slots[name]
+        with self._lock:
+            instances = [i for i in (slot.active, slot.standby if standby else None) if i is not None]
+        for instance in instances:
+            getattr(instance, method)()
+
+    def call(self, name, method, value):
+        """Run a stage on the active instance, failing over to the standby once if it breaks."""
+        slot = self._slots[name]
+        for attempt in range(2):
+            instance = self._acquire(slot)
+            try:
+                result = getattr(instance, method)(value)
+            except Exception as e:
+                if not isinstance(e, OperatorFailure) and getattr(instance, "status", None) != "FAILED":
+                    raise  # the instance is fine, and a retry would run a non-idempotent stage twice
+                self._on_failure(slot, instance, e)
+                if attempt:
+                    raise
+                continue
+            self._on_success(slot)
+            return result
+
+    def shutdown(self):
+        with self._lock:
+            timers, self._timers = self._timers, set()
+        for timer in timers:
+            timer.cancel()
+
+    def _acquire(self, slot):
+        with self._lock:
+            if slot.circuit == OPEN:
+                raise OperatorUnavailable(f"{slot.name}: circuit open after repeated failures")
+            if slot.active is None:
+                raise OperatorUnavailable(f"{slot.name}: restarting, no standby ready")
+            return slot.active
+
+    def _build(self, slot, warm=False):
+        instance = slot.factory()
+        if warm and hasattr(instance, "warm"):
+            instance.warm()
+        if isinstance(instance, ObservableStatus):
+            instance.add_status_listener(lambda inst, old, new: self._on_status(slot, inst, old, new))
+        return instance
+
+    def _on_status(self, slot, instance, old, new):
+        self.publish(slot.name, old, new)
+        if new == "FAILED":
+            self._on_failure(slot, instance, None, announce=False)
+
+    def _on_success(self, slot):
+        if slot.circuit == HALF_OPEN:
+            with self._lock:
+                slot.circuit = CLOSED
+                slot.failures.clear()
+            self.publish(slot.name, HALF_OPEN, CLOSED)
+
+    def _on_failure(self, slot, instance, error, announce=True):
+        now = time.monotonic()
+        with self._lock:
+            if instance is not slot.active and instance is not slot.standby:
+                return  # already replaced
+            slot.failures = [t for t in slot.failures if now - t < self.window] + [now]
+            if instance is slot.standby:
+                slot.standby = None
+            else:
+                slot.active, slot.standby = slot.standby, None
+            previous = slot.circuit
+            trip = previous == HALF_OPEN or len(slot.failures) >= self.max_failures
+            if trip:
+                slot.circuit, slot.opened_at = OPEN, now
+                delay = self.cooldown
+            else:
+                delay = self._backoff(slot)
+        if announce:
+            self.publish(slot.name, "ACTIVE", "FAILED", error)
+        if trip:
+            self.publish(slot.name, previous, OPEN, error)
+        self._schedule_restart(slot, delay)
+
+    def _backoff(self, slot):
+        # First failure in the window restarts immediately, then 0.5s, 1s, 2s...
+        n = len(slot.failures) - 1
+        return 0.0 if n == 0 else min(self.base_backoff * 2 ** (n - 1), self.max_backoff)
+
+    def _schedule_restart(self, slot, delay):
+        with self._lock:
+            if slot.restarting:
+                return
+            slot.restarting = True
+        timer_box = []
+        timer = threading.Timer(delay, self._restart, args=(slot, timer_box))
+        timer_box.append(timer)
+        timer.daemon = True
+        with self._lock:
+            self._timers.add(timer)
+        timer.start()
+
+    def _restart(self, slot, timer_box):
+        with self._lock:
+            self._timers.discard(timer_box[0])
+            wait = slot.opened_at + self.cooldown - time.monotonic() if slot.circuit == OPEN else 0
+            if wait > 0:
+                slot.restarting = False
+        if wait > 0:
+            self._schedule_restart(slot, wait)
+            return
+        try:
+            instance = self._build(slot, warm=True)
+        except Exception as e:
+            with self._lock:
+                slot.restarting = False
+                slot.failures.append(time.monotonic())
+                delay = self._backoff(slot)
+            self.publish(slot.name, "RESTARTING", "FAILED", e)
+            self._schedule_restart(slot, delay)
+            return
+        with self._lock:
+            slot.restarting = False
+            slot.restarts += 1
+            if slot.circuit == OPEN:
+                slot.circuit = HALF_OPEN
+            if slot.active is None:
+                slot.active = instance
+            elif slot.standby is None:
+                slot.standby = instance
+            needs_more = self.keep_standby and slot.standby is None
+        self.publish(slot.name, "RESTARTING", "READY")
+        if needs_more:
+            self._schedule_restart(slot, 0.0)
@@ -0,0 +1,196 @@
+# File: SlizzAIM_Telemetry.py
+"""Process and host telemetry read straight from /proc.
+
+TelemetryCollector samples CPU, memory, RSS, network and file descriptor use
+into fixed-size ring buffers, keeps a rolling window of real request
+latencies, and shortens its sampling interval while the system is under
+pressure (and relaxes it again once things are calm).
+"""
+import os
+import resource
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _read(path):
+    with open(path, "r") as file:
+        return file.read()
+
+
+def read_cpu_times():
+    """(busy, total) jiffies across all CPUs from /proc/stat."""
+    fields = [int(v) for v in _read("/proc/stat").split("\n", 1)[0].split()[1:]]
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)  # idle + iowait
+    return sum(fields) - idle, sum(fields)
+
+
+def read_process_cpu_seconds(pid="self"):
+    # Fields after the ")" that ends the command name; utime and stime are 14 and 15
+    fields = _read(f"/proc/{pid}/stat").rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def read_rss_bytes(pid="self"):
+    return int(_read(f"/proc/{pid}/statm").split()[1]) * PAGE_SIZE
+
+
+def read_meminfo():
+    info = {}
+    for line in _read("/proc/meminfo").splitlines():
+        key, value = line.split(":", 1)
+        info[key] = int(value.split()[0]) * 1024
+    return info
+
+
+def read_net_counters():
+    """Summed rx/tx bytes, packets, errors and drops over non-loopback interfaces."""
+    totals = dict.fromkeys(["rx_bytes", "rx_packets", "rx_errs", "rx_drop",
+                            "tx_bytes", "tx_packets", "tx_errs", "tx_drop"], 0)
+    for line in _read("/proc/net/dev").splitlines()[2:]:
+        name, data = line.split(":", 1)
+        if name.strip() == "lo":
+            continue
+        v = [int(x) for x in data.split()]
+        for key, value in zip(totals, (v[0], v[1], v[2], v[3], v[8], v[9], v[10], v[11])):
+            totals[key] += value
+    return totals
+
+
+def count_open_fds(pid="self"):
+    return len(os.listdir(f"/proc/{pid}/fd"))
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = (len(sorted_values) - 1) * q / 100
+    low = int(index)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (index - low)
+
+
+class TelemetryCollector:
+    """Sample /proc every ``interval`` seconds into ring buffers.
+
+    While a sample is "hot" (CPU or memory above ``hot_percent``, or p95
+    latency above ``latency_target_ms``) the interval halves down to
+    ``min_interval``; each calm sample doubles it back up to ``interval``.
+    """
+
+    def __init__(self, interval=5.0, min_interval=0.5, history=720, latency_window=60.0,
+                 latency_capacity=10000, hot_percent=85.0, latency_target_ms=None):
+        self.base_interval = interval
+        self.min_interval = min_interval
+        self.interval = interval
+        self.latency_window = latency_window
+        self.hot_percent = hot_percent
+        self.latency_target_ms = latency_target_ms
+        self.samples = deque(maxlen=history)
+        self.latencies = deque(maxlen=latency_capacity)  # (monotonic time, ms)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._previous = None
+
+    def record_latency(self, ms):
+        with self._lock:
+            self.latencies.append((time.monotonic(), ms))
+
+    @contextmanager
+    def time_request(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_latency((time.perf_counter() - start) * 1000)
+
+    def latency_percentiles(self):
+        cutoff = time.monotonic() - self.latency_window
+        with self._lock:
+            values = sorted(ms for t, ms in self.latencies if t >= cutoff)
+        return {"count": len(values), "p50": percentile(values, 50), "p95": percentile(values, 95)}
+
+    def sample(self):
+        """Take one sample, append it to the ring buffer and return it."""
+        now = time.monotonic()
+        busy, total = read_cpu_times()
+        process_cpu = read_process_cpu_seconds()
+        net = read_net_counters()
+        meminfo = read_meminfo()
+        soft_fd_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        open_fds = count_open_fds()
+        sample = {
+            "time": time.time(),
+            "cpu_percent": None,
+            "process_cpu_percent": None,
+            "memory_percent": 100.0 * (1 - meminfo["MemAvailable"] / meminfo["MemTotal"]),
+            "rss_bytes": read_rss_bytes(),
+            "open_fds": open_fds,
+            "fd_percent": 100.0 * open_fds / soft_fd_limit if soft_fd_limit > 0 else 0.0,
+            "rx_bytes_per_s": None,
+            "tx_bytes_per_s": None,
+            "net_error_percent": 0.0,
+        }
+        if self._previous is not None:
+            p_now, p_busy, p_total, p_process, p_net = self._previous
+            elapsed = max(now - p_now, 1e-9)
+            sample["cpu_percent"] = 100.0 * (busy - p_busy) / max(total - p_total, 1)
+            sample["process_cpu_percent"] = 100.0 * (process_cpu - p_process) / elapsed
+            sample["rx_bytes_per_s"] = (net["rx_bytes"] - p_net["rx_bytes"]) / elapsed
+            sample["tx_bytes_per_s"] = (net["tx_bytes"] - p_net["tx_bytes"]) / elapsed
+            packets = sum(net[k] - p_net[k] for k in ("rx_packets", "tx_packets"))
+            bad = sum(net[k] - p_net[k] for k in ("rx_errs", "rx_drop", "tx_errs", "tx_drop"))
+            sample["net_error_percent"] = 100.0 * bad / packets if packets else 0.0
+        self._previous = (now, busy, total, process_cpu, net)
+        sample.update({f"latency_{k}_ms": v for k, v in self.latency_percentiles().items() if k != "count"})
+        sample["interval"] = self.interval
+        with self._lock:
+            self.samples.append(sample)
+        self._adapt(sample)
+        return sample
+
+    def series(self, key):
+        """(time, value) pairs for one metric from the ring buffer."""
+        with self._lock:
+            return [(s["time"], s[key]) for s in self.samples if s.get(key) is not None]
+
+    def latest(self):
+        with self._lock:
+            return self.samples[-1] if self.samples else None
+
+    def run(self, on_sample=None):
+        """Sample until stop(); blocks the calling thread."""
+        self._stop.clear()
+        while True:
+            sample = self.sample()
+            if on_sample is not None:
+                on_sample(sample)
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self, on_sample=None):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, args=(on_sample,), name="telemetry", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _adapt(self, sample):
+        pressure = [sample["cpu_percent"] or 0.0, sample["memory_percent"], sample["fd_percent"]]
+        hot = max(pressure) >= self.hot_percent
+        p95 = sample.get("latency_p95_ms")
+        if self.latency_target_ms is not None and p95 is not None and p95 > self.latency_target_ms:
+            hot = True
+        if hot:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.base_interval, self.interval * 2)
@@ -1,62 +1,70 @@
-import json
-import asyncio
-import concurrent.futures
-import time
+import logging
+from functools import partial
 import requests
 from flask import Flask, request, jsonify
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QTextEdit
-from sklearn.ensemble import RandomForestClassifier
-import numpy as np
+from SlizzAIM_Predictor import NextCommandPredictor
+from SlizzAIM_Pipeline import StagedPipeline
+from SlizzAIM_Store import CommandStore
+from SlizzAIM_Async import AsyncCommandHub, create_asgi_app
+from SlizzAIM_Cache import ResultCache
+from SlizzAIM_Supervisor import OperatorSupervisor
+from SlizzAIM_Pool import LazyOperatorPool
+import slizzai_logging
 
 # -------------------------
 # AI Behavioral Analysis Engine
 # -------------------------
 class BehaviorTracker:
-    def __init__(self, filename="behavior_data.json"):
+    def __init__(self, filename="behavior_data.json", refit_interval=None):
         self.filename = filename
+        self.store = CommandStore(filename)
         self.history = self.load_history()
-        self.model = RandomForestClassifier()
-        self.train_model()
+        self.model = NextCommandPredictor()
+        self.model.seed(self.history)
+        if refit_interval:
+            self.model.start_refit(refit_interval)
 
     def load_history(self):
-        try:
-            with open(self.filename, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {}
+        return self.store.counts
 
     def save_history(self):
-        with open(self.filename, "w") as file:
-            json.dump(self.history, file, indent=4)
+        self.store.flush()
 
     def log_command(self, command):
-        self.history[command] = self.history.get(command, 0) + 1
-        self.save_history()
+        self.store.increment(command)
+        self.model.observe(command)
 
     def train_model(self):
-        if len(self.history) < 5:
-            return
-        X = np.array([[self.history[c]] for c in self.history])
-        y = np.array(list(self.history.keys()))
-        self.model.fit(X, y)
+        self.model.refit()
 
     def predict_command(self):
         if len(self.history) < 5:
             return "Not enough data"
-        X_test = np.array([[max(self.history.values())]])
-        return self.model.predict(X_test)[0]
+        return self.model.predict()
+
+    def suggest_commands(self, k=5):
+        return self.model.suggest(k)
 
 # -------------------------
 # Scalable AI Execution System
 # -------------------------
 class ScalableExecution:
-    def __init__(self, ai_hub):
+    def __init__(self, ai_hub, workers_per_stage=1, queue_size=64, tracker=None):
         self.ai_hub = ai_hub
+        self.tracker = tracker if tracker is not None else ai_hub.tracker
+        # One long-lived worker pool per operator stage, so tasks overlap across stages
+        self.pipeline = StagedPipeline(ai_hub.operators, workers=workers_per_stage, queue_size=queue_size)
 
     def execute_parallel(self, commands):
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            results = executor.map(self.ai_hub.command_handler, commands)
-        return list(results)
+        # Same result cache and history as command_handler; only cache misses enter the pipeline
+        for command in commands:
+            self.tracker.log_command(command["task"])
+        futures = [self.ai_hub.cache.get_or_submit(command, self.pipeline.submit) for command in commands]
+        return [future.result() for future in futures]
+
+    def stage_stats(self):
+        return self.pipeline.stats()
 
 # -------------------------
 # Flask API with AI Monitoring
@@ -72,7 +80,15 @@ def execute_command():
 @app.route("/monitor", methods=["GET"])
 def system_status():
     operators_status = {name: op.status for name, op in ai_hub.operators.items()}
-    return jsonify({"AI_Operators_Status": operators_status})
+    return jsonify({"AI_Operators_Status": operators_status, "Result_Cache": ai_hub.cache.stats(),
+                    "Supervisor": ai_hub.supervisor.health()})
+
+# -------------------------
+# ASGI API (serve with: uvicorn --factory)
+# -------------------------
+def build_asgi_app(commander=None):
+    commander = commander or SlizzAICommander()
+    return create_asgi_app(commander.async_hub, handle=commander.async_command_handler)
 
 # -------------------------
 # PyQt GUI for Real-Time Monitoring
@@ -107,37 +123,51 @@ class SlizzAIMGUI(QWidget):
 # AI Failure Recovery Engine
 # -------------------------
 class AIRecoveryManager:
+    """Reports failures and restarts published by the commander's OperatorSupervisor."""
+
     def __init__(self, ai_hub):
         self.ai_hub = ai_hub
+        ai_hub.supervisor.subscribe(self.on_transition)
 
-    def check_operator_health(self):
-        for name, operator in self.ai_hub.operators.items():
-            if operator.status == "FAILED":
-                print(f"Restarting {name} operator...")
-                operator.status = "ACTIVE"
-
-    def auto_recover(self):
-        while True:
-            time.sleep(5)
-            self.check_operator_health()
+    def on_transition(self, name, old, new, error):
+        if new == "FAILED":
+            slizzai_logging.log_event("operator.restarting", logging.WARNING, operator=name, error=repr(error))
+        elif new == "OPEN":
+            # Keeps failing; calls are rejected until the cooldown ends
+            slizzai_logging.log_event("operator.circuit_open", logging.ERROR, operator=name)
 
 # -------------------------
 # AI Command Center & Execution Hub
 # -------------------------
+# Task types whose executor stage changes something; their results are never reused
+UNCACHED_TASKS = ("deploy", "execute", "restart", "shutdown")
+
 class SlizzAICommander:
-    def __init__(self):
+    def __init__(self, pool_config=None, cache_ttls=None):
+        # {operator name: {"size": N, "idle_timeout": seconds}}
+        self.pool_config = pool_config or {}
         self.operators = self.initialize_operators()
         self.status = "ACTIVE"
         self.tracker = BehaviorTracker()
+        # Async operators run on the event loop; legacy ones share a bounded thread pool
+        self.async_hub = AsyncCommandHub(self.operators)
+        # {task type: seconds}, on top of never caching UNCACHED_TASKS
+        self.cache = ResultCache(ttls={**dict.fromkeys(UNCACHED_TASKS, 0), **(cache_ttls or {})})
 
     def initialize_operators(self):
-        return {
-            "analyzer": AnalyzerOperator(),
-            "processor": ProcessorOperator(),
-            "predictor": PredictorOperator(),
-            "optimizer": OptimizerOperator(),
-            "executor": ExecutorOperator(),
+        # Operators are lazy pools with idle unload; each pool has a supervised standby
+        classes = {
+            "analyzer": AnalyzerOperator,
+            "processor": ProcessorOperator,
+            "predictor": PredictorOperator,
+            "optimizer": OptimizerOperator,
+            "executor": ExecutorOperator,
         }
+        self.supervisor = OperatorSupervisor({
+            name: partial(LazyOperatorPool.from_config, cls, self.pool_config.get(name))
+            for name, cls in classes.items()
+        })
+        return self.supervisor.operators
 
     def hybrid_standby(self):
         for op in self.operators.values():
@@ -145,6 +175,9 @@ class SlizzAICommander:
 
     def command_handler(self, task):
         self.tracker.log_command(task["task"])
+        return self.cache.get_or_compute(task, self.run_operators)
+
+    def run_operators(self, task):
         analysis = self.operators["analyzer"].process(task)
         processed = self.operators["processor"].transform(analysis)
         prediction = self.operators["predictor"].forecast(processed)
@@ -152,11 +185,8 @@ class SlizzAICommander:
         return self.operators["executor"].execute(optimization)
 
     async def async_command_handler(self, task):
-        analysis = await asyncio.to_thread(self.operators["analyzer"].process, task)
-        processed = await asyncio.to_thread(self.operators["processor"].transform, analysis)
-        prediction = await asyncio.to_thread(self.operators["predictor"].forecast, processed)
-        optimization = await asyncio.to_thread(self.operators["optimizer"].enhance, prediction)
-        return await asyncio.to_thread(self.operators["executor"].execute, optimization)
+        self.tracker.log_command(task["task"])
+        return await self.cache.aget_or_compute(task, self.async_hub.handle)
 
 # -------------------------
 # AI Execution Entry Point
@@ -1,8 +1,10 @@
-import numpy as np
+import gc
 import time
 import threading
 import logging
+import random
 import SlizzAI
+from SlizzAIM_Telemetry import TelemetryCollector
 # Setup logging for error tracking and optimization monitoring
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 
@@ -18,40 +20,52 @@ class MegaOrchestrator:
         self.optimization_engines = {"load_balance": True, "chaos_testing": True}
         
         # AI Parameters
-        self.adaptive_ai = np.random.rand(10)
+        self.adaptive_ai = [random.random() for _ in range(10)]
         self.latency_threshold = 5  # Target latency (ms)
         self.redundancy_nodes = 3  # Fallback redundancy for system resilience
         self.federated_learning_data = {}
 
+        # Real measurements from /proc; samples faster while the system is under pressure
+        self.telemetry = TelemetryCollector(interval=5.0, latency_target_ms=self.latency_threshold)
+
+    def time_request(self):
+        """Context manager recording one request's latency for the p50/p95 window.
+
+        SlizzAIMCommander(telemetry=orchestrator.telemetry) does this for every command.
+        """
+        return self.telemetry.time_request()
+
     def monitor_system(self):
         """Real-time system tracking for adaptive corrections."""
-        while True:
-            self.health_monitor["cpu"] = max(0, np.random.randint(70, 100))
-            self.health_monitor["ram"] = max(0, np.random.randint(60, 100))
-            self.health_monitor["network"] = max(0, np.random.randint(50, 100))
-            
-            logging.info(f"System Health: {self.health_monitor}")
-            
-            if any(val < 60 for val in self.health_monitor.values()):
-                self.self_heal()
-            
-            time.sleep(5)
+        self.telemetry.run(on_sample=self.update_health)
+
+    def update_health(self, sample):
+        """Convert a telemetry sample into 0-100 health scores (100 is idle/healthy)."""
+        self.health_monitor["cpu"] = 100 - (sample["cpu_percent"] or 0.0)
+        self.health_monitor["ram"] = 100 - sample["memory_percent"]
+        self.health_monitor["network"] = 100 - sample["net_error_percent"]
+        self.health_monitor["fds"] = 100 - sample["fd_percent"]
+
+        logging.info(f"System Health: {self.health_monitor} (next sample in {self.telemetry.interval:.1f}s)")
+
+        if any(val < 60 for val in self.health_monitor.values()):
+            self.self_heal()
 
     def self_heal(self):
         """Autonomous self-healing protocol to restore system balance."""
-        logging.warning("⚠ System experiencing instability. Activating self-healing.")
+        strained = {k: round(v, 1) for k, v in self.health_monitor.items() if v < 60}
+        logging.warning(f"⚠ System experiencing instability {strained}. Activating self-healing.")
 
-        # AI-driven realignment of resource allocations
-        self.health_monitor["cpu"] = min(100, self.health_monitor["cpu"] + 20)
-        self.health_monitor["ram"] = min(100, self.health_monitor["ram"] + 25)
-        self.health_monitor["network"] = min(100, self.health_monitor["network"] + 30)
+        # Release what this process can; the next sample shows whether it helped
+        if "ram" in strained:
+            gc.collect()
 
-        logging.info("✅ Self-healing protocols completed. Stability restored.")
+        logging.info("✅ Self-healing protocols completed.")
 
     def zero_day_protection(self):
         """Advanced cybersecurity layer preventing zero-day attacks."""
         logging.info("🔒 Zero-Day Protection Active.")
-        attack_detected = np.random.choice([True, False], p=[0.1, 0.9])
+        attack_detected = random.random() < 0.1
         
         if attack_detected:
             logging.warning("⚠ Zero-day attack detected. Activating countermeasures.")
@@ -62,12 +76,16 @@ class MegaOrchestrator:
 
     def optimize_latency(self):
         """Dynamic adjustment of latency controls for system performance."""
-        current_latency = np.random.randint(1, 10)
+        latency = self.telemetry.latency_percentiles()
+        if latency["p95"] is None:
+            logging.info("No request timings recorded yet.")
+            return
 
-        if current_latency > self.latency_threshold:
-            logging.warning(f"⚠ High latency detected ({current_latency}ms). Optimizing...")
-            self.latency_threshold += 2  # AI-driven recalibration
-            logging.info(f"✅ New latency threshold set to {self.latency_threshold}ms.")
+        if latency["p95"] > self.latency_threshold:
+            logging.warning(f"⚠ High latency detected (p50 {latency['p50']:.1f}ms, p95 {latency['p95']:.1f}ms). Optimizing...")
+            # Sample at the fastest rate until p95 is back under target
+            self.telemetry.interval = self.telemetry.min_interval
+            logging.info(f"✅ Telemetry interval lowered to {self.telemetry.interval}s.")
 
     def execute_all_protocols(self):
         """Launches all resilience-enhanced modules in parallel."""
@@ -1,17 +1,60 @@
-from vision_module import VisionModule
-from nlp_module import NLPModule
-from speech_module import SpeechModule
+import importlib
+import json
+import threading
 
+# Entry points are "module:Class" strings, imported on first activation
 ENGINE_REGISTRY = {
-    "vision": VisionModule,
-    "nlp": NLPModule,
-    "speech": SpeechModule
+    "vision": "vision_module:VisionModule",
+    "nlp": "nlp_module:NLPModule",
+    "speech": "speech_module:SpeechModule"
 }
 
-def activate_engine(engine_name):
-    engine_class = ENGINE_REGISTRY.get(engine_name)
-    if not engine_class:
+_classes = {}
+_instances = {}  # (engine name, config key) -> activated instance
+_locks = {}
+_registry_lock = threading.Lock()
+
+def register_engine(engine_name, entry_point):
+    with _registry_lock:
+        ENGINE_REGISTRY[engine_name] = entry_point
+        _classes.pop(engine_name, None)
+        for key in [k for k in _instances if k[0] == engine_name]:
+            del _instances[key]
+
+def _engine_lock(engine_name):
+    with _registry_lock:
+        return _locks.setdefault(engine_name, threading.Lock())
+
+def load_engine_class(engine_name):
+    engine_class = _classes.get(engine_name)
+    if engine_class is not None:
+        return engine_class
+    entry_point = ENGINE_REGISTRY.get(engine_name)
+    if not entry_point:
         raise ValueError(f"Engine '{engine_name}' is not recognized.")
-    engine_instance = engine_class()
-    engine_instance.activate()
-    return engine_instance
\ No newline at end of file
+    if isinstance(entry_point, str):
+        module_name, _, class_name = entry_point.partition(":")
+        engine_class = getattr(importlib.import_module(module_name), class_name)
+    else:
+        engine_class = entry_point
+    _classes[engine_name] = engine_class
+    return engine_class
+
+def activate_engine(engine_name, config=None):
+    key = (engine_name, json.dumps(config, sort_keys=True, default=repr))
+    engine_instance = _instances.get(key)
+    if engine_instance is not None:
+        return engine_instance
+    # One lock per engine: concurrent callers share a single import and model load,
+    # while different engines still activate in parallel
+    with _engine_lock(engine_name):
+        engine_instance = _instances.get(key)
+        if engine_instance is None:
+            engine_class = load_engine_class(engine_name)
+            engine_instance = engine_class(**config) if config else engine_class()
+            engine_instance.activate()
+            _instances[key] = engine_instance
+    return engine_instance
+
+def loaded_engines():
+    return sorted({name for name, _ in _instances})
\ No newline at end of file
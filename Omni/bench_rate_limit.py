@@ -0,0 +1,93 @@
+"""Overhead of RateLimitMiddleware per request at a simulated 10k RPS.
+
+Drives the middleware directly with ASGI scopes (no HTTP server) and compares
+it to the bare app. The bucket clock advances 1/RPS per request, so refills
+behave as they would at that request rate. Run: python bench_rate_limit.py
+[--rps N] [--seconds S] [--clients N]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from rate_limit import RateLimiter, RateLimitMiddleware, TokenBuckets
+
+
+async def bare_app(scope, receive, send):
+    pass
+
+
+async def receive():
+    return {"type": "http.request"}
+
+
+async def send(message):
+    pass
+
+
+def make_scopes(count, clients, seed=0):
+    rng = random.Random(seed)
+    paths = ["/api/nuninex/resolve", "/api/omni/invoke", "/slizzai"]
+    tenants = [None, None, None, b"acme"]
+    scopes = []
+    for _ in range(count):
+        tenant = rng.choice(tenants)
+        headers = [(b"host", b"gateway"), (b"user-agent", b"bench")]
+        if tenant:
+            headers.append((b"x-tenant-id", tenant))
+        scopes.append({"type": "http", "path": rng.choice(paths), "headers": headers,
+                       "client": (f"10.0.{rng.randrange(clients) // 256}.{rng.randrange(256)}", 4000)})
+    return scopes
+
+
+async def run(app, scopes):
+    timings = []
+    clock = time.perf_counter_ns
+    for scope in scopes:
+        start = clock()
+        await app(scope, receive, send)
+        timings.append(clock() - start)
+    timings.sort()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rps", type=int, default=10_000)
+    parser.add_argument("--seconds", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=2_000)
+    args = parser.parse_args()
+
+    fake_now = [0.0]
+
+    def clock():
+        fake_now[0] += 1.0 / args.rps
+        return fake_now[0]
+
+    limiter = RateLimiter(
+        default="100/second",
+        routes={"/api/nuninex/resolve": "20/second", "/api/omni/invoke": "20/second"},
+        tenants={"acme": {"default": "1000/second"}},
+        local=TokenBuckets(clock=clock),
+    )
+    limited = RateLimitMiddleware(bare_app, limiter)
+    scopes = make_scopes(args.rps * args.seconds, args.clients)
+
+    base = asyncio.run(run(bare_app, scopes))
+    with_limit = asyncio.run(run(limited, scopes))
+
+    def pct(values, q):
+        return values[min(len(values) - 1, int(q * len(values)))] / 1000
+
+    overhead_mean = (sum(with_limit) - sum(base)) / len(scopes) / 1000
+    print(f"{len(scopes):,} requests ({args.rps:,} RPS for {args.seconds}s, {args.clients:,} clients)")
+    print(f"{'':<22} {'p50 us':>8} {'p99 us':>8}")
+    print(f"{'bare app':<22} {pct(base, 0.5):8.2f} {pct(base, 0.99):8.2f}")
+    print(f"{'with rate limiter':<22} {pct(with_limit, 0.5):8.2f} {pct(with_limit, 0.99):8.2f}")
+    print(f"mean overhead: {overhead_mean:.2f} us/request "
+          f"({overhead_mean * args.rps / 1e4:.2f}% of one core at {args.rps:,} RPS)")
+    print(f"limiter: {limiter.stats()}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""Microbenchmark for task routing over 1M mixed inputs.
+
+Compares the old startswith/substring chains against TaskRouter.classify and
+TaskRouter.classify_batch. Run: python bench_task_router.py [--count N]
+"""
+import argparse
+import random
+import time
+
+from task_router import TaskRouter
+
+
+def legacy_detect_task(input_data):
+    """UnifiedAI.detect_task before it used TaskRouter."""
+    if isinstance(input_data, bytes):
+        return "vision"
+    if isinstance(input_data, str):
+        if input_data.startswith("speak:"):
+            return "speech"
+        if "generate:" in input_data:
+            return "generation"
+        if "retrieve:" in input_data:
+            return "retrieval"
+        if "logic:" in input_data:
+            return "logic"
+        return "nlp"
+    return "nlp"
+
+
+def legacy_classify(input_data):
+    """task_classifier.classify before it used TaskRouter."""
+    if isinstance(input_data, bytes):
+        return "vision"
+    elif input_data.startswith("speak:"):
+        return "speech"
+    elif input_data.startswith("generate:"):
+        return "generation"
+    elif input_data.startswith("retrieve:"):
+        return "retrieval"
+    elif input_data.startswith("logic:"):
+        return "logic"
+    else:
+        return "nlp"
+
+
+def make_inputs(count, seed=0):
+    rng = random.Random(seed)
+    words = ["fusion", "poem", "status", "report", "image", "orbit", "query", "summary"]
+    prefixes = ["speak: ", "generate: ", "retrieve: ", "logic: ", "", "", ""]
+    inputs = []
+    for _ in range(count):
+        if rng.random() < 0.05:
+            inputs.append(bytes(rng.randrange(256) for _ in range(16)))
+            continue
+        body = " ".join(rng.choice(words) for _ in range(rng.randint(2, 40)))
+        inputs.append(rng.choice(prefixes) + body)
+    return inputs
+
+
+def timed(label, fn, inputs):
+    start = time.perf_counter()
+    fn(inputs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.3f}s  {elapsed / len(inputs) * 1e9:8.1f} ns/input")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--plugin-rules", type=int, default=50, help="extra prefix rules for the scaling run")
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.count)
+    router = TaskRouter()
+    assert router.classify_batch(inputs) == [legacy_classify(i) for i in inputs]
+
+    print(f"{args.count:,} mixed inputs")
+    timed("legacy detect_task (loop)", lambda xs: [legacy_detect_task(x) for x in xs], inputs)
+    timed("legacy classify (loop)", lambda xs: [legacy_classify(x) for x in xs], inputs)
+    timed("TaskRouter.classify (loop)", lambda xs: [router.classify(x) for x in xs], inputs)
+    timed("TaskRouter.classify_batch", router.classify_batch, inputs)
+
+    plugins = TaskRouter.from_config({"rules": [{"prefix": f"tool{n}:", "task": f"tool{n}"} for n in range(args.plugin_rules)]})
+    chain = [(rule["prefix"], rule["task"]) for rule in plugins.rules]
+
+    def legacy_chain(input_data):
+        if isinstance(input_data, bytes):
+            return "vision"
+        for prefix, task in chain:
+            if input_data.startswith(prefix):
+                return task
+        return "nlp"
+
+    timed(f"startswith chain +{args.plugin_rules} rules", lambda xs: [legacy_chain(x) for x in xs], inputs)
+    timed(f"classify_batch +{args.plugin_rules} plug-in rules", plugins.classify_batch, inputs)
+
+
+if __name__ == "__main__":
+    main()
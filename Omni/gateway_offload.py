@@ -0,0 +1,139 @@
+"""Keep blocking backend calls off the gateway's event loop.
+
+call() awaits coroutine backends directly and runs synchronous ones on a
+bounded thread pool. limit() caps how many requests a route runs at once.
+LoopLagMonitor measures how late the event loop wakes up, so a backend that
+blocks the loop shows up as lag.
+"""
+import asyncio
+import functools
+import inspect
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import HTTPException
+
+try:
+    from prometheus_client import Gauge, Histogram
+    LOOP_LAG_SECONDS = Histogram("gateway_event_loop_lag_seconds", "Event loop wake-up delay",
+                                 buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5))
+    ROUTE_IN_FLIGHT = Gauge("gateway_route_in_flight", "Requests running per route", ["route"])
+except ImportError:
+    LOOP_LAG_SECONDS = ROUTE_IN_FLIGHT = None
+
+OFFLOAD_WORKERS = int(os.environ.get("SLIZZAI_OFFLOAD_WORKERS", "32"))
+ROUTE_CONCURRENCY = int(os.environ.get("SLIZZAI_ROUTE_CONCURRENCY", "16"))
+ROUTE_QUEUE_TIMEOUT = float(os.environ.get("SLIZZAI_ROUTE_QUEUE_TIMEOUT", "10"))
+
+_executor = None
+_route_limits = {}  # route -> max concurrent requests, overriding ROUTE_CONCURRENCY
+_route_state = {}  # route -> [semaphore, in_flight, rejected]
+
+
+def configure(workers=None, route_limits=None):
+    """Set the sync-backend pool size and per-route limits before serving."""
+    global _executor, OFFLOAD_WORKERS
+    if workers is not None:
+        OFFLOAD_WORKERS = workers
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+    if route_limits:
+        _route_limits.update(route_limits)
+        for route in route_limits:
+            _route_state.pop(route, None)
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=OFFLOAD_WORKERS, thread_name_prefix="gateway-backend")
+    return _executor
+
+
+async def call(fn, *args, **kwargs):
+    """Await ``fn(*args, **kwargs)`` without blocking the event loop."""
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+@asynccontextmanager
+async def limit(route):
+    """Admit at most the route's limit of concurrent requests; 503 after waiting too long."""
+    state = _route_state.get(route)
+    if state is None:
+        state = _route_state[route] = [asyncio.Semaphore(_route_limits.get(route, ROUTE_CONCURRENCY)), 0, 0]
+    try:
+        await asyncio.wait_for(state[0].acquire(), ROUTE_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        state[2] += 1
+        raise HTTPException(status_code=503, detail=f"{route} is at its concurrency limit")
+    state[1] += 1
+    if ROUTE_IN_FLIGHT is not None:
+        ROUTE_IN_FLIGHT.labels(route=route).inc()
+    try:
+        yield
+    finally:
+        state[1] -= 1
+        state[0].release()
+        if ROUTE_IN_FLIGHT is not None:
+            ROUTE_IN_FLIGHT.labels(route=route).dec()
+
+
+class LoopLagMonitor:
+    """Sleep ``interval`` seconds in a loop and record how late each wake-up is."""
+
+    def __init__(self, interval=0.1, history=600):
+        self.interval = interval
+        self.samples = deque(maxlen=history)
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.samples.append(lag)
+            if LOOP_LAG_SECONDS is not None:
+                LOOP_LAG_SECONDS.observe(lag)
+
+    def stats(self):
+        values = sorted(self.samples)
+        if not values:
+            return {"samples": 0}
+        pick = lambda q: values[min(len(values) - 1, int(q * len(values)))] * 1000
+        return {"samples": len(values), "p50_ms": pick(0.5), "p99_ms": pick(0.99), "max_ms": values[-1] * 1000}
+
+
+def stats():
+    """Executor and per-route counters for a metrics endpoint."""
+    executor = _executor
+    return {
+        "offload_workers": OFFLOAD_WORKERS,
+        "offload_queue": executor._work_queue.qsize() if executor is not None else 0,
+        "routes": {
+            route: {"limit": _route_limits.get(route, ROUTE_CONCURRENCY), "in_flight": s[1], "rejected": s[2]}
+            for route, s in _route_state.items()
+        },
+    }
\ No newline at end of file
@@ -1,9 +1,110 @@
 # health_check.py
-def check_engines_status(engines):
-    status = {}
-    for name, engine in engines.items():
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    from prometheus_client import Histogram
+    PING_SECONDS = Histogram("engine_ping_seconds", "Engine health ping latency", ["engine"])
+except ImportError:
+    PING_SECONDS = None
+
+PING_TIMEOUT = 2.0  # seconds each engine gets to answer
+STATUS_TTL = 1.0  # how long a health snapshot is served before refreshing
+UNHEALTHY = ("DOWN", "TIMEOUT")
+
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="health-ping")
+_inflight = {}  # engine name -> (id(engine), ping future) from an earlier check; holds no engine reference
+_inflight_lock = threading.Lock()
+
+
+def _ping(name, engine):
+    start = time.perf_counter()
+    try:
+        status = engine.ping()
+    except Exception:
+        status = "DOWN"
+    elapsed = time.perf_counter() - start
+    if PING_SECONDS is not None:
+        PING_SECONDS.labels(engine=name).observe(elapsed)
+    return status, elapsed * 1000
+
+
+def check_engines(engines, timeout=PING_TIMEOUT):
+    """Ping all engines concurrently; returns (status, latency_ms) dicts.
+
+    An engine that misses the deadline is reported as TIMEOUT. Its ping keeps
+    running, and later checks report TIMEOUT without pinging it again until it
+    returns, so a hung engine cannot use up the pool.
+    """
+    futures = {}
+    with _inflight_lock:
+        for name, engine in engines.items():
+            engine_id, future = _inflight.get(name, (None, None))
+            if future is None or future.done() or engine_id != id(engine):
+                future = _executor.submit(_ping, name, engine)
+                _inflight[name] = (id(engine), future)
+            futures[name] = future
+    wait(futures.values(), timeout=timeout)
+
+    status, latency_ms = {}, {}
+    for name, future in futures.items():
+        if future.done():
+            status[name], latency_ms[name] = future.result()
+        else:
+            status[name], latency_ms[name] = "TIMEOUT", None
+    return status, latency_ms
+
+
+def check_engines_status(engines, timeout=PING_TIMEOUT):
+    return check_engines(engines, timeout)[0]
+
+
+class CachedHealth:
+    """Serve the last engine health snapshot, refreshing it in the background.
+
+    snapshot() never waits on engines once a first check has completed: a
+    stale snapshot triggers one background refresh and is returned as is.
+    ``engines`` is a dict of name -> engine, or a callable returning one.
+    """
+
+    def __init__(self, engines, ttl=STATUS_TTL, timeout=PING_TIMEOUT):
+        self.engines = engines
+        self.ttl = ttl
+        self.timeout = timeout
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()  # one check at a time, direct or background
+        self._refreshing = False  # a background refresh is scheduled or running
+
+    def refresh(self):
+        """Check the engines now, after any refresh already running, and return the snapshot."""
+        with self._refresh_lock:
+            engines = self.engines() if callable(self.engines) else self.engines
+            status, latency_ms = check_engines(engines, self.timeout)
+            snapshot = {"engines": status, "latency_ms": latency_ms, "checked_at": time.time()}
+            with self._lock:
+                self._snapshot = snapshot
+        return snapshot
+
+    def snapshot(self):
+        with self._lock:
+            current = self._snapshot
+            stale = current is None or time.time() - current["checked_at"] >= self.ttl
+            start_refresh = stale and current is not None and not self._refreshing
+            if start_refresh:
+                self._refreshing = True
+        if current is None:
+            return self.refresh()
+        if start_refresh:
+            threading.Thread(target=self._refresh_quietly, name="health-refresh", daemon=True).start()
+        return {**current, "age_s": time.time() - current["checked_at"], "refreshing": stale}
+
+    def _refresh_quietly(self):
         try:
-            status[name] = engine.ping()
+            self.refresh()
         except Exception:
-            status[name] = "DOWN"
-    return status
\ No newline at end of file
+            pass  # the stale snapshot stays; the next stale read tries again
+        finally:
+            with self._lock:
+                self._refreshing = False
\ No newline at end of file
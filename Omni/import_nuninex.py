@@ -1,13 +1,31 @@
 # import_nuninex.py
+import threading
+from functools import partial
+
 from fastapi import APIRouter
-from nuninex.core import NuninexResolver
-from nuninex.config import load_nuninex_config
+
+import gateway_offload
+import memory_cache
 
 router = APIRouter()
-config = load_nuninex_config()
-resolver = NuninexResolver(config=config)
+resolver = None
+_init_lock = threading.Lock()
+
+def init_resolver():
+    # Heavy imports and model setup happen here, not when the gateway imports this router
+    global resolver
+    if resolver is None:
+        with _init_lock:
+            if resolver is None:
+                from nuninex.core import NuninexResolver
+                from nuninex.config import load_nuninex_config
+                config = load_nuninex_config()
+                resolver = NuninexResolver(config=config)
+    return resolver
 
 @router.post("/nuninex/resolve")
 async def resolve_payload(payload: dict):
-    result = resolver.process(payload)
+    active = resolver or await gateway_offload.call(init_resolver)
+    async with gateway_offload.limit("nuninex.resolve"):
+        result = await memory_cache.cached("nuninex", payload, partial(gateway_offload.call, active.process, payload))
     return {"result": result}
\ No newline at end of file
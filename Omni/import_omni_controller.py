@@ -1,13 +1,30 @@
 # import_omni_controller.py
+import threading
+
 from fastapi import APIRouter
-from omni.controller import OmniController
-from omni.config import get_omni_profile
+
+import gateway_offload
 
 router = APIRouter()
-profile = get_omni_profile()
-controller = OmniController(profile=profile)
+controller = None
+_init_lock = threading.Lock()
+
+def init_controller():
+    # Heavy imports and profile loading happen here, not when the gateway imports this router
+    global controller
+    if controller is None:
+        with _init_lock:
+            if controller is None:
+                from omni.controller import OmniController
+                from omni.config import get_omni_profile
+                profile = get_omni_profile()
+                controller = OmniController(profile=profile)
+    return controller
 
 @router.post("/omni/invoke")
 async def invoke_module(request: dict):
-    response = controller.invoke(request)
+    active = controller or await gateway_offload.call(init_controller)
+    async with gateway_offload.limit("omni.invoke"):
+        # Not cached: invocations can have side effects
+        response = await gateway_offload.call(active.invoke, request)
     return {"response": response}
\ No newline at end of file
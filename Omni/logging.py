@@ -1,5 +0,0 @@
-import logging
-logging.basicConfig(filename='slizzai.log', level=logging.INFO)
-
-def log_event(event):
-    logging.info(f"[EVENT] {event}")
\ No newline at end of file
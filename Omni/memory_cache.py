@@ -1,8 +1,349 @@
-import redis
-cache = redis.Redis(host='localhost', port=6379, db=0)
+"""Two-level result cache: an in-process LRU (L1) in front of Redis (L2).
+
+Values are encoded with a pluggable codec and stored with a TTL chosen per
+namespace. Entries carry how long they took to compute, and reads refresh
+them early with a probability that rises as expiry nears (XFetch), so a hot
+key is recomputed by one caller instead of all of them at once. Concurrent
+misses on the same key inside one process are coalesced.
+"""
+import asyncio
+import hashlib
+import inspect
+import json
+import math
+import os
+import pickle
+import random
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+DEFAULT_TTL = 300.0
+
+
+class JSONCodec:
+    def dumps(self, value):
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class PickleCodec:
+    """Any picklable value; only use against a Redis that untrusted clients cannot write to."""
+
+    def dumps(self, value):
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data):
+        return pickle.loads(data)
+
+
+class MsgpackCodec:
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("msgpack is not installed")
+
+    def dumps(self, value):
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data):
+        return msgpack.unpackb(data, raw=False)
+
+
+CODECS = {"json": JSONCodec, "pickle": PickleCodec, "msgpack": MsgpackCodec}
+
+
+def make_key(obj):
+    """Stable hash of a JSON-like payload, independent of dict key order."""
+    if isinstance(obj, str):
+        return obj
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class InMemoryBackend:
+    """Redis stand-in for tests and single-process deployments."""
+
+    def __init__(self):
+        self._data = {}  # key -> (bytes, expires_at or None)
+
+    async def get(self, key):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[1] is not None and item[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item[0]
+
+    async def set(self, key, value, ttl=None):
+        self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+
+    async def delete(self, key):
+        self._data.pop(key, None)
+
+    async def close(self):
+        self._data.clear()
+
+
+class RedisBackend:
+    """redis.asyncio client over a bounded connection pool."""
+
+    def __init__(self, url="redis://localhost:6379/0", max_connections=32):
+        import redis.asyncio as aioredis
+
+        self._pool = aioredis.ConnectionPool.from_url(url, max_connections=max_connections)
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
+    async def get(self, key):
+        return await self._client.get(key)
+
+    async def set(self, key, value, ttl=None):
+        await self._client.set(key, value, px=int(ttl * 1000) if ttl else None)
+
+    async def delete(self, key):
+        await self._client.delete(key)
+
+    async def close(self):
+        await self._client.aclose()
+        await self._pool.disconnect()
+
+
+class AsyncCache:
+    """Namespaced cache; ``namespaces`` maps a namespace to its TTL in seconds.
+
+    A TTL of 0 or None turns caching off for that namespace. ``beta`` scales
+    early expiration: 0 disables it, values above 1 refresh sooner.
+    """
+
+    def __init__(self, backend=None, codec="json", namespaces=None, default_ttl=DEFAULT_TTL,
+                 l1_size=1024, l1_ttl=5.0, beta=1.0, prefix="slizzai"):
+        self.backend = backend or InMemoryBackend()
+        self.codec = CODECS[codec]() if isinstance(codec, str) else codec
+        self.namespaces = dict(namespaces or {})
+        self.default_ttl = default_ttl
+        self.l1_size = l1_size
+        self.l1_ttl = l1_ttl
+        self.beta = beta
+        self.prefix = prefix
+        self._l1 = OrderedDict()  # full key -> (value, delta, expires_at, l1_until)
+        self._inflight = {}  # full key -> Future of the computing call
+        self.l1_hits = self.l2_hits = self.misses = 0
+        self.early_refreshes = self.coalesced = self.backend_errors = 0
+
+    def ttl_for(self, namespace):
+        return self.namespaces.get(namespace, self.default_ttl)
+
+    def _full_key(self, namespace, key):
+        return f"{self.prefix}:{namespace}:{make_key(key)}"
+
+    def _l1_get(self, full_key, now):
+        entry = self._l1.get(full_key)
+        if entry is None:
+            return None
+        if entry[3] <= now:
+            del self._l1[full_key]
+            return None
+        self._l1.move_to_end(full_key)
+        return entry
+
+    def _l1_put(self, full_key, value, delta, expires_at, now):
+        if self.l1_size <= 0:
+            return
+        self._l1[full_key] = (value, delta, expires_at, min(expires_at, now + self.l1_ttl))
+        self._l1.move_to_end(full_key)
+        while len(self._l1) > self.l1_size:
+            self._l1.popitem(last=False)
+
+    async def _lookup(self, full_key):
+        """(value, delta, expires_at) from L1, then L2; None on a miss."""
+        now = time.time()
+        entry = self._l1_get(full_key, now)
+        if entry is not None:
+            self.l1_hits += 1
+            return entry[:3]
+        try:
+            data = await self.backend.get(full_key)
+        except Exception:
+            self.backend_errors += 1
+            data = None
+        if data is None:
+            return None
+        value, delta, expires_at = self.codec.loads(data)
+        if expires_at <= now:
+            return None
+        self.l2_hits += 1
+        self._l1_put(full_key, value, delta, expires_at, now)
+        return value, delta, expires_at
+
+    async def _store(self, full_key, value, delta, ttl):
+        now = time.time()
+        expires_at = now + ttl
+        self._l1_put(full_key, value, delta, expires_at, now)
+        try:
+            await self.backend.set(full_key, self.codec.dumps([value, delta, expires_at]), ttl)
+        except Exception:
+            self.backend_errors += 1
+
+    def _refresh_early(self, delta, expires_at):
+        # XFetch: -log(U) is exponentially distributed, so callers far from expiry almost never refresh
+        return self.beta > 0 and time.time() - delta * self.beta * math.log(1.0 - random.random()) >= expires_at
+
+    async def get(self, namespace, key, default=None):
+        entry = await self._lookup(self._full_key(namespace, key))
+        if entry is None:
+            self.misses += 1
+            return default
+        return entry[0]
+
+    async def set(self, namespace, key, value, ttl=None):
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        if ttl:
+            await self._store(self._full_key(namespace, key), value, 0.0, ttl)
+
+    async def invalidate(self, namespace, key):
+        full_key = self._full_key(namespace, key)
+        self._l1.pop(full_key, None)
+        try:
+            await self.backend.delete(full_key)
+        except Exception:
+            self.backend_errors += 1
+
+    async def get_or_compute(self, namespace, key, compute, ttl=None):
+        """Cached value for ``key``, or the result of ``compute()``.
+
+        ``compute`` takes no arguments and may be a coroutine function, return
+        an awaitable, or be a plain blocking function (run in a worker thread).
+        """
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        if not ttl:
+            return await _resolve(compute)
+        full_key = self._full_key(namespace, key)
+        entry = await self._lookup(full_key)
+        if entry is not None:
+            if not self._refresh_early(entry[1], entry[2]):
+                return entry[0]
+            self.early_refreshes += 1
+        else:
+            self.misses += 1
+
+        task = self._inflight.get(full_key)
+        if task is not None:
+            self.coalesced += 1
+            if entry is not None:
+                return entry[0]
+        else:
+            # The fill runs as its own task, so cancelling the caller that started it
+            # does not cancel it for the callers coalesced onto it
+            task = asyncio.ensure_future(self._fill(full_key, compute, ttl, entry))
+            task.add_done_callback(_retrieve)
+            self._inflight[full_key] = task
+        return await asyncio.shield(task)
+
+    async def _fill(self, full_key, compute, ttl, entry):
+        try:
+            start = time.perf_counter()
+            value = await _resolve(compute)
+            await self._store(full_key, value, time.perf_counter() - start, ttl)
+            return value
+        except Exception:
+            if entry is None:
+                raise
+            # An early refresh failed; the cached value has not expired yet
+            return entry[0]
+        finally:
+            del self._inflight[full_key]
+
+    def stats(self):
+        hits = self.l1_hits + self.l2_hits
+        lookups = hits + self.misses
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "early_refreshes": self.early_refreshes,
+            "coalesced": self.coalesced,
+            "backend_errors": self.backend_errors,
+            "l1_entries": len(self._l1),
+        }
+
+    async def close(self):
+        self._l1.clear()
+        await self.backend.close()
+
+
+async def _resolve(compute):
+    if inspect.iscoroutinefunction(compute):
+        return await compute()
+    result = await asyncio.to_thread(compute)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _retrieve(task):
+    # Waiters re-raise a failed fill; mark it retrieved so asyncio does not warn when none are left
+    if not task.cancelled():
+        task.exception()
+
+
+def cache_from_config(config):
+    """AsyncCache from a ``cache`` config section; None when no url is set.
+
+    ``url`` is a redis:// URL or ``memory`` for the in-process backend. The
+    SLIZZAI_CACHE_URL environment variable overrides it.
+    """
+    config = dict(config or {})
+    url = os.environ.get("SLIZZAI_CACHE_URL", config.get("url"))
+    if not url:
+        return None
+    backend = InMemoryBackend() if url == "memory" else RedisBackend(url, config.get("max_connections", 32))
+    return AsyncCache(
+        backend=backend,
+        codec=config.get("codec", "json"),
+        namespaces=config.get("namespaces"),
+        default_ttl=config.get("default_ttl", DEFAULT_TTL),
+        l1_size=config.get("l1_size", 1024),
+        l1_ttl=config.get("l1_ttl", 5.0),
+        beta=config.get("beta", 1.0),
+    )
+
+
+# Engine results cached by the gateway routers; None leaves caching off
+engine_cache = None
+
+
+async def cached(namespace, key, compute):
+    """Run ``compute`` through ``engine_cache`` when one is configured."""
+    if engine_cache is None:
+        return await _resolve(compute)
+    return await engine_cache.get_or_compute(namespace, key, compute)
+
+
+_sync_client = None
+_sync_lock = threading.Lock()
+
+
+def _client():
+    global _sync_client
+    if _sync_client is None:
+        with _sync_lock:
+            if _sync_client is None:
+                import redis
+                _sync_client = redis.Redis(host='localhost', port=6379, db=0)
+    return _sync_client
+
 
 def cache_result(key, value):
-    cache.set(key, value)
+    _client().set(key, value)
+
 
 def get_cached(key):
-    return cache.get(key)
\ No newline at end of file
+    return _client().get(key)
\ No newline at end of file
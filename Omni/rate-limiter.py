@@ -1,7 +1,12 @@
-from flask_limiter import Limiter
-limiter = Limiter(key_func=get_remote_address)
+# Per-client limit on /run, enforced by the gateway's ASGI rate limiter
+from fastapi import FastAPI
 
-@app.route("/run", methods=["POST"])
-@limiter.limit("10 per minute")
-def run_ai():
+from rate_limit import RateLimiter, RateLimitMiddleware
+
+app = FastAPI()
+limiter = RateLimiter(routes={"/run": "10/minute"})
+app.add_middleware(RateLimitMiddleware, limiter=limiter)
+
+@app.post("/run")
+async def run_ai():
     ...
\ No newline at end of file
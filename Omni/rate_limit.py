@@ -0,0 +1,283 @@
+"""ASGI rate limiting for the gateway.
+
+Limits are written as ``"<count>/<period>"`` (``"10/minute"``, ``"100 per
+second"``) or ``{"rate": ..., "burst": n}`` and chosen per route and per
+tenant. By default every replica enforces them with in-process token buckets.
+That costs a dict lookup and some float arithmetic per request, with no lock:
+the buckets are only touched from the event loop thread. With a
+``RedisSlidingWindow`` backend all replicas share one sliding-window count
+instead. If Redis cannot be reached, the local buckets take over.
+"""
+import json
+import time
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+_REJECT_BODY = json.dumps({"detail": "Rate limit exceeded"}).encode()
+
+
+class Limit:
+    """``count`` requests per ``period`` seconds, refilling continuously, bursting to ``burst``."""
+
+    __slots__ = ("count", "period", "rate", "burst")
+
+    def __init__(self, count, period, burst=None):
+        self.count = count
+        self.period = period
+        self.rate = count / period
+        self.burst = float(burst if burst is not None else count)
+
+    def __repr__(self):
+        return f"Limit({self.count}/{self.period}s, burst={self.burst:g})"
+
+
+def parse_limit(spec):
+    """Limit from ``"10/minute"``, ``"10 per minute"``, ``{"rate": ..., "burst": n}``; None stays None."""
+    if spec is None or isinstance(spec, Limit):
+        return spec
+    if isinstance(spec, dict):
+        limit = parse_limit(spec["rate"])
+        return Limit(limit.count, limit.period, spec.get("burst"))
+    count, _, unit = spec.replace(" per ", "/").partition("/")
+    unit = unit.strip().rstrip("s")
+    if unit not in PERIODS:
+        raise ValueError(f"Unknown rate limit period in {spec!r}")
+    return Limit(int(count), PERIODS[unit])
+
+
+class TokenBuckets:
+    """Per-key token buckets held in one dict.
+
+    Each bucket is ``[tokens, last_refill, limit]``. Once there are ``max_keys`` keys,
+    buckets that have refilled completely are dropped; they hold no state
+    worth keeping. If that frees less than a tenth of ``max_keys``, the oldest
+    buckets make up the rest.
+    """
+
+    def __init__(self, max_keys=100_000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets = {}
+
+    def allow(self, key, limit):
+        """0.0 if the request may proceed, else seconds until a token is available."""
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._evict(now)
+            self._buckets[key] = [limit.burst - 1.0, now, limit]
+            return 0.0
+        tokens = bucket[0] + (now - bucket[1]) * limit.rate
+        if tokens > limit.burst:
+            tokens = limit.burst
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / limit.rate
+
+    def _evict(self, now):
+        # Free at least a tenth of max_keys per pass so the scan is paid once per that many new keys
+        target = max(1, self.max_keys // 10)
+        idle, oldest = [], []
+        for key, (tokens, last, limit) in self._buckets.items():
+            if tokens + (now - last) * limit.rate >= limit.burst:
+                idle.append(key)
+            elif len(oldest) < target:
+                oldest.append(key)
+        for key in idle:
+            del self._buckets[key]
+        for key in oldest[:max(0, target - len(idle))]:  # not enough idle; drop the oldest insertions
+            del self._buckets[key]
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+_SLIDING_WINDOW = """
+local previous = tonumber(redis.call('GET', KEYS[1]) or '0')
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[2]) + current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('INCR', KEYS[2])
+redis.call('PEXPIRE', KEYS[2], ARGV[3])
+return 1
+"""
+
+
+class RedisSlidingWindow:
+    """Sliding-window counter shared by every replica through Redis.
+
+    The previous fixed window's count is weighted by how much of it still
+    overlaps the sliding window, which approximates a true sliding log in two
+    keys per limit. The check and the increment run in one Lua script.
+    """
+
+    def __init__(self, url="redis://localhost:6379/0", prefix="slizzai:ratelimit", max_connections=32,
+                 clock=time.time):
+        import redis.asyncio as aioredis
+
+        self._client = aioredis.Redis(connection_pool=aioredis.ConnectionPool.from_url(
+            url, max_connections=max_connections))
+        self._script = self._client.register_script(_SLIDING_WINDOW)
+        self.prefix = prefix
+        self.clock = clock
+
+    async def allow(self, key, limit):
+        now = self.clock()
+        window = int(now // limit.period)
+        elapsed = now / limit.period - window
+        base = f"{self.prefix}:{key[0]}:{key[1] or '*'}"
+        allowed = await self._script(
+            keys=[f"{base}:{window - 1}", f"{base}:{window}"],
+            args=[limit.count, 1.0 - elapsed, int(limit.period * 2000)],
+        )
+        return 0.0 if allowed else (1.0 - elapsed) * limit.period
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class RateLimiter:
+    """Choose the limit for a request and charge it against a backend.
+
+    Most specific wins: the tenant's limit for the route, then the route's
+    limit, then the tenant's default, then the global default. Route-specific
+    limits get their own bucket; default limits share one bucket per client
+    across all routes. A missing limit, or a path in ``exempt``, means
+    unlimited. Only tenants named in ``tenants`` are keyed by the tenant
+    header, which is assumed to be set by an authenticating proxy; everyone
+    else is keyed by client address.
+    """
+
+    def __init__(self, default=None, routes=None, tenants=None, tenant_header="x-tenant-id",
+                 exempt=(), backend=None, local=None):
+        self.default = parse_limit(default)
+        self.routes = {path: parse_limit(spec) for path, spec in (routes or {}).items()}
+        self.tenants = {
+            tenant: {path: parse_limit(spec) for path, spec in table.items()}
+            for tenant, table in (tenants or {}).items()
+        }
+        self.tenant_header = tenant_header.lower().encode("latin-1")
+        self.exempt = frozenset(exempt)
+        self.local = local or TokenBuckets()
+        self.backend = backend
+        self.allowed = self.rejected = self.backend_errors = 0
+
+    @classmethod
+    def from_config(cls, config, backend=None):
+        """Limiter from a ``rate_limits`` config section; None when it sets no limits.
+
+        ``redis_url`` switches to the shared sliding-window backend.
+        """
+        config = dict(config or {})
+        if not (config.get("default") or config.get("routes") or config.get("tenants")):
+            return None
+        if backend is None and config.get("redis_url"):
+            backend = RedisSlidingWindow(config["redis_url"])
+        return cls(
+            default=config.get("default"),
+            routes=config.get("routes"),
+            tenants=config.get("tenants"),
+            tenant_header=config.get("tenant_header", "x-tenant-id"),
+            exempt=config.get("exempt") or (),
+            backend=backend,
+        )
+
+    def resolve(self, scope):
+        """(bucket key, Limit) for an ASGI scope; Limit is None when unlimited."""
+        path = scope["path"]
+        if path in self.exempt:
+            return None, None
+        tenant = None
+        name = self.tenant_header
+        for header, value in scope["headers"]:
+            if header == name:
+                tenant = value.decode("latin-1")
+                break
+        table = self.tenants.get(tenant) if tenant is not None else None
+        if table is None:
+            tenant = None  # unknown tenant ids would let a client mint fresh buckets
+        limit = table.get(path) if table else None
+        if limit is None:
+            limit = self.routes.get(path)
+        if limit is None:
+            limit = (table.get("default") if table else None) or self.default
+            path = None
+        if tenant is None:
+            client = scope.get("client")
+            tenant = client[0] if client else "-"
+        return (tenant, path), limit
+
+    def check_local(self, scope):
+        """0.0 to admit the request, otherwise the Retry-After delay; in-process buckets only."""
+        key, limit = self.resolve(scope)
+        if limit is None:
+            return 0.0
+        wait = self.local.allow(key, limit)
+        if wait:
+            self.rejected += 1
+        else:
+            self.allowed += 1
+        return wait
+
+    async def check(self, scope):
+        """Like check_local, but through the shared backend when there is one."""
+        if self.backend is None:
+            return self.check_local(scope)
+        key, limit = self.resolve(scope)
+        if limit is None:
+            return 0.0
+        try:
+            wait = await self.backend.allow(key, limit)
+        except Exception:
+            self.backend_errors += 1
+            wait = self.local.allow(key, limit)
+        if wait:
+            self.rejected += 1
+        else:
+            self.allowed += 1
+        return wait
+
+    async def close(self):
+        if self.backend is not None:
+            await self.backend.close()
+
+    def stats(self):
+        return {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "backend_errors": self.backend_errors,
+            "local_buckets": len(self.local),
+            "backend": type(self.backend).__name__ if self.backend is not None else "local",
+        }
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware answering 429 with Retry-After once a limit is used up."""
+
+    def __init__(self, app, limiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        limiter = self.limiter
+        # Skip a coroutine per request when the buckets are in process
+        wait = limiter.check_local(scope) if limiter.backend is None else await limiter.check(scope)
+        if not wait:
+            return await self.app(scope, receive, send)
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_REJECT_BODY)).encode()),
+                (b"retry-after", str(max(1, int(wait + 0.999))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _REJECT_BODY})
\ No newline at end of file
@@ -2,6 +2,11 @@
 SlizzAi Composer module: Orchestrates Nuninex, Omni, and optional Feedback engines.
 """
 
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
 from loguru import logger
 
 try:
@@ -22,49 +27,208 @@ except (ImportError, AttributeError):
     FeedbackEngine = None
     logger.warning("feedback_loop.FeedbackEngine could not be imported or does not exist.")
 
+class _EngineLane:
+    """
+    Worker pool for one engine with a fixed number of call slots.
+
+    A call holds its slot until the engine returns, even after the caller stopped
+    waiting, so an engine whose slots are all held by hung calls rejects new ones
+    at once instead of queueing them or starving the other engines.
+    """
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(size)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"composer-{name}")
+
+    def submit(self, fn, *args):
+        """
+        Start ``fn`` on this engine's pool, or return None if every slot is held.
+        """
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            return None
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+def _shutdown_lanes(lanes):
+    for lane in list(lanes.values()):
+        lane.shutdown()
+
+
 class SlizzAiComposer:
     """
     Composer class for orchestrating Nuninex, Omni, and Feedback engines.
+
+    Use it as a context manager, or call close(), to stop the engines' worker pools.
     """
 
     def __init__(self, config):
         """
         Initialize the SlizzAiComposer with configuration for each engine.
+
+        Optional keys: ``timeouts`` (seconds per engine name), ``default_timeout``,
+        ``max_workers`` (concurrent calls per engine, feedback included),
+        ``concurrency`` (the same, per engine name) and ``defer_feedback``
+        (evaluate feedback off the response path).
         """
         self.nuninex = NuninexResolver(config.get("nuninex")) if NuninexResolver else None
         self.omni = OmniController(config.get("omni")) if OmniController else None
         self.feedback = FeedbackEngine(config.get("feedback")) if FeedbackEngine and config.get("feedback") else None
+        self.timeouts = dict(config.get("timeouts") or {})
+        self.default_timeout = config.get("default_timeout", 30.0)
+        self.defer_feedback = bool(config.get("defer_feedback", False))
+        self.max_workers = config.get("max_workers", 4)
+        self.concurrency = dict(config.get("concurrency") or {})
+        self._lanes = {}  # engine name -> _EngineLane, built on first use
+        self._lanes_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _shutdown_lanes, self._lanes)
+
+        # Engine DAG: name -> (callable(input, upstream_results), names it depends on)
+        self.stages = {}
+        if self.nuninex:
+            self.add_stage("nuninex", lambda data, upstream: self.nuninex.process(data))
+        if self.omni:
+            self.add_stage("omni", lambda data, upstream: self.omni.invoke(data))
+
+    def add_stage(self, name, fn, after=()):
+        """
+        Register an engine call; stages without a path between them run concurrently.
+        """
+        missing = [dep for dep in after if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on unknown stages {missing}")
+        self.stages[name] = (fn, tuple(after))
+
+    def _lane(self, name):
+        with self._lanes_lock:
+            lane = self._lanes.get(name)
+            if lane is None:
+                lane = self._lanes[name] = _EngineLane(name, self.concurrency.get(name, self.max_workers))
+            return lane
+
+    def _waves(self):
+        """
+        Group stages into waves; every stage in a wave only depends on earlier waves.
+        """
+        placed, waves = set(), []
+        while len(placed) < len(self.stages):
+            wave = [name for name, (_, after) in self.stages.items()
+                    if name not in placed and all(dep in placed for dep in after)]
+            waves.append(wave)
+            placed.update(wave)
+        return waves
+
+    def _run_stages(self, payload):
+        """
+        Run the DAG wave by wave. A stage that misses its deadline, raises, or is
+        rejected because its engine has no free slot is left out of the results,
+        and stages downstream of it are skipped.
+        """
+        results, errors = {}, {}
+        for wave in self._waves():
+            started = time.monotonic()
+            futures = {}
+            for name in wave:
+                fn, after = self.stages[name]
+                failed = [dep for dep in after if dep not in results]
+                if failed:
+                    errors[name] = f"skipped: upstream {failed} did not finish"
+                    continue
+                upstream = {dep: results[dep] for dep in after}
+                future = self._lane(name).submit(fn, payload.get(name, {}), upstream)
+                if future is None:
+                    errors[name] = "rejected: all calls to this engine are still running"
+                    logger.warning(f"🚫 {name} rejected, its {self._lane(name).size} slots are busy")
+                    continue
+                futures[name] = future
+            for name, future in futures.items():
+                remaining = self.timeouts.get(name, self.default_timeout) - (time.monotonic() - started)
+                try:
+                    results[name] = future.result(timeout=max(0.0, remaining))
+                except FutureTimeout:
+                    # The worker thread keeps running and holds its slot; its result is discarded
+                    errors[name] = "timeout"
+                    logger.warning(f"⏱️ {name} exceeded its {self.timeouts.get(name, self.default_timeout)}s deadline")
+                except Exception as e:
+                    errors[name] = repr(e)
+                    logger.error(f"❌ {name} failed: {e}")
+        return results, errors
+
+    def _evaluate_feedback(self, feedback_input):
+        try:
+            return self.feedback.evaluate(feedback_input)
+        except Exception as e:
+            logger.error(f"❌ Feedback evaluation failed: {e}")
+            return None
 
     def compose(self, payload: dict) -> dict:
         """
         Compose the invocation arc using Nuninex, Omni, and optionally Feedback.
+
+        Independent engines run concurrently, so latency is that of the slowest
+        engine rather than the sum. Engines that time out or fail are reported
+        under ``errors`` and the rest of the arc is still returned.
         """
         logger.info("🔮 Composing SlizzAi invocation arc")
 
-        # Step 1: Nuninex Resolution
-        nuninex_input = payload.get("nuninex", {})
-        nuninex_result = self.nuninex.process(nuninex_input) if self.nuninex else None
+        results, errors = self._run_stages(payload)
+        nuninex_result = results.get("nuninex")
+        omni_response = results.get("omni")
 
-        # Step 2: Omni Invocation
-        omni_input = payload.get("omni", {})
-        omni_response = self.omni.invoke(omni_input) if self.omni else None
-
-        # Step 3: Feedback Loop (optional)
+        # Feedback Loop (optional) sees every engine result, so it runs after the DAG
         feedback_result = None
         if self.feedback:
             feedback_input = {
                 "nuninex": nuninex_result,
                 "omni": omni_response
             }
-            feedback_result = self.feedback.evaluate(feedback_input)
+            if self.defer_feedback:
+                if self._lane("feedback").submit(self._evaluate_feedback, feedback_input) is None:
+                    logger.warning("🚫 Deferred feedback dropped, earlier evaluations are still running")
+            else:
+                feedback_result = self._evaluate_feedback(feedback_input)
 
+        extra = {name: value for name, value in results.items() if name not in ("nuninex", "omni")}
         return {
             "nuninex_result": nuninex_result,
             "omni_response": omni_response,
             "feedback": feedback_result,
-            "status": "SlizzAi-Composer completed arc"
+            **({"results": extra} if extra else {}),
+            "errors": errors,
+            "status": "SlizzAi-Composer completed partial arc" if errors else "SlizzAi-Composer completed arc"
         }
 
+    def close(self):
+        """
+        Stop the worker pools; deferred feedback already submitted still runs.
+        """
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def stats(self) -> dict:
+        """
+        Calls rejected per engine because all of its slots were busy.
+        """
+        with self._lanes_lock:
+            return {name: {"size": lane.size, "rejected": lane.rejected} for name, lane in self._lanes.items()}
+
     def health_check(self) -> dict:
         """
         Public method to check the health of the composer and its engines.
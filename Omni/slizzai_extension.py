@@ -1,12 +1,124 @@
+import argparse
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from import_nuninex import router as nuninex_router
-from import_omni_controller import router as omni_router
+from fastapi.responses import JSONResponse
+import gateway_offload
+import import_nuninex
+import import_omni_controller
+import memory_cache
+import slizzai_logging
+import yaml
+from health_check import UNHEALTHY, CachedHealth
+from rate_limit import RateLimiter, RateLimitMiddleware
+from import_nuninex import router as nuninex_router, init_resolver
+from import_omni_controller import router as omni_router, init_controller
+
+# Heavy components are built after the server starts accepting connections
+COMPONENTS = {
+    "nuninex": init_resolver,
+    "omni": init_controller,
+}
+readiness = {name: {"state": "pending"} for name in COMPONENTS}
+loop_lag = gateway_offload.LoopLagMonitor()
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
+
+def load_config_section(name, path=CONFIG_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as file:
+        return (yaml.safe_load(file) or {}).get(name) or {}
+
+async def _warm(name, init):
+    start = time.perf_counter()
+    try:
+        await asyncio.to_thread(init)
+        readiness[name] = {"state": "ready", "init_s": round(time.perf_counter() - start, 3)}
+        slizzai_logging.log_event("component.ready", component=name, init_s=readiness[name]["init_s"])
+    except Exception as e:
+        readiness[name] = {"state": "failed", "error": repr(e)}
+        slizzai_logging.log_event("component.failed", logging.ERROR, component=name, error=repr(e))
+
+def pingable_engines():
+    # Built components that answer ping(); their health is part of readiness
+    built = {"nuninex": import_nuninex.resolver, "omni": import_omni_controller.controller}
+    return {name: engine for name, engine in built.items() if hasattr(engine, "ping")}
+
+engine_health = CachedHealth(pingable_engines)
+
+async def warm_up():
+    readiness.clear()
+    readiness.update({name: {"state": "pending"} for name in COMPONENTS})
+    await asyncio.gather(*(_warm(name, init) for name, init in COMPONENTS.items()))
 
-app = FastAPI(title="SlizzAi Unified Engine")
+@asynccontextmanager
+async def lifespan(app):
+    slizzai_logging.configure(**load_config_section("logging"))
+    loop_lag.start()
+    memory_cache.engine_cache = memory_cache.cache_from_config(load_config_section("cache"))
+    warming = asyncio.create_task(warm_up())
+    yield
+    warming.cancel()
+    await loop_lag.stop()
+    if memory_cache.engine_cache is not None:
+        await memory_cache.engine_cache.close()
+        memory_cache.engine_cache = None
+    if rate_limiter is not None:
+        await rate_limiter.close()
+
+app = FastAPI(title="SlizzAi Unified Engine", lifespan=lifespan)
+
+rate_limiter = RateLimiter.from_config(load_config_section("rate_limits"))
+if rate_limiter is not None:
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
 
 app.include_router(nuninex_router, prefix="/api")
 app.include_router(omni_router, prefix="/api")
 
 @app.get("/slizzai")
 async def read_slizzai():
-    return {"message": "SlizzAi extension is working"}
\ No newline at end of file
+    return {"message": "SlizzAi extension is working"}
+
+@app.get("/healthz")
+async def liveness():
+    # The process is up and serving; says nothing about the components
+    return {"status": "alive"}
+
+@app.get("/readyz")
+async def readiness_probe():
+    # Only the first check waits on the engines; later ones serve the cached snapshot
+    health = await gateway_offload.call(engine_health.snapshot)
+    ready = (all(component["state"] == "ready" for component in readiness.values())
+             and not any(status in UNHEALTHY for status in health["engines"].values()))
+    return JSONResponse({"ready": ready, "components": readiness, "engines": health},
+                        status_code=200 if ready else 503)
+
+@app.get("/metrics/loop")
+async def loop_metrics():
+    cache = memory_cache.engine_cache
+    return {"event_loop_lag": loop_lag.stats(), **gateway_offload.stats(),
+            "cache": cache.stats() if cache is not None else None,
+            "rate_limit": rate_limiter.stats() if rate_limiter is not None else None,
+            "logging": slizzai_logging.stats()}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SlizzAi gateway")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--offload-workers", type=int, default=gateway_offload.OFFLOAD_WORKERS,
+                        help="threads for synchronous backend calls")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print import time per module and component init time, then exit")
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        print(profile_startup("slizzai_extension", app_dir=os.path.dirname(os.path.abspath(__file__))))
+    else:
+        import uvicorn
+        gateway_offload.configure(workers=args.offload_workers)
+        uvicorn.run(app, host=args.host, port=args.port)
\ No newline at end of file
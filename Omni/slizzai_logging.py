@@ -0,0 +1,215 @@
+"""Structured event logging that never writes to disk on the caller's thread.
+
+log_event() checks the level before it builds anything, then puts a plain
+tuple on a bounded queue. A background listener turns it into a LogRecord,
+formats it as one JSON line and writes it to a file rotated by size and by
+age. Messages are %-formatted on the writer thread, so pass immutable
+arguments. If the queue is full, records are dropped and counted.
+High-frequency events can be sampled down to one in N with ``sample_every``.
+"""
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOGGER_NAME = "slizzai"
+DEFAULT_PATH = "slizzai.log"
+
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+# log_event fields that would overwrite a LogRecord attribute or a JSON key are written as field_<name>
+_CLASHING = _RESERVED | {"event", "ts", "level", "logger", "exc"}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, any ``extra`` fields, exc."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=repr, separators=(",", ":"))
+
+
+class RotatingJSONFileHandler(RotatingFileHandler):
+    """Roll the file over at ``max_bytes`` or every ``interval`` seconds, whichever comes first.
+
+    Backups are numbered like RotatingFileHandler's, so a size rollover never
+    overwrites a time rollover from the same period.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=5, interval=86400.0):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.interval = interval
+        self.rollover_at = time.time() + interval if interval else None
+        self.setFormatter(JSONFormatter())
+
+    def shouldRollover(self, record):
+        # Checks the size already written instead of formatting the record a second time
+        if self.maxBytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() >= self.maxBytes:
+                return True
+        return self.rollover_at is not None and time.time() >= self.rollover_at
+
+    def doRollover(self):
+        super().doRollover()
+        if self.interval:
+            self.rollover_at = time.time() + self.interval
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller and leaves formatting to the listener.
+
+    The queue is an unbounded SimpleQueue (no locks in Python code), so the
+    bound is a size check; it may overshoot by a few records under contention.
+    """
+
+    def __init__(self, log_queue, maxsize):
+        super().__init__(log_queue)
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, item):
+        if self.queue.qsize() >= self.maxsize:
+            self.dropped += 1
+        else:
+            self.queue.put_nowait(item)
+
+
+class EventListener(QueueListener):
+    """QueueListener that also accepts ``(created, level, event, fields)`` tuples from log_event."""
+
+    def prepare(self, item):
+        if item.__class__ is not tuple:
+            return item
+        created, level, event, fields = item
+        record = logging.LogRecord(LOGGER_NAME, level, "", 0, "%s", (event,), None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        for key, value in fields.items():
+            record.__dict__["field_" + key if key in _CLASHING else key] = value
+        record.event = event
+        return record
+
+
+class _Pipeline:
+    def __init__(self, logger, handler, listener, sample_every):
+        self.logger = logger
+        self.handler = handler
+        self.listener = listener
+        self.sample_every = sample_every
+        self.counters = {event: itertools.count() for event in sample_every}
+        self.sampled_out = 0
+
+
+_pipeline = None
+_lock = threading.Lock()
+
+
+def configure(path=DEFAULT_PATH, level=logging.INFO, max_bytes=10 * 1024 * 1024, backup_count=5,
+              interval=86400.0, queue_size=10_000, sample_every=None, console=False):
+    """(Re)build the pipeline; returns the ``slizzai`` logger.
+
+    ``sample_every`` maps an event name to N, keeping one in every N of them.
+    ``console`` also writes JSON lines to stderr from the listener thread.
+    The SLIZZAI_LOG_PATH environment variable overrides ``path``.
+    """
+    global _pipeline
+    path = os.environ.get("SLIZZAI_LOG_PATH", path)
+    with _lock:
+        if _pipeline is not None:
+            _shutdown_locked()
+        handlers = [RotatingJSONFileHandler(path, max_bytes, backup_count, interval)]
+        if console:
+            stream = logging.StreamHandler()
+            stream.setFormatter(JSONFormatter())
+            handlers.append(stream)
+        log_queue = queue.SimpleQueue()
+        handler = DroppingQueueHandler(log_queue, queue_size)
+        listener = EventListener(log_queue, *handlers, respect_handler_level=True)
+
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.handlers[:] = [handler]
+        logger.setLevel(level)
+        logger.propagate = False
+        listener.start()
+        _pipeline = _Pipeline(logger, handler, listener, dict(sample_every or {}))
+    return logger
+
+
+def _shutdown_locked():
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.listener.stop()  # drains whatever is still queued
+        for handler in _pipeline.listener.handlers:
+            handler.close()
+        _pipeline.logger.removeHandler(_pipeline.handler)
+        _pipeline = None
+
+
+def shutdown():
+    """Flush queued records and close the files."""
+    with _lock:
+        _shutdown_locked()
+
+
+atexit.register(shutdown)
+
+
+def get_logger():
+    """The pipeline's logger, configuring it with defaults on first use."""
+    pipeline = _pipeline
+    return pipeline.logger if pipeline is not None else configure()
+
+
+def log_event(event, level=logging.INFO, **fields):
+    """Log ``event`` with structured ``fields``; costs a level check when the level is off.
+
+    Fields named like a LogRecord attribute or an output key (``msg``,
+    ``level``, ``event``, ...) are written as ``field_<name>``.
+    """
+    pipeline = _pipeline
+    if pipeline is None:
+        get_logger()
+        pipeline = _pipeline
+    logger = pipeline.logger
+    if not logger.isEnabledFor(level):
+        return
+    every = pipeline.sample_every.get(event) if pipeline.sample_every and isinstance(event, str) else None
+    if every:
+        if next(pipeline.counters[event]) % every:
+            pipeline.sampled_out += 1
+            return
+        fields["sample_every"] = every
+    # The listener builds the LogRecord; Logger.log would also walk the stack for
+    # the caller's file and line, which callers of log_event never need
+    pipeline.handler.enqueue((time.time(), level, event, fields))
+
+
+def stats():
+    pipeline = _pipeline
+    if pipeline is None:
+        return {"configured": False}
+    return {
+        "configured": True,
+        "queued": pipeline.handler.queue.qsize(),
+        "dropped": pipeline.handler.dropped,
+        "sampled_out": pipeline.sampled_out,
+    }
\ No newline at end of file
@@ -1,4 +1,7 @@
 """Unified AI module combining multiple engine stubs for demonstration purposes."""
+from concurrent.futures import ThreadPoolExecutor
+
+from task_router import default_router
 
 class VisionEngine:
     """Stub Vision Engine."""
@@ -6,12 +9,20 @@ class VisionEngine:
         """Process vision input."""
         return {"result": "VisionEngine processed input"}
 
+    def run_batch(self, inputs):
+        """Process a batch of vision inputs in one call."""
+        return [{"result": "VisionEngine processed input"} for _ in inputs]
+
 class NLPEngine:
     """Stub NLP Engine."""
     def run(self, input_data):
         """Process NLP input."""
         return {"result": "NLPEngine processed input"}
 
+    def run_batch(self, inputs):
+        """Process a batch of NLP inputs in one call."""
+        return [{"result": "NLPEngine processed input"} for _ in inputs]
+
 class SpeechEngine:
     """Stub Speech Engine."""
     def run(self, input_data):
@@ -40,8 +51,11 @@ class GenerationEngine:
 
 class UnifiedAI:
     """Unified AI system that routes input to the appropriate engine."""
-    def __init__(self):
+    def __init__(self, router=None, max_workers=8):
         """Initialize all engines."""
+        self.router = router or default_router
+        self.max_workers = max_workers
+        self._executor = None
         self.engines = {
             "vision": VisionEngine(),
             "nlp": NLPEngine(),
@@ -61,19 +75,7 @@ class UnifiedAI:
 
     def detect_task(self, input_data):
         """Detect the type of task based on input data."""
-        if isinstance(input_data, bytes):
-            return "vision"
-        if isinstance(input_data, str):
-            if input_data.startswith("speak:"):
-                return "speech"
-            if "generate:" in input_data:
-                return "generation"
-            if "retrieve:" in input_data:
-                return "retrieval"
-            if "logic:" in input_data:
-                return "logic"
-            return "nlp"
-        return "nlp"
+        return self.router.classify(input_data)
 
     def run(self, input_data):
         """Run the unified AI system on the input data."""
@@ -83,6 +85,62 @@ class UnifiedAI:
         except ValueError as e:
             return {"error": str(e)}
 
+    def run_batch(self, inputs):
+        """Run many inputs, batching them per engine; results keep input order.
+
+        Engines with a ``run_batch`` method get their whole group in one call;
+        the rest run item by item on a thread pool. A failing item yields
+        ``{"error": ...}`` in its slot without affecting the others.
+        """
+        inputs = list(inputs)
+        groups = {}
+        for index, task_type in enumerate(self.router.classify_batch(inputs)):
+            groups.setdefault(task_type, []).append(index)
+
+        results = [None] * len(inputs)
+        pending = []
+        executor = self._get_executor()
+        for task_type, indices in groups.items():
+            engine = self.engines.get(task_type)
+            if engine is None:
+                for index in indices:
+                    results[index] = {"error": f"No engine found for task: {task_type}"}
+            elif hasattr(engine, "run_batch"):
+                batch = [inputs[index] for index in indices]
+                pending.append((indices, executor.submit(self._run_native_batch, engine, batch)))
+            else:
+                for index in indices:
+                    pending.append(([index], executor.submit(self._run_one, engine, inputs[index])))
+
+        for indices, future in pending:
+            for index, result in zip(indices, future.result()):
+                results[index] = result
+        return results
+
+    def _run_native_batch(self, engine, batch):
+        """Call an engine's run_batch, isolating per-item errors if the batch fails."""
+        try:
+            outputs = engine.run_batch(batch)
+            if len(outputs) != len(batch):
+                raise ValueError(f"run_batch returned {len(outputs)} results for {len(batch)} inputs")
+        except Exception:
+            return [self._run_one(engine, item)[0] for item in batch]
+        return [{"error": str(o)} if isinstance(o, Exception) else o for o in outputs]
+
+    @staticmethod
+    def _run_one(engine, input_data):
+        """Run a single input, returning a one-element result list."""
+        try:
+            return [engine.run(input_data)]
+        except Exception as e:
+            return [{"error": str(e)}]
+
+    def _get_executor(self):
+        """Create the fallback thread pool on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="unified-ai")
+        return self._executor
+
 # Example usage
 if __name__ == "__main__":
     ai = UnifiedAI()
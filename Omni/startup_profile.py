@@ -0,0 +1,65 @@
+"""Cold-start profile for the gateway: import time per module plus component init.
+
+Imports the app module in a fresh interpreter under ``-X importtime`` (so
+nothing is already cached), then runs each entry of its ``COMPONENTS`` dict
+and times it.
+"""
+import json
+import os
+import subprocess
+import sys
+
+_CHILD = """
+import os, sys
+# Search the app directory after the standard library so local modules cannot shadow it
+sys.path[:] = [p for p in sys.path if p not in ("", os.getcwd())] + [sys.argv[2]]
+import json, time
+start = time.perf_counter()
+module = __import__(sys.argv[1])
+report = {"import_s": time.perf_counter() - start, "components": {}}
+for name, init in getattr(module, "COMPONENTS", {}).items():
+    t = time.perf_counter()
+    try:
+        init()
+        report["components"][name] = {"init_s": time.perf_counter() - t}
+    except Exception as e:
+        report["components"][name] = {"init_s": time.perf_counter() - t, "error": repr(e)}
+print("STARTUP-REPORT " + json.dumps(report))
+"""
+
+
+def parse_importtime(stderr):
+    """[(module, self_us, cumulative_us, depth)] from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def profile_startup(module="slizzai_extension", top=20, app_dir=None):
+    """Return a printable report of where ``module``'s cold start spends time."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, module, app_dir or os.getcwd()],
+        capture_output=True, text=True,
+    )
+    report_line = next((l for l in proc.stdout.splitlines() if l.startswith("STARTUP-REPORT ")), None)
+    if report_line is None:
+        return f"Startup profile failed:\n{proc.stderr[-2000:]}"
+    report = json.loads(report_line[len("STARTUP-REPORT "):])
+    rows = parse_importtime(proc.stderr)
+
+    lines = [f"Import of {module}: {report['import_s'] * 1000:.1f} ms ({len(rows)} modules)", ""]
+    lines.append(f"Top {top} modules by cumulative import time:")
+    lines.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {'  ' * depth}{name}")
+    if report["components"]:
+        lines += ["", "Component init (runs after the server is up):"]
+        for name, info in report["components"].items():
+            note = f"  FAILED {info['error']}" if "error" in info else ""
+            lines.append(f"{info['init_s'] * 1000:14.1f} ms  {name}{note}")
+    return "\n".join(lines)
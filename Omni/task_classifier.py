@@ -1,14 +1,8 @@
 # task_classifier.py
+from task_router import default_router
+
 def classify(input_data):
-    if isinstance(input_data, bytes):
-        return "vision"
-    elif input_data.startswith("speak:"):
-        return "speech"
-    elif input_data.startswith("generate:"):
-        return "generation"
-    elif input_data.startswith("retrieve:"):
-        return "retrieval"
-    elif input_data.startswith("logic:"):
-        return "logic"
-    else:
-        return "nlp"
\ No newline at end of file
+    return default_router.classify(input_data)
+
+def classify_batch(inputs):
+    return default_router.classify_batch(inputs)
\ No newline at end of file
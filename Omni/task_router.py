@@ -0,0 +1,147 @@
+"""Single routing engine shared by UnifiedAI and task_classifier."""
+import os
+import re
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
+
+_MISS = object()
+
+DEFAULT_TASK = "nlp"
+BINARY_TASK = "vision"
+
+# Built-in rules; every rule is a literal prefix matched at the start of the input
+DEFAULT_RULES = [
+    {"prefix": "speak:", "task": "speech"},
+    {"prefix": "generate:", "task": "generation"},
+    {"prefix": "retrieve:", "task": "retrieval"},
+    {"prefix": "logic:", "task": "logic"},
+]
+
+
+class TaskRouter:
+    """Map an input to a task name using compiled prefix and substring rules.
+
+    Prefixes of the usual ``verb:`` form live in one dict keyed by everything
+    up to the first colon, so matching them is one bounded ``find``, one slice
+    and one hash probe no matter how many rules there are. Other prefixes are
+    grouped in one dict per length, and the longest matching prefix wins.
+    ``contains`` rules are folded into one precompiled regex that is searched
+    only when no prefix matched.
+    """
+
+    def __init__(self, rules=None, default=DEFAULT_TASK, binary=BINARY_TASK):
+        """Compile ``rules``; later rules override earlier ones with the same key."""
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.default = default
+        self.binary = binary
+        self._compile()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a router from a ``routing`` config section (dict or YAML path).
+
+        Rules from config are added on top of the built-in ones.
+        """
+        if isinstance(config, str):
+            import yaml
+
+            with open(config, "r") as file:
+                config = (yaml.safe_load(file) or {}).get("routing") or {}
+        return cls(
+            rules=DEFAULT_RULES + list(config.get("rules") or []),
+            default=config.get("default", DEFAULT_TASK),
+            binary=config.get("binary", BINARY_TASK),
+        )
+
+    def add_rule(self, task, prefix=None, contains=None):
+        """Register a plug-in rule and recompile."""
+        if (prefix is None) == (contains is None):
+            raise ValueError("A rule needs exactly one of prefix or contains")
+        self.rules.append({"prefix": prefix, "task": task} if prefix is not None else {"contains": contains, "task": task})
+        self._compile()
+
+    def _compile(self):
+        colon, by_length, contains = {}, {}, {}
+        for rule in self.rules:
+            prefix = rule.get("prefix")
+            if prefix and prefix.find(":") == len(prefix) - 1:
+                colon[prefix] = rule["task"]
+            elif prefix:
+                by_length.setdefault(len(prefix), {})[prefix] = rule["task"]
+            elif rule.get("contains"):
+                contains[rule["contains"]] = rule["task"]
+            else:
+                raise ValueError(f"Rule needs a prefix or contains key: {rule}")
+        self._colon = colon
+        self._colon_span = max(map(len, colon), default=0)
+        self._prefix_tables = [(n, by_length[n]) for n in sorted(by_length, reverse=True)]
+        self._contains = contains
+        self._contains_re = (
+            re.compile("|".join(re.escape(s) for s in sorted(contains, key=len, reverse=True)))
+            if contains else None
+        )
+
+    def classify(self, input_data):
+        """Return the task name for one input."""
+        if input_data.__class__ is str:
+            return self._classify_str(input_data)
+        return self._classify_other(input_data)
+
+    def _classify_other(self, input_data):
+        if isinstance(input_data, (bytes, bytearray, memoryview)):
+            return self.binary
+        if isinstance(input_data, str):
+            return self._classify_str(input_data)
+        return self.default
+
+    def _classify_str(self, text):
+        cut = text.find(":", 0, self._colon_span) + 1
+        task = self._colon.get(text[:cut]) if cut else None
+        for length, table in self._prefix_tables:
+            if task is not None and length <= cut:
+                break  # the colon prefix is at least as long as what is left
+            longer = table.get(text[:length])
+            if longer is not None:
+                return longer
+        if task is not None:
+            return task
+        if self._contains_re is not None:
+            match = self._contains_re.search(text)
+            if match:
+                return self._contains[match.group()]
+        return self.default
+
+    def classify_batch(self, inputs):
+        """Classify many inputs in one call."""
+        if not isinstance(inputs, (list, tuple)):
+            inputs = list(inputs)
+        if self._prefix_tables:
+            classify = self.classify
+            return [classify(item) for item in inputs]
+        # Only colon prefixes: one comprehension with no per-item Python calls
+        get, span, other = self._colon.get, self._colon_span, self._classify_other
+        miss = self.default if self._contains_re is None else _MISS
+        results = [
+            get(item[:item.find(":", 0, span) + 1], miss) if item.__class__ is str else other(item)
+            for item in inputs
+        ]
+        if miss is _MISS:
+            search, contains, default = self._contains_re.search, self._contains, self.default
+            for index, task in enumerate(results):
+                if task is _MISS:
+                    match = search(inputs[index])
+                    results[index] = contains[match.group()] if match else default
+        return results
+
+
+def load_default_router(path=CONFIG_PATH):
+    """Router with plug-in rules from the ``routing`` section of config.yaml, if any."""
+    if not os.path.exists(path):
+        return TaskRouter()
+    try:
+        return TaskRouter.from_config(path)
+    except ImportError:  # PyYAML not installed; built-in rules only
+        return TaskRouter()
+
+
+default_router = load_default_router()
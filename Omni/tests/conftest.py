@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+OMNI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Appended rather than prepended so local modules can't shadow the standard library
+for path in (OMNI, os.path.join(OMNI, "SlizzAi")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+# Keep the gateway's event log out of the source tree
+os.environ.setdefault("SLIZZAI_LOG_PATH", os.path.join(tempfile.mkdtemp(prefix="slizzai-log-"), "slizzai.log"))
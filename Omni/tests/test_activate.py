@@ -0,0 +1,33 @@
+import sys
+import threading
+
+import activate
+
+
+def test_entry_points_import_lazily_once_per_config(tmp_path, monkeypatch):
+    (tmp_path / "lazy_engine_mod.py").write_text(
+        "import time\n"
+        "BUILT = []\n"
+        "class LazyEngine:\n"
+        "    def __init__(self, size=1):\n"
+        "        time.sleep(0.05)\n"
+        "        BUILT.append(size)\n"
+        "    def activate(self):\n"
+        "        self.active = True\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    activate.register_engine("lazy", "lazy_engine_mod:LazyEngine")
+    assert "lazy_engine_mod" not in sys.modules
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(activate.activate_engine("lazy"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(r) for r in results}) == 1 and results[0].active
+    big = activate.activate_engine("lazy", {"size": 4})
+    assert big is not results[0]
+    assert activate.activate_engine("lazy", {"size": 4}) is big
+    assert sys.modules["lazy_engine_mod"].BUILT == [1, 4]
+    assert "lazy" in activate.loaded_engines()
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import gateway_offload
+
+
+def test_sync_backend_runs_off_the_loop_and_async_backend_is_awaited():
+    async def native(x):
+        return ("async", x)
+
+    async def main():
+        loop_thread = threading.get_ident()
+        sync_thread = await gateway_offload.call(threading.get_ident)
+        assert sync_thread != loop_thread
+        assert await gateway_offload.call(native, 1) == ("async", 1)
+
+    asyncio.run(main())
+
+
+def test_slow_sync_backend_does_not_stall_the_loop():
+    monitor = gateway_offload.LoopLagMonitor(interval=0.01)
+
+    async def main():
+        monitor.start()
+        await asyncio.gather(*(gateway_offload.call(time.sleep, 0.2) for _ in range(4)))
+        await monitor.stop()
+
+    asyncio.run(main())
+    assert monitor.stats()["max_ms"] < 100
+
+
+def test_route_limit_caps_concurrency_and_rejects_after_timeout(monkeypatch):
+    gateway_offload.configure(route_limits={"test.route": 1})
+    monkeypatch.setattr(gateway_offload, "ROUTE_QUEUE_TIMEOUT", 0.05)
+
+    async def hold():
+        async with gateway_offload.limit("test.route"):
+            await asyncio.sleep(0.2)
+
+    async def main():
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        with pytest.raises(HTTPException) as excinfo:
+            async with gateway_offload.limit("test.route"):
+                pass
+        await holder
+        return excinfo.value.status_code
+
+    assert asyncio.run(main()) == 503
+    assert gateway_offload.stats()["routes"]["test.route"]["rejected"] == 1
@@ -0,0 +1,45 @@
+import time
+
+from fastapi.testclient import TestClient
+
+import slizzai_extension
+
+
+def wait_ready(client, deadline=2.0):
+    end = time.monotonic() + deadline
+    while True:
+        response = client.get("/readyz")
+        states = {c["state"] for c in response.json()["components"].values()}
+        if "pending" not in states or time.monotonic() > end:
+            return response
+        time.sleep(0.01)
+
+
+def test_liveness_is_up_before_components_are_ready(monkeypatch):
+    monkeypatch.setattr(slizzai_extension, "COMPONENTS", {"slow": lambda: time.sleep(0.3)})
+    with TestClient(slizzai_extension.app) as client:
+        assert client.get("/healthz").status_code == 200
+        assert client.get("/readyz").status_code == 503
+        assert wait_ready(client).status_code == 200
+
+
+def test_failed_component_keeps_gateway_unready():
+    # nuninex and omni are not installed in the test environment
+    with TestClient(slizzai_extension.app) as client:
+        response = wait_ready(client)
+        assert response.status_code == 503
+        assert response.json()["components"]["nuninex"]["state"] == "failed"
+
+
+def test_engine_that_fails_its_ping_keeps_gateway_unready(monkeypatch):
+    class DownEngine:
+        def ping(self):
+            return "DOWN"
+
+    monkeypatch.setattr(slizzai_extension, "COMPONENTS", {"fast": lambda: None})
+    monkeypatch.setattr(slizzai_extension.import_nuninex, "resolver", DownEngine())
+    monkeypatch.setattr(slizzai_extension, "engine_health", slizzai_extension.CachedHealth(slizzai_extension.pingable_engines))
+    with TestClient(slizzai_extension.app) as client:
+        response = wait_ready(client)
+        assert response.status_code == 503
+        assert response.json()["engines"]["engines"] == {"nuninex": "DOWN"}
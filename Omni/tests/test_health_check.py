@@ -0,0 +1,60 @@
+import threading
+import time
+
+from health_check import CachedHealth, check_engines
+
+
+class Engine:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.pings = 0
+
+    def ping(self):
+        self.pings += 1
+        if self.fail:
+            raise RuntimeError("down")
+        time.sleep(self.delay)
+        return "UP"
+
+
+def test_pings_run_concurrently_with_deadline():
+    hung = Engine(delay=1.0)
+    engines = {"a": Engine(0.1), "b": Engine(0.1), "c": Engine(fail=True), "hung": hung}
+    start = time.monotonic()
+    status, latency = check_engines(engines, timeout=0.3)
+    assert time.monotonic() - start < 0.5
+    assert status == {"a": "UP", "b": "UP", "c": "DOWN", "hung": "TIMEOUT"}
+    assert latency["a"] >= 100 and latency["hung"] is None
+    check_engines({"hung": hung}, timeout=0.05)
+    assert hung.pings == 1
+
+
+def test_cached_health_serves_stale_while_refreshing():
+    engine = Engine(delay=0.2)
+    health = CachedHealth({"a": engine}, ttl=0.05, timeout=1)
+    assert health.snapshot()["engines"] == {"a": "UP"}
+    time.sleep(0.06)
+    start = time.monotonic()
+    snapshot = health.snapshot()
+    assert time.monotonic() - start < 0.05
+    assert snapshot["refreshing"]
+    time.sleep(0.3)
+    assert engine.pings == 2
+    assert health.snapshot()["checked_at"] > snapshot["checked_at"]
+
+
+
+def test_direct_refresh_waits_for_background_refresh_and_keeps_its_flag():
+    engine = Engine(delay=0.1)
+    health = CachedHealth(lambda: {"a": engine}, ttl=0.01, timeout=1)
+    health.refresh()
+    time.sleep(0.02)
+    assert health.snapshot()["refreshing"]
+    direct = threading.Thread(target=health.refresh)
+    direct.start()
+    time.sleep(0.02)
+    health.snapshot()  # still refreshing: must not start a second background check
+    direct.join()
+    time.sleep(0.05)
+    assert engine.pings == 3 and not health._refreshing
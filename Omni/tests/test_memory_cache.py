@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+import memory_cache
+from memory_cache import AsyncCache, InMemoryBackend
+
+
+def test_l2_hit_after_l1_eviction_and_hit_ratio():
+    async def main():
+        cache = AsyncCache(l1_size=1, beta=0)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"answer": 42}
+
+        assert await cache.get_or_compute("nuninex", {"q": 1}, compute) == {"answer": 42}
+        await cache.set("nuninex", "other", [1, 2])  # evicts the first key from L1
+        assert await cache.get_or_compute("nuninex", {"q": 1}, compute) == {"answer": 42}
+        assert await cache.get("nuninex", {"q": 1}) == {"answer": 42}
+        return cache.stats(), calls
+
+    stats, calls = asyncio.run(main())
+    assert len(calls) == 1
+    assert (stats["misses"], stats["l2_hits"], stats["l1_hits"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_concurrent_misses_compute_once_and_zero_ttl_bypasses():
+    async def main():
+        cache = AsyncCache(namespaces={"omni": 0})
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_compute("nuninex", "k", compute) for _ in range(10)))
+        await cache.get_or_compute("omni", "k", compute)
+        await cache.get_or_compute("omni", "k", compute)
+        return results, calls, cache.stats()
+
+    results, calls, stats = asyncio.run(main())
+    assert results == ["value"] * 10
+    assert len(calls) == 3
+    assert stats["coalesced"] == 9
+
+
+def test_early_refresh_keeps_serving_on_failure_and_blocking_compute_is_offloaded():
+    async def main():
+        cache = AsyncCache(backend=InMemoryBackend(), codec="pickle", beta=1e9)
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return "cached"
+
+        await cache.get_or_compute("nuninex", "k", slow)
+
+        async def broken():
+            raise RuntimeError("engine down")
+
+        stale = await cache.get_or_compute("nuninex", "k", broken)
+        fresh = await cache.get_or_compute("nuninex", "new", lambda: "from thread")
+        return stale, fresh, cache.stats()["early_refreshes"]
+
+    assert asyncio.run(main()) == ("cached", "from thread", 1)
+
+
+def test_cache_from_config(monkeypatch):
+    monkeypatch.delenv("SLIZZAI_CACHE_URL", raising=False)
+    assert memory_cache.cache_from_config({"url": None}) is None
+    monkeypatch.setenv("SLIZZAI_CACHE_URL", "memory")
+    cache = memory_cache.cache_from_config({"namespaces": {"omni": 0}})
+    assert isinstance(cache.backend, InMemoryBackend) and cache.ttl_for("omni") == 0
+
+
+def test_cancelled_leader_does_not_cancel_coalesced_waiters():
+    async def main():
+        cache = AsyncCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        leader = asyncio.ensure_future(cache.get_or_compute("nuninex", "k", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_compute("nuninex", "k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        value = await waiter
+        return leader.cancelled(), value, await cache.get("nuninex", "k"), calls
+
+    assert asyncio.run(main()) == (True, "value", "value", [1])
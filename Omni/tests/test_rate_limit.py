@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from rate_limit import Limit, RateLimiter, RateLimitMiddleware, TokenBuckets, parse_limit
+
+
+def scope(path="/run", client="1.2.3.4", tenant=None):
+    headers = [(b"x-tenant-id", tenant.encode())] if tenant else []
+    return {"type": "http", "path": path, "headers": headers, "client": (client, 1)}
+
+
+def test_parse_limit_forms():
+    assert (parse_limit("10/minute").rate, parse_limit("10/minute").burst) == (10 / 60, 10)
+    assert parse_limit("5 per seconds").rate == 5
+    assert parse_limit({"rate": "100/second", "burst": 300}).burst == 300
+    with pytest.raises(ValueError):
+        parse_limit("3/fortnight")
+
+
+def test_token_bucket_refills_and_reports_retry_after():
+    now = [0.0]
+    buckets = TokenBuckets(clock=lambda: now[0])
+    limit = Limit(2, 1.0)
+    assert [buckets.allow("k", limit) for _ in range(3)][:2] == [0.0, 0.0]
+    assert buckets.allow("k", limit) == pytest.approx(0.5)
+    now[0] = 0.5
+    assert buckets.allow("k", limit) == 0.0
+
+
+def test_route_and_tenant_limits_are_resolved_most_specific_first():
+    limiter = RateLimiter(
+        default="100/second", routes={"/run": "10/minute"},
+        tenants={"acme": {"/run": "50/minute", "default": "1000/second"}}, exempt=["/healthz"],
+    )
+    assert limiter.resolve(scope(tenant="acme"))[1].count == 50
+    assert limiter.resolve(scope("/other", tenant="acme")) == (("acme", None), limiter.tenants["acme"]["default"])
+    # An unknown tenant id falls back to the client address
+    assert limiter.resolve(scope(tenant="made-up")) == (("1.2.3.4", "/run"), limiter.routes["/run"])
+    assert limiter.resolve(scope("/healthz"))[1] is None
+
+
+def test_middleware_answers_429_with_retry_after():
+    app = FastAPI()
+
+    @app.post("/run")
+    async def run():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, limiter=RateLimiter(routes={"/run": "2/minute"}))
+    client = TestClient(app)
+    assert [client.post("/run").status_code for _ in range(3)] == [200, 200, 429]
+    assert int(client.post("/run").headers["retry-after"]) >= 1
+
+
+def test_shared_backend_failure_falls_back_to_local_buckets():
+    class DownBackend:
+        async def allow(self, key, limit):
+            raise ConnectionError("redis down")
+
+    limiter = RateLimiter(default="1/minute", backend=DownBackend())
+    waits = [asyncio.run(limiter.check(scope())) for _ in range(2)]
+    assert waits[0] == 0.0 and waits[1] > 0
+    assert limiter.stats()["backend_errors"] == 2
+
+
+def test_full_buckets_free_a_tenth_of_max_keys_per_sweep():
+    buckets = TokenBuckets(max_keys=100, clock=lambda: 0.0)
+    limit = Limit(1, 60.0)
+    for key in range(100):
+        buckets.allow(key, limit)
+    buckets.allow("new", limit)  # nothing has refilled, so the ten oldest go
+    assert len(buckets) == 91 and 0 not in buckets._buckets and 10 in buckets._buckets
+
+
+def test_close_closes_the_shared_backend():
+    class Backend:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    backend = Backend()
+    asyncio.run(RateLimiter(default="1/minute", backend=backend).close())
+    assert backend.closed
+
+
+def test_sweep_keeps_active_buckets_when_enough_are_idle():
+    now = [0.0]
+    buckets = TokenBuckets(max_keys=100, clock=lambda: now[0])
+    fast, slow = Limit(1, 1.0), Limit(1, 3600.0)
+    for key in range(100):
+        buckets.allow(key, fast if key < 15 else slow)
+    now[0] = 2.0  # the 15 fast buckets have refilled; the slow ones are still throttled
+    buckets.allow("new", slow)
+    assert len(buckets) == 86 and all(key in buckets._buckets for key in range(15, 100))
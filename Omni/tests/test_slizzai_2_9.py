@@ -0,0 +1,287 @@
+import importlib.util
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+
+# The file name is not importable; register it under a module name so process pools can pickle its functions
+spec = importlib.util.spec_from_file_location(
+    "slizzai_2_9", os.path.join(os.path.dirname(__file__), "..", "SlizzAi-2.0", "SlizzAi-2.9.py"))
+app = importlib.util.module_from_spec(spec)
+sys.modules["slizzai_2_9"] = app
+spec.loader.exec_module(app)
+
+
+def noise(w, h, mode="RGB", seed=0):
+    channels = {"RGB": 3, "RGBA": 4, "L": None}[mode]
+    shape = (h, w) if channels is None else (h, w, channels)
+    return Image.fromarray(np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8), mode)
+
+
+def gradient(w, h):
+    y, x = np.mgrid[0:h, 0:w]
+    return Image.fromarray(np.dstack([x * 255 // w, y * 255 // h, (x + y) * 255 // (w + h)]).astype(np.uint8))
+
+
+def pixels(img):
+    return np.asarray(img).astype(int)
+
+
+IDENTITY = {"brightness": 1.0, "blur": 0, "angle": 0, "zoom": 1.0, "shadow": 0}
+
+
+def test_adjustment_pipeline_only_reruns_changed_stage_and_downstream(monkeypatch):
+    calls = []
+
+    def counting(name, stage):
+        def run(img, value, scale):
+            calls.append(name)
+            return stage(img, value, scale)
+        return run
+
+    monkeypatch.setattr(app, "ADJUSTMENT_STAGES", [
+        (name, identity, counting(name, stage)) for name, identity, stage in app.ADJUSTMENT_STAGES])
+    pipeline = app.AdjustmentPipeline()
+    source = noise(64, 48)
+    pipeline.set_source(source)
+
+    assert pipeline.render(IDENTITY) is source
+    first = pipeline.render(dict(IDENTITY, brightness=1.5, angle=90))
+    assert calls == ["brightness", "angle"]
+    calls.clear()
+    assert pipeline.render(dict(IDENTITY, brightness=1.5, angle=90)) is first
+    assert calls == []
+    pipeline.render(dict(IDENTITY, brightness=1.5, angle=90, zoom=0.5))
+    assert calls == ["zoom"]
+
+
+def test_adjustment_pipeline_proxy_matches_full_render_downscaled():
+    pipeline = app.AdjustmentPipeline()
+    pipeline.set_source(gradient(400, 200))
+    params = dict(IDENTITY, brightness=1.3, blur=2)
+    full = pipeline.render(params)
+    preview = pipeline.render(params, box=(100, 100))
+    assert preview.size == (100, 50)
+    expected = app.fit_within(full, (100, 100))
+    assert np.abs(pixels(preview) - pixels(expected)).mean() < 2
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "RGBA"])
+@pytest.mark.parametrize("pil_filter", [ImageFilter.SHARPEN, ImageFilter.EMBOSS, ImageFilter.FIND_EDGES])
+def test_kernel_op_matches_pil_including_borders(mode, pil_filter):
+    img = noise(37, 29, mode)
+    fast = app.KernelOp(pil_filter)(img)
+    expected = img.filter(pil_filter) if mode != "RGBA" else img.convert("RGB").filter(pil_filter)
+    assert fast.mode == mode
+    assert np.abs(pixels(fast.convert(expected.mode)) - pixels(expected)).max() <= 1
+    # The border ring is copied from the input, exactly as PIL does
+    assert (pixels(fast)[0] == pixels(img)[0]).all() and (pixels(fast)[:, -1] == pixels(img)[:, -1]).all()
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L"])
+def test_fused_chain_matches_pil_step_by_step(mode):
+    img = noise(40, 30, mode)
+    ops = [app.LutOp(app.brightness_table(1.2)), app.ContrastOp(1.4), app.LutOp(app.invert_table()),
+           app.KernelOp(ImageFilter.SHARPEN)]
+    expected = ImageOps.invert(ImageEnhance.Contrast(ImageEnhance.Brightness(img).enhance(1.2)).enhance(1.4))
+    expected = expected.filter(ImageFilter.SHARPEN)
+    fast = app.run_chain(img, ops)
+    assert fast.mode == mode
+    assert np.abs(pixels(fast) - pixels(expected)).max() <= 1
+
+
+def test_luma_ops_match_pil_modes():
+    img = noise(20, 10, "RGBA")
+    threshold = app.LumaOp(app.threshold_table(128), gray=True)(img)
+    assert threshold.mode == "L"
+    # cv2 and PIL round luma differently by at most one level, which can flip a pixel sitting on the threshold
+    assert (pixels(threshold) != pixels(img.convert("L").point(lambda p: 255 if p > 128 else 0))).mean() < 0.02
+    sepia = app.LumaOp(app.colorize_table("#704214", "#C0C080"))(img)
+    assert sepia.mode == "RGB"
+    assert np.abs(pixels(sepia) - pixels(ImageOps.colorize(ImageOps.grayscale(img), "#704214", "#C0C080"))).max() <= 1
+
+
+def test_parse_chain_resolves_names_and_rejects_unknown_ones():
+    assert app.parse_chain("Enhance/Sharpen > Filters/Invert") == [
+        app.OPERATIONS["Enhance/Sharpen"], app.OPERATIONS["Filters/Invert"]]
+    with pytest.raises(ValueError, match="Unknown operation 'Enhance/Nope'"):
+        app.parse_chain("Enhance/Sharpen > Enhance/Nope")
+
+
+def test_batch_outputs_mirror_input_dirs_and_report_collisions(tmp_path):
+    paths = [str(tmp_path / "a" / "x.png"), str(tmp_path / "b" / "x.png"), str(tmp_path / "b" / "x.jpg")]
+    outputs, collisions = app.batch_outputs(paths, "out", "png")
+    assert outputs == [(paths[0], os.path.join("out", "a", "x.png")), (paths[1], os.path.join("out", "b", "x.png"))]
+    assert collisions == [(paths[2], os.path.join("out", "b", "x.png"))]
+
+
+def test_run_batch_writes_nested_outputs(tmp_path):
+    for sub in ("a", "b"):
+        os.makedirs(tmp_path / "in" / sub)
+        noise(16, 16).save(tmp_path / "in" / sub / "x.png")
+    noise(16, 16).save(tmp_path / "in" / "b" / "x.bmp")
+    out = tmp_path / "out"
+    processed, failed = app.run_batch(str(tmp_path / "in" / "**" / "*"), "Filters/Invert", str(out), workers=1, fmt="png")
+    assert (processed, failed) == (2, 1)
+    assert sorted(os.listdir(out)) == ["a", "b"]
+    expected = ImageOps.invert(Image.open(tmp_path / "in" / "a" / "x.png").convert("RGB"))
+    assert (pixels(Image.open(out / "a" / "x.png")) == pixels(expected)).all()
+
+
+class FakeSegmentation(app.SegmentationService):
+    def __init__(self, fail=False, **config):
+        super().__init__(**config)
+        self.fail = fail
+        self.batch_sizes = []
+
+    def _load(self):
+        if self.fail:
+            raise OSError("no weights")
+
+        def run(batch):
+            self.batch_sizes.append(len(batch))
+            logits = torch.zeros(len(batch), 2, *batch.shape[2:])
+            logits[:, 1] = 1  # everything is foreground
+            return logits
+        return run
+
+
+def test_segmentation_service_batches_concurrent_requests():
+    service = FakeSegmentation(batch_size=4, max_wait=1.0).start()
+    assert service.ready.wait(5)
+    img = noise(32, 24)
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(service.segment, [img] * 4))
+    # One warm-up pass, then all four requests in a single forward pass
+    assert service.batch_sizes == [1, 4]
+    assert all(pixels(result).tolist() == pixels(img).tolist() for result in results)
+
+
+def test_segmentation_service_reports_load_failures_to_callers():
+    service = FakeSegmentation(fail=True)
+    with pytest.raises(RuntimeError, match="failed to load: no weights"):
+        service.segment(noise(8, 8), timeout=5)
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_tiled_upscale_matches_untiled_resize(monkeypatch, memmap):
+    if memmap:
+        monkeypatch.setattr(app, "MEMMAP_THRESHOLD", 0)
+    src = np.asarray(gradient(150, 110))
+    out = app.tiled_map(src, app._upscale_tile, scale=2, tile=48, overlap=8, workers=2)
+    assert isinstance(out, np.memmap) == memmap
+    expected = app._upscale_tile(src, (0, 0))
+    assert out.shape == expected.shape
+    assert np.abs(out.astype(int) - expected).max() <= 2
+
+
+def test_tiled_map_crops_windows_from_a_pil_image():
+    img = gradient(150, 110).convert("P")
+    out = app.tiled_map(img, app._upscale_tile, scale=2, tile=48, overlap=8, workers=2)
+    expected = app.tiled_map(np.asarray(img.convert("RGB")), app._upscale_tile, scale=2, tile=48, overlap=8)
+    assert (out == expected).all()
+
+
+def test_tiled_inpaint_only_touches_the_hole_and_accepts_rgba(monkeypatch):
+    monkeypatch.setattr(app, "TILE_THRESHOLD", 0)
+    img = gradient(120, 80)
+    rgba = img.copy()
+    rgba.putalpha(200)
+    tiled = app.ai_inpaint(rgba)
+    assert tiled.mode == "RGB" and tiled.size == img.size
+    x0, y0, x1, y1 = app._inpaint_rect(*img.size)
+    hole = np.zeros((img.height, img.width), bool)
+    hole[y0:y1 + 1, x0:x1 + 1] = True
+    assert (pixels(tiled)[~hole] == pixels(img)[~hole]).all()
+    monkeypatch.setattr(app, "TILE_THRESHOLD", 10 ** 9)
+    untiled = app.ai_inpaint(img)
+    # Both fill a smooth gradient with something close to it
+    assert np.abs(pixels(tiled)[hole] - pixels(untiled)[hole]).mean() < 8
+
+
+class FakeRoot:
+    """Stands in for Tk: after() callbacks run when the test pumps them."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def pump(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def test_effect_executor_cancels_superseded_effects():
+    root = FakeRoot()
+    executor = app.EffectExecutor(root)
+    started, done, seen = threading.Event(), [], []
+
+    def slow(img):
+        started.set()
+        while True:
+            app.check_cancelled()
+            time.sleep(0.005)
+
+    def never(img):
+        seen.append("queued")
+
+    executor.submit(slow, lambda: "first", lambda result, error: done.append(("slow", result, error)))
+    assert started.wait(5)
+    executor.submit(never, lambda: "second", lambda result, error: done.append(("never", result, error)))
+    executor.submit(str.upper, lambda: "latest", lambda result, error: done.append(("upper", result, error)))
+    deadline = time.monotonic() + 5
+    while not done and time.monotonic() < deadline:
+        root.pump()
+        time.sleep(0.01)
+    executor.shutdown()
+    # The running effect was stopped, the queued one never ran, and only the newest result is delivered
+    assert done == [("upper", "LATEST", None)]
+    assert seen == []
+
+
+def test_edit_history_undo_redo_and_tile_sharing():
+    history = app.EditHistory(tile=16)
+    base = noise(40, 40)
+    edited = base.copy()
+    edited.paste((255, 0, 0), (0, 0, 8, 8))  # touches one of the nine tiles
+    history.push(history.encode(base))
+    size_one = history.nbytes
+    history.push(history.encode(edited))
+    assert history.nbytes == size_one + 16 * 16 * 3
+    history.push(history.encode(edited))  # a no-op effect costs nothing
+    assert history.nbytes == size_one + 16 * 16 * 3
+
+    assert pixels(history.undo()).tolist() == pixels(edited).tolist()
+    assert pixels(history.undo()).tolist() == pixels(base).tolist()
+    assert history.undo() is None and history.can_redo()
+    assert pixels(history.redo()).tolist() == pixels(edited).tolist()
+    # Pushing after an undo drops the redo states and their tiles
+    history.push(history.encode(noise(40, 40, "L", seed=1)))
+    assert not history.can_redo() and len(history.states) == 3
+    assert history.undo().mode == "RGB"
+
+
+def test_edit_history_evicts_least_recently_visited_but_never_current():
+    one = 20 * 20 * 3
+    history = app.EditHistory(budget_bytes=2 * one, tile=20)
+    images = [noise(20, 20, seed=n) for n in range(4)]
+    history.push(history.encode(images[0]))
+    history.push(history.encode(images[1]))
+    history.undo()
+    history.redo()  # images[0] is now the least recently visited
+    history.push(history.encode(images[2]))
+    assert history.nbytes <= 2 * one and len(history.states) == 2
+    assert pixels(history.undo()).tolist() == pixels(images[1]).tolist()
+
+    tiny = app.EditHistory(budget_bytes=one // 2, tile=20)
+    tiny.push(tiny.encode(images[3]))
+    assert len(tiny.states) == 1 and tiny.nbytes == one
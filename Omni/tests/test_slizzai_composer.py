@@ -0,0 +1,81 @@
+import importlib.util
+import os
+import time
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "slizzai_composer", os.path.join(os.path.dirname(__file__), "..", "slizzai-composer.py"))
+slizzai_composer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(slizzai_composer)
+
+
+def sleeper(seconds, value):
+    def run(data, upstream):
+        time.sleep(seconds)
+        return value
+    return run
+
+
+class Feedback:
+    def __init__(self):
+        self.seen = []
+
+    def evaluate(self, feedback_input):
+        self.seen.append(feedback_input)
+        return "ok"
+
+
+@pytest.fixture
+def composer():
+    composer = slizzai_composer.SlizzAiComposer({"timeouts": {"omni": 0.5}})
+    composer.stages.clear()
+    yield composer
+    composer.close()
+
+
+def test_independent_engines_run_concurrently(composer):
+    composer.feedback = Feedback()
+    composer.add_stage("nuninex", sleeper(0.2, "resolved"))
+    composer.add_stage("omni", sleeper(0.2, "invoked"))
+    start = time.perf_counter()
+    result = composer.compose({})
+    assert time.perf_counter() - start < 0.35
+    assert result["nuninex_result"] == "resolved" and result["omni_response"] == "invoked"
+    assert result["feedback"] == "ok" and result["errors"] == {}
+    assert composer.feedback.seen == [{"nuninex": "resolved", "omni": "invoked"}]
+
+
+def test_timeout_returns_partial_arc_and_skips_dependents(composer):
+    composer.add_stage("nuninex", sleeper(0, "resolved"))
+    composer.add_stage("omni", sleeper(2, "late"))
+    composer.add_stage("report", lambda data, upstream: upstream, after=("omni",))
+    result = composer.compose({})
+    assert result["nuninex_result"] == "resolved" and result["omni_response"] is None
+    assert result["errors"]["omni"] == "timeout"
+    assert result["errors"]["report"].startswith("skipped")
+    assert result["status"] == "SlizzAi-Composer completed partial arc"
+
+
+def test_deferred_feedback_is_off_the_response_path(composer):
+    composer.feedback = Feedback()
+    composer.feedback.evaluate = lambda feedback_input: time.sleep(0.3)
+    composer.defer_feedback = True
+    composer.add_stage("nuninex", sleeper(0, "resolved"))
+    start = time.perf_counter()
+    assert composer.compose({})["feedback"] is None
+    assert time.perf_counter() - start < 0.2
+
+
+def test_hung_engine_is_rejected_fast_without_starving_the_others():
+    with slizzai_composer.SlizzAiComposer({"timeouts": {"omni": 0.1}, "concurrency": {"omni": 1}}) as composer:
+        composer.stages.clear()
+        composer.add_stage("nuninex", sleeper(0, "resolved"))
+        composer.add_stage("omni", sleeper(1, "late"))
+        assert composer.compose({})["errors"] == {"omni": "timeout"}
+        start = time.perf_counter()
+        result = composer.compose({})
+        assert time.perf_counter() - start < 0.05
+        assert result["nuninex_result"] == "resolved"
+        assert result["errors"]["omni"].startswith("rejected")
+        assert composer.stats()["omni"] == {"size": 1, "rejected": 1}
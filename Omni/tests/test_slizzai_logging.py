@@ -0,0 +1,69 @@
+import json
+import logging
+import os
+
+import pytest
+
+import slizzai_logging
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    path = tmp_path / "events.log"
+    monkeypatch.setenv("SLIZZAI_LOG_PATH", str(path))
+    yield path
+    slizzai_logging.shutdown()
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_events_are_written_as_json_lines_by_the_listener(log_path):
+    slizzai_logging.configure(level=logging.INFO)
+    slizzai_logging.log_event("component.ready", component="nuninex", init_s=0.5)
+    slizzai_logging.log_event({"legacy": "payload"})
+    slizzai_logging.shutdown()
+    first, second = read_lines(log_path)
+    assert first["event"] == first["msg"] == "component.ready"
+    assert (first["level"], first["component"], first["init_s"]) == ("INFO", "nuninex", 0.5)
+    assert second["msg"] == "{'legacy': 'payload'}"
+
+
+def test_fields_named_like_record_attributes_are_prefixed(log_path):
+    slizzai_logging.configure(level=logging.INFO)
+    slizzai_logging.log_event("job.done", msg="hi", levelname="x", name="job", logger="other")
+    slizzai_logging.shutdown()
+    (line,) = read_lines(log_path)
+    assert (line["msg"], line["level"], line["logger"], line["event"]) == ("job.done", "INFO", "slizzai", "job.done")
+    assert (line["field_msg"], line["field_levelname"], line["field_name"], line["field_logger"]) == (
+        "hi", "x", "job", "other")
+
+
+def test_disabled_levels_are_not_formatted_and_sampling_keeps_one_in_n(log_path):
+    formatted = []
+
+    class Expensive:
+        def __str__(self):
+            formatted.append(1)
+            return "expensive"
+
+    slizzai_logging.configure(level=logging.WARNING, sample_every={"cache.hit": 10})
+    slizzai_logging.log_event(Expensive(), logging.DEBUG)
+    for _ in range(25):
+        slizzai_logging.log_event("cache.hit", logging.WARNING)
+    stats = slizzai_logging.stats()
+    slizzai_logging.shutdown()
+    assert formatted == []
+    assert stats["sampled_out"] == 22
+    assert [line["sample_every"] for line in read_lines(log_path)] == [10, 10, 10]
+
+
+def test_size_rollover_keeps_numbered_backups(log_path):
+    slizzai_logging.configure(max_bytes=500, backup_count=2)
+    for n in range(40):
+        slizzai_logging.log_event("tick", n=n)
+    slizzai_logging.shutdown()
+    assert os.path.exists(f"{log_path}.1") and os.path.exists(f"{log_path}.2")
+    assert not os.path.exists(f"{log_path}.3")
+    assert read_lines(log_path)[-1]["n"] == 39
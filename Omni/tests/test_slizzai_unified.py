@@ -0,0 +1,36 @@
+from slizzai_unified import UnifiedAI
+
+
+class CountingBatchEngine:
+    def __init__(self):
+        self.batches = []
+
+    def run(self, input_data):
+        if "bad" in input_data:
+            raise RuntimeError("bad input")
+        return {"echo": input_data}
+
+    def run_batch(self, inputs):
+        self.batches.append(list(inputs))
+        return [self.run(i) for i in inputs]
+
+
+class FailingEngine:
+    def run(self, input_data):
+        raise RuntimeError("engine down")
+
+
+def test_run_batch_groups_by_engine_and_keeps_order():
+    ai = UnifiedAI()
+    nlp = ai.engines["nlp"] = CountingBatchEngine()
+    ai.engines["logic"] = FailingEngine()
+    inputs = ["hello", "speak: hi", "logic: a", b"\x89PNG", "world", "bad one"]
+    results = ai.run_batch(inputs)
+    assert results[0] == {"echo": "hello"}
+    assert results[1] == {"result": "SpeechEngine processed input"}
+    assert results[2] == {"error": "engine down"}
+    assert results[3] == {"result": "VisionEngine processed input"}
+    assert results[4] == {"echo": "world"}
+    assert results[5] == {"error": "bad input"}
+    # One native call for the whole nlp group, then per-item isolation after it failed
+    assert nlp.batches == [["hello", "world", "bad one"]]
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from SlizzAIM_Async import AsyncCommandHub, SyncOperatorAdapter, create_asgi_app
+
+
+class AsyncStage:
+    status = "STANDBY"
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    async def _step(self, value):
+        await asyncio.sleep(0.05)
+        return value + [self.tag]
+
+    process = transform = forecast = enhance = execute = _step
+
+
+class SyncStage:
+    status = "STANDBY"
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.threads = set()
+
+    def _step(self, value):
+        self.threads.add(threading.get_ident())
+        return value + [self.tag]
+
+    process = transform = forecast = enhance = execute = _step
+
+
+def make_operators(processor, predictor):
+    return {
+        "analyzer": AsyncStage("a"),
+        "processor": processor,
+        "predictor": predictor,
+        "optimizer": AsyncStage("o"),
+        "executor": AsyncStage("e"),
+    }
+
+
+def test_async_tasks_interleave_on_one_loop():
+    hub = AsyncCommandHub(make_operators(AsyncStage("p"), AsyncStage("f")))
+    start = time.monotonic()
+    results = asyncio.run(hub.handle_many([[n] for n in range(50)]))
+    # 50 tasks x 5 stages x 50ms would take 12.5s if run one after another
+    assert time.monotonic() - start < 2
+    assert results[7] == [7, "a", "p", "f", "o", "e"]
+    hub.close()
+
+
+def test_adjacent_legacy_stages_share_one_thread_hop():
+    processor, predictor = SyncStage("p"), SyncStage("f")
+    hub = AsyncCommandHub(make_operators(processor, predictor), offload_workers=1)
+    assert isinstance(hub.operators["processor"], SyncOperatorAdapter)
+    assert asyncio.run(hub.handle([])) == ["a", "p", "f", "o", "e"]
+    assert len(hub._segments) == 4
+    assert processor.threads == predictor.threads != {threading.get_ident()}
+    hub.close()
+
+
+def test_asgi_execute_and_monitor():
+    hub = AsyncCommandHub(make_operators(SyncStage("p"), AsyncStage("f")))
+    with TestClient(create_asgi_app(hub, handle=lambda task: hub.handle(task["data"]))) as client:
+        assert client.post("/execute", json={"task": "scan", "data": []}).json() == {"result": ["a", "p", "f", "o", "e"]}
+        assert client.get("/monitor").json()["AI_Operators_Status"]["processor"] == "STANDBY"
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+from SlizzAIM_Cache import ResultCache, task_key
+
+
+def test_key_ignores_dict_order():
+    assert task_key({"task": "scan", "data": [1]}) == task_key({"data": [1], "task": "scan"})
+
+
+def test_ttl_lru_and_uncached_types():
+    cache = ResultCache(max_entries=2, default_ttl=60, ttls={"forecast": 0.05, "deploy": 0})
+    calls = []
+
+    def compute(task):
+        calls.append(task["task"])
+        return task["task"].upper()
+
+    for name in ["scan", "scan", "forecast", "deploy", "deploy"]:
+        assert cache.get_or_compute({"task": name}, compute) == name.upper()
+    assert calls == ["scan", "forecast", "deploy", "deploy"]
+    time.sleep(0.06)
+    cache.get_or_compute({"task": "forecast"}, compute)
+    cache.get_or_compute({"task": "extra"}, compute)
+    stats = cache.stats()
+    assert (stats["hits"], stats["expirations"], stats["evictions"], stats["entries"]) == (1, 1, 1, 2)
+
+
+def test_concurrent_identical_requests_compute_once():
+    cache = ResultCache()
+    calls = []
+
+    def compute(task):
+        calls.append(task)
+        time.sleep(0.1)
+        return "done"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute({"task": "scan"}, compute))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["done"] * 8
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 7
+
+
+def test_submitted_tasks_share_cached_and_inflight_results():
+    cache = ResultCache(ttls={"deploy": 0})
+    submitted = []
+
+    def submit(task):
+        submitted.append(task["task"])
+        future = Future()
+        threading.Timer(0.05, future.set_result, [task["task"].upper()]).start()
+        return future
+
+    tasks = [{"task": "scan"}, {"task": "scan"}, {"task": "deploy"}, {"task": "deploy"}]
+    futures = [cache.get_or_submit(task, submit) for task in tasks]
+    assert [future.result() for future in futures] == ["SCAN", "SCAN", "DEPLOY", "DEPLOY"]
+    assert cache.get_or_submit({"task": "scan"}, submit).result() == "SCAN"
+    assert submitted == ["scan", "deploy", "deploy"]
+    assert (cache.stats()["coalesced"], cache.stats()["hits"]) == (1, 1)
+
+
+def _cancel_one(index):
+    async def main():
+        cache = ResultCache()
+        calls = []
+
+        async def compute(task):
+            calls.append(task)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        callers = []
+        for _ in range(3):
+            callers.append(asyncio.ensure_future(cache.aget_or_compute({"task": "scan"}, compute)))
+            await asyncio.sleep(0)
+        callers[index].cancel()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        return results, calls, cache.get_or_compute({"task": "scan"}, None)
+
+    return asyncio.run(main())
+
+
+def test_cancelled_follower_does_not_cancel_the_fill():
+    results, calls, cached = _cancel_one(1)
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert (results[0], results[2], len(calls), cached) == ("done", "done", 1, "done")
+
+
+def test_cancelled_leader_does_not_cancel_the_followers():
+    results, calls, cached = _cancel_one(0)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert (results[1:], len(calls), cached) == (["done", "done"], 1, "done")
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from SlizzAIM_Pipeline import STAGES, StagedPipeline
+
+
+class SleepyOperator:
+    def __init__(self, name, delay=0.02):
+        self.name = name
+        self.delay = delay
+
+    def __getattr__(self, method):
+        def run(value):
+            time.sleep(self.delay)
+            if value == "boom" and self.name == "predictor":
+                raise RuntimeError("forecast failed")
+            return value if isinstance(value, str) else value + 1
+        return run
+
+
+def make_pipeline(**kwargs):
+    return StagedPipeline({name: SleepyOperator(name) for name, _ in STAGES}, **kwargs)
+
+
+def test_results_keep_input_order():
+    pipeline = make_pipeline()
+    assert pipeline.map(list(range(10))) == [n + 5 for n in range(10)]
+    pipeline.shutdown()
+
+
+def test_stages_overlap():
+    pipeline = make_pipeline()
+    start = time.monotonic()
+    pipeline.map(list(range(20)))
+    # 20 tasks x 5 stages x 20ms is 2s in series; pipelined it is about (20 + 4) x 20ms
+    assert time.monotonic() - start < 1.2
+    stats = pipeline.stats()
+    assert [stats[name]["processed"] for name, _ in STAGES] == [20] * 5
+    pipeline.shutdown()
+
+
+def test_stage_error_fails_only_that_task():
+    pipeline = make_pipeline()
+    good, bad = pipeline.submit(1), pipeline.submit("boom")
+    assert good.result() == 6
+    with pytest.raises(RuntimeError, match="forecast failed"):
+        bad.result()
+    assert pipeline.stats()["predictor"]["failed"] == 1
+    pipeline.shutdown()
@@ -0,0 +1,114 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from SlizzAIM_Pool import LazyOperatorPool
+from SlizzAIM_Supervisor import OperatorFailure, OperatorSupervisor
+
+
+class ModelOperator:
+    built = 0
+
+    def __init__(self):
+        ModelOperator.built += 1
+        self.model = None
+        self.loads = 0
+
+    def unload(self):
+        self.model = None
+
+    def process(self, value):
+        if self.model is None:
+            self.model = "weights"
+            self.loads += 1
+        time.sleep(0.05)
+        return value
+
+
+def test_builds_lazily_and_caps_instances():
+    ModelOperator.built = 0
+    pool = LazyOperatorPool(ModelOperator, size=2, idle_timeout=None)
+    assert ModelOperator.built == 0 and pool.status == "STANDBY"
+    threads = [threading.Thread(target=pool.process, args=(n,)) for n in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert ModelOperator.built == 2
+    assert pool.stats()["loaded"] == 2
+
+
+def test_idle_instances_unload_and_reload_on_demand():
+    pool = LazyOperatorPool(ModelOperator, size=1, idle_timeout=0.05)
+    pool.process("a")
+    assert pool.status == "WARM"
+    time.sleep(0.15)
+    assert pool.status == "STANDBY"
+    assert pool.stats()["unloads"] == 1
+    pool.process("b")
+    instance = pool._idle[-1][0]
+    assert instance.loads == 2 and pool.stats()["builds"] == 1
+    pool.maintain_standby()
+    assert instance.model is None
+
+
+class BrittleOperator(ModelOperator):
+    broken = set()
+
+    def __init__(self):
+        super().__init__()
+        self.serial = ModelOperator.built
+
+    def load(self):
+        self.model = "weights"
+
+    def unload(self):
+        if self.serial in BrittleOperator.broken:
+            raise RuntimeError("unload failed")
+        super().unload()
+
+    def process(self, value):
+        if value == "crash" and self.serial in BrittleOperator.broken:
+            raise OperatorFailure(f"instance {self.serial} crashed")
+        if value is None:
+            raise ValueError("no task")
+        return (self.serial, super().process(value))
+
+
+def test_failed_instance_is_evicted_alone_and_the_call_retried():
+    ModelOperator.built = 0
+    pool = LazyOperatorPool(BrittleOperator, size=2, idle_timeout=None)
+    with ThreadPoolExecutor(2) as executor:
+        list(executor.map(pool.process, ["a", "b"]))
+    next_up, other = pool._idle[-1][0].serial, pool._idle[0][0].serial
+    BrittleOperator.broken = {next_up}
+    assert pool.process("crash")[0] == other
+    stats = pool.stats()
+    assert (stats["evictions"], stats["created"], stats["loaded"]) == (1, 1, 1)
+    with pytest.raises(ValueError):
+        pool.process(None)
+    assert pool.stats()["evictions"] == 1  # bad input keeps the instance
+
+
+def test_warm_loads_without_arming_the_idle_timer_and_unload_errors_drop_the_instance():
+    ModelOperator.built = 0
+    BrittleOperator.broken = {1}
+    pool = LazyOperatorPool(BrittleOperator, size=2, idle_timeout=0.01)
+    pool.warm()
+    time.sleep(0.05)
+    assert pool.status == "WARM" and pool._timer is None
+    pool.maintain_standby()
+    stats = pool.stats()
+    assert (stats["unload_errors"], stats["created"], stats["idle"]) == (1, 0, 0)
+
+
+def test_supervisor_keeps_a_warm_standby_pool():
+    ModelOperator.built = 0
+    supervisor = OperatorSupervisor({"analyzer": lambda: LazyOperatorPool(BrittleOperator, idle_timeout=None)})
+    slot = supervisor._slots["analyzer"]
+    assert slot.active.stats()["loaded"] == 0 and slot.standby.stats()["loaded"] == 1
+    supervisor.operators["analyzer"].maintain_standby()
+    assert slot.standby.status == "WARM"
+    supervisor.shutdown()
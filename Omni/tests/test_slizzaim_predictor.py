@@ -0,0 +1,25 @@
+from SlizzAIM_Predictor import NextCommandPredictor
+
+
+def test_follows_recent_sequence_over_raw_frequency():
+    model = NextCommandPredictor(order=1)
+    model.seed({"status": 50})
+    for _ in range(3):
+        for command in ["scan", "analyze", "deploy"]:
+            model.observe(command)
+    model.observe("scan")
+    assert model.predict() == "analyze"
+    assert model.suggest(3)[:2] == ["analyze", "status"]
+
+
+def test_decay_favours_recent_habits_and_refit_prunes():
+    model = NextCommandPredictor(order=0, decay=0.9, min_weight=0.5)
+    for _ in range(20):
+        model.observe("old")
+    for _ in range(10):
+        model.observe("new")
+    assert model.predict() == "new"
+    for _ in range(100):
+        model.observe("new")
+    model.refit()
+    assert model.suggest(5) == ["new"]
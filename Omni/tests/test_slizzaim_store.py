@@ -0,0 +1,44 @@
+import json
+
+from SlizzAIM_Store import CommandStore
+
+
+def test_counts_survive_reopen(tmp_path):
+    path = str(tmp_path / "history.json")
+    store = CommandStore(path)
+    for command in ["scan", "scan", "deploy"]:
+        store.increment(command)
+    store.flush()
+    assert CommandStore(path).counts == {"scan": 2, "deploy": 1}
+    store.close()
+
+
+def test_compaction_folds_log_into_snapshot(tmp_path):
+    path = str(tmp_path / "history.json")
+    store = CommandStore(path, compact_every=10)
+    for _ in range(25):
+        store.increment("scan")
+    store.close()
+    with open(path) as file:
+        assert json.load(file)["counts"] == {"scan": 25}
+    assert CommandStore(path).counts == {"scan": 25}
+
+
+def test_legacy_snapshot_and_torn_log_line(tmp_path):
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"scan": 3}))
+    (tmp_path / "history.json.log").write_text('[1, "deploy"]\n[2, "dep')
+    assert CommandStore(str(path)).counts == {"scan": 3, "deploy": 1}
+
+
+def test_torn_tail_is_cut_before_appending(tmp_path):
+    path = tmp_path / "history.json"
+    log = tmp_path / "history.json.log"
+    log.write_text('[1, "deploy"]\n[2, "dep')
+    store = CommandStore(str(path))
+    store.increment("scan")
+    store.flush()
+    assert log.read_text().splitlines() == ['[1, "deploy"]', '[2, "scan"]']
+    store.close()
+    store.flush()  # returns at once after close
+    assert CommandStore(str(path)).counts == {"deploy": 1, "scan": 1}
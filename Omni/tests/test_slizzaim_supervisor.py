@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from SlizzAIM_Supervisor import ObservableStatus, OperatorFailure, OperatorSupervisor, OperatorUnavailable
+
+
+class FlakyOperator(ObservableStatus):
+    built = 0
+    broken = set()
+
+    def __init__(self):
+        FlakyOperator.built += 1
+        self.serial = FlakyOperator.built
+
+    def process(self, value):
+        if self.serial in FlakyOperator.broken:
+            raise OperatorFailure(f"instance {self.serial} crashed")
+        if value is None:
+            raise ValueError("no task")
+        return (self.serial, value)
+
+
+@pytest.fixture(autouse=True)
+def reset_operator():
+    FlakyOperator.built = 0
+    FlakyOperator.broken = set()
+
+
+def test_failure_reroutes_to_standby_and_rebuilds_it():
+    supervisor = OperatorSupervisor({"analyzer": FlakyOperator})
+    events = []
+    supervisor.subscribe(lambda name, old, new, error: events.append(new))
+    FlakyOperator.broken = {1}
+    assert supervisor.operators["analyzer"].process("task") == (2, "task")
+    time.sleep(0.05)
+    assert supervisor.health()["analyzer"]["standby_ready"]
+    assert events[:2] == ["FAILED", "READY"]
+    supervisor.shutdown()
+
+
+def test_published_failed_status_fails_over_without_a_call():
+    supervisor = OperatorSupervisor({"analyzer": FlakyOperator})
+    supervisor._slots["analyzer"].active.status = "FAILED"
+    assert supervisor.operators["analyzer"].process("task")[0] == 2
+    supervisor.shutdown()
+
+
+def test_repeated_failures_open_the_circuit():
+    supervisor = OperatorSupervisor({"analyzer": FlakyOperator}, max_failures=3, base_backoff=0.01, cooldown=0.1)
+    FlakyOperator.broken = set(range(1, 100))
+    analyzer = supervisor.operators["analyzer"]
+    with pytest.raises(RuntimeError):
+        analyzer.process("task")
+    time.sleep(0.05)
+    with pytest.raises((RuntimeError, OperatorUnavailable)):
+        analyzer.process("task")
+    assert analyzer.status == "CIRCUIT_OPEN"
+    with pytest.raises(OperatorUnavailable):
+        analyzer.process("task")
+    FlakyOperator.broken = set()
+    time.sleep(0.2)
+    assert supervisor.health()["analyzer"]["circuit"] == "HALF_OPEN"
+    analyzer.process("task")
+    assert supervisor.health()["analyzer"]["circuit"] == "CLOSED"
+    supervisor.shutdown()
+
+
+def test_bad_input_is_not_retried_or_counted():
+    supervisor = OperatorSupervisor({"analyzer": FlakyOperator}, max_failures=1)
+    events = []
+    supervisor.subscribe(lambda name, old, new, error: events.append(new))
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            supervisor.operators["analyzer"].process(None)
+    assert events == []
+    assert supervisor.health()["analyzer"]["circuit"] == "CLOSED"
+    assert supervisor.operators["analyzer"].process("task")[0] == 1
+    supervisor.shutdown()
@@ -0,0 +1,35 @@
+import time
+
+from SlizzAIM_Telemetry import TelemetryCollector, percentile
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile(list(range(101)), 95) == 95
+
+
+def test_samples_real_counters_into_ring_buffer():
+    collector = TelemetryCollector(history=3)
+    first = collector.sample()
+    assert first["cpu_percent"] is None and first["rss_bytes"] > 0 and first["open_fds"] > 0
+    time.sleep(0.02)
+    for _ in range(3):
+        second = collector.sample()
+    assert 0 <= second["cpu_percent"] <= 100
+    assert 0 < second["memory_percent"] < 100
+    assert len(collector.samples) == 3
+
+
+def test_latency_window_and_adaptive_interval():
+    collector = TelemetryCollector(interval=4.0, min_interval=1.0, latency_target_ms=10)
+    for ms in [1, 2, 3, 50]:
+        collector.record_latency(ms)
+    assert collector.latency_percentiles()["p50"] == 2.5
+    collector.sample()
+    collector.sample()
+    assert collector.interval == 1.0
+    collector.latencies.clear()
+    collector.hot_percent = 101
+    collector.sample()
+    assert collector.interval == 2.0
@@ -0,0 +1,27 @@
+import pytest
+
+import task_classifier
+from slizzai_unified import UnifiedAI
+from task_router import TaskRouter
+
+
+def test_classifier_and_unified_agree():
+    inputs = ["speak: hi", "generate: poem", "retrieve: doc", "logic: a>b", "hello", "say generate: x", b"\x00", 42]
+    expected = ["speech", "generation", "retrieval", "logic", "nlp", "nlp", "vision", "nlp"]
+    ai = UnifiedAI()
+    assert [task_classifier.classify(i) for i in inputs] == expected
+    assert [ai.detect_task(i) for i in inputs] == expected
+    assert task_classifier.classify_batch(inputs) == expected
+
+
+def test_plugin_rules_longest_prefix_then_contains():
+    router = TaskRouter.from_config({"rules": [
+        {"prefix": "generate:image", "task": "vision"},
+        {"contains": "translate:", "task": "translation"},
+    ]})
+    inputs = ["generate:image cat", "generate: poem", "please translate: hola", "plain"]
+    assert router.classify_batch(inputs) == ["vision", "generation", "translation", "nlp"]
+    router.add_rule("speech", prefix="say:")
+    assert router.classify("say: hi") == "speech"
+    with pytest.raises(ValueError):
+        router.add_rule("speech")